@@ -1,14 +1,11 @@
 import streamlit as st
-from utils.data_loader import (
-    load_season_stats,
-    load_coaching_data,
-    load_active_rosters,
-    load_active_contracts
-)
-from views.overview_view import show_overview_view
-from views.team_view import show_team_view
-from views.coach_view import show_coach_view
-from views.player_view import show_player_view
+from utils.data_loader import get_dataset_store
+from utils.scoring import BUILT_IN_SCORING, SCORING_RULES
+from views.overview_view import show_overview_view, DATASETS as OVERVIEW_DATASETS
+from views.team_view import show_team_view, DATASETS as TEAM_DATASETS
+from views.coach_view import show_coach_view, DATASETS as COACH_DATASETS
+from views.player_view import show_player_view, DATASETS as PLAYER_DATASETS
+from views.draft_view import show_draft_view
 
 GA_ID = st.secrets["GA_ID"]
 
@@ -45,33 +42,63 @@ if "player_selected" not in st.session_state:
 # ----------------------
 # Load Data
 # ----------------------
-def load_data():
+def load_data(datasets):
     """
-    Loads all required datasets:
-    - Coaching data (CSV)
-    - Season stats (Parquet)
-    - Weekly stats (Parquet)
-    - Active rosters (Parquet)
-    - Active contracts (Parquet)
+    Returns the datasets a view declares, in declaration order, from the
+    shared, process-wide store. Each table (and column) is read from disk
+    the first time any view asks for it, then reused by every rerun and
+    session.
+
+    Parameters
+    ----------
+    datasets : dict
+        {dataset name: list of columns, or None for all columns}
     """
-    coaching_df = load_coaching_data()                  # Coaching data
-    season_stats_df = load_season_stats(level="season")  # Aggregated season stats
-    weekly_stats_df = load_season_stats(level="weekly")  # Weekly stats
-    rosters_df = load_active_rosters()                   # Active rosters
-    contracts_df = load_active_contracts()               # Active contracts
+    return get_dataset_store().get_many(datasets)
+
+def load_index(name):
+    """Returns a shared lookup index (e.g. "coach_staff"), built once per process."""
+    return get_dataset_store().index(name)
 
-    return coaching_df, season_stats_df, weekly_stats_df, rosters_df, contracts_df
+# ----------------------
+# Sidebar Search (players, coaches, teams)
+# ----------------------
+# Result kind -> (view, session state key holding the selection)
+SEARCH_TARGETS = {
+    "player": ("player", "player_selected"),
+    "coach": ("coach", "selected_coach"),
+    "team": ("team", "selected_team"),
+}
 
-# Load everything at once
-coaching_df, stats_df, weekly_df, rosters_df, contracts_df = load_data()
+def go_to_search_result():
+    entry = load_index("search").entries[st.session_state.global_search]
+    view, state_key = SEARCH_TARGETS[entry["kind"]]
+    st.session_state.view = view
+    st.session_state[state_key] = entry["id"]
+    if entry["kind"] == "coach":
+        st.session_state.coach_mode = "Single Coach"
+    st.session_state.global_search = None
+
+# Options are the search index's pre-sorted entry ids; the selectbox
+# filters them in the browser as the user types
+search_index = load_index("search")
+st.sidebar.selectbox(
+    "Search",
+    options=search_index.options(),
+    index=None,
+    format_func=search_index.label,
+    key="global_search",
+    placeholder="Player, coach or team",
+    on_change=go_to_search_result
+)
 
 # ----------------------
 # Sidebar Navigation
 # ----------------------
 view_choice = st.sidebar.radio(
     "Navigate to:",
-    options=["Overview", "Team View", "Coach View", "Player View"],
-    index=["overview", "team", "coach", "player"].index(st.session_state.view)
+    options=["Overview", "Team View", "Coach View", "Player View", "Draft Board"],
+    index=["overview", "team", "coach", "player", "draft"].index(st.session_state.view)
 )
 
 # Sync sidebar selection with session state
@@ -83,18 +110,54 @@ elif view_choice == "Coach View":
     st.session_state.view = "coach"
 elif view_choice == "Player View":
     st.session_state.view = "player"
+elif view_choice == "Draft Board":
+    st.session_state.view = "draft"
+
+# ----------------------
+# League Scoring (custom rule sets are scored from weekly stats)
+# ----------------------
+league_scoring = st.sidebar.selectbox(
+    "League Scoring:",
+    options=list(SCORING_RULES),
+    index=list(SCORING_RULES).index("ppr"),
+    format_func=lambda key: SCORING_RULES[key]["label"],
+    key="league_scoring"
+)
+
+def load_league_scores():
+    """
+    Returns the league rule set's points and ranks, or None when Standard or
+    PPR is chosen (the views already show both).
+    """
+    if league_scoring in BUILT_IN_SCORING:
+        return None
+    return load_index("scoring").score(league_scoring)
 
 # ----------------------
 # Render the Correct View
 # ----------------------
 if st.session_state.view == "overview":
-    show_overview_view()
+    stats_df, team_totals_df, stint_stats_df = load_data(OVERVIEW_DATASETS)
+    show_overview_view(stats_df, team_totals_df, stint_stats_df, load_index("coach_staff"), load_league_scores())
 
 elif st.session_state.view == "team":
-    show_team_view(coaching_df, stats_df)
+    coaching_df, team_totals_df, team_position_df = load_data(TEAM_DATASETS)
+    show_team_view(coaching_df, team_totals_df, team_position_df, load_index("coach_staff"))
 
 elif st.session_state.view == "coach":
-    show_coach_view(coaching_df, stats_df)
+    coaching_df, cutoffs_df = load_data(COACH_DATASETS)
+    show_coach_view(
+        coaching_df, cutoffs_df,
+        load_index("league_ranks"), load_index("coach_careers"), load_index("coach_similarity"),
+        load_league_scores()
+    )
 
 elif st.session_state.view == "player":
-    show_player_view(coaching_df, stats_df, weekly_df, rosters_df, contracts_df)
+    (team_totals_df,) = load_data(PLAYER_DATASETS)
+    show_player_view(
+        team_totals_df, load_index("coach_staff"), load_index("players"), search_index,
+        load_league_scores()
+    )
+
+elif st.session_state.view == "draft":
+    show_draft_view(load_index("draft_board"), league_scoring, load_league_scores())
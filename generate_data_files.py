@@ -1,46 +1,113 @@
 import os
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
 import pandas as pd
-import nfl_data_py as nfl
 
-# ---------- Shared Build Logic ----------
-def build_stats(level="season"):
+from utils.aggregates import AGGREGATES_DIR, WEEKLY_AGGREGATES, build_aggregates
+from utils.coaching_stints import attach_coaching_stints, build_coaching_stints
+from utils.data_sources import FIXTURE_DIR, RAW_CACHE_DIR, get_source
+from utils.parquet_io import (
+    SNAPSHOT_DIR,
+    WEEKLY_SORT_KEYS,
+    WEEKLY_STATS_DIR,
+    has_snapshot,
+    write_season_partitions,
+    write_snapshot,
+)
+from utils.schema import apply_schema, memory_report
+from utils.teams import normalize_teams
+
+# ---------- Build Stages ----------
+YEARS = list(range(2015, 2025))
+
+# (stage name, seconds) for every stage run so far, in order
+STAGE_TIMINGS = []
+
+
+@contextmanager
+def stage(name):
+    """
+    Time a build stage and record it in STAGE_TIMINGS.
+    """
+    print(f"{name}...")
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    STAGE_TIMINGS.append((name, elapsed))
+    print(f"  done in {elapsed:.2f}s")
+
+
+def print_stage_timings():
+    total = sum(seconds for _, seconds in STAGE_TIMINGS)
+    width = max([len(name) for name, _ in STAGE_TIMINGS] + [len("total")])
+    print("Build timings:")
+    for name, seconds in STAGE_TIMINGS:
+        share = 100 * seconds / total if total else 0
+        print(f"  {name:<{width}} {seconds:>7.2f}s  {share:>5.1f}%")
+    print(f"  {'total':<{width}} {total:>7.2f}s")
+
+
+def fetch_weekly(source, years=YEARS):
+    """
+    Fetch raw weekly player stats for years from source (see
+    utils.data_sources). This is the only fetch in the build; every output
+    is derived from its result.
+    """
+    return source.fetch("weekly", years)
+
+
+def prepare_weekly(weekly_stats):
     """
-    Build NFL stats from nfl_data_py.
+    Canonicalize teams on raw weekly stats.
 
     Parameters
     ----------
-    level : str
-        "season" -> returns aggregated season stats
-        "weekly" -> returns raw weekly stats
+    weekly_stats : pd.DataFrame
+        Output of fetch_weekly().
 
     Returns
     -------
     pd.DataFrame
     """
-    years = list(range(2015, 2025))
-    weekly_stats = nfl.import_weekly_data(years)
-
     # -----------------
-    # Team ID Mapping
+    # Canonical Teams
     # -----------------
-    team_id_map = {
-        'ARI': 1, 'ATL': 2, 'BAL': 3, 'BUF': 4, 'CAR': 5, 'CHI': 6, 'CIN': 7, 'CLE': 8,
-        'DAL': 9, 'DEN': 10, 'DET': 11, 'GB': 12, 'HOU': 13, 'IND': 14, 'JAX': 15, 'KC': 16,
-        'LAC': 17, 'SD': 17,
-        'LAR': 18, 'STL': 18, 'LA': 18,
-        'LV': 19, 'OAK': 19,
-        'MIA': 20, 'MIN': 21, 'NE': 22, 'NO': 23, 'NYG': 24, 'NYJ': 25,
-        'PHI': 26, 'PIT': 27, 'SEA': 28, 'SF': 29, 'TB': 30, 'TEN': 31, 'WAS': 32,
-    }
+    # Fold relocated franchises (STL/LA -> LAR, SD -> LAC, OAK -> LV) into one
+    # abbreviation and attach the stable team_id, so the app never has to.
+    weekly_stats = normalize_teams(weekly_stats, "recent_team", "team_id")
+    weekly_stats = normalize_teams(weekly_stats, "opponent_team")
+    return weekly_stats
+
+
+def coaching_stints():
+    """
+    Week-level (season, week, team) -> HC/OC/play-caller table built from
+    the coaching CSV's Coached From/To weeks.
+    """
+    from utils.data_loader import load_coaching_data
 
-    # Map team_id to weekly stats immediately
-    weekly_stats['team_id'] = weekly_stats['recent_team'].map(team_id_map).astype('Int64')
+    return build_coaching_stints(load_coaching_data())
 
-    # Weekly mode: return raw weekly data directly
-    if level == "weekly":
-        return weekly_stats
 
-    # Season mode: aggregate weekly data to season totals
+def aggregate_season(weekly_stats):
+    """
+    Aggregate prepared weekly stats to regular-season totals per player.
+
+    Parameters
+    ----------
+    weekly_stats : pd.DataFrame
+        Output of prepare_weekly().
+
+    Returns
+    -------
+    pd.DataFrame
+    """
     position_filt = ['QB', 'RB', 'WR', 'TE']
     weekly_stats_filtered = weekly_stats[
         (weekly_stats['position'].isin(position_filt)) &
@@ -100,18 +167,319 @@ def build_stats(level="season"):
 
     return season_stats
 
+# ---------- Parallel Build ----------
+def build_season(source, season, stints):
+    """
+    Fetch, normalize, attribute coaches, hash and aggregate one season.
+    Seasons share no state, so this runs in a worker process.
+
+    Returns
+    -------
+    tuple
+        (weekly stats, {season: hash}, season stats) for that season
+    """
+    weekly_stats = prepare_weekly(fetch_weekly(source, [season]))
+    weekly_stats = attach_coaching_stints(weekly_stats, stints)
+    return weekly_stats, season_hashes(weekly_stats), aggregate_season(weekly_stats)
+
+
+def build_seasons_parallel(source, years, workers, stints):
+    """
+    Run build_season() for every season on a process pool and combine the
+    results in season order.
+
+    Parameters
+    ----------
+    source : DataSource
+        Must be picklable; every source in utils.data_sources is.
+    years : list of int
+    workers : int
+        Maximum worker processes.
+    stints : pd.DataFrame
+        Output of coaching_stints().
+
+    Returns
+    -------
+    tuple
+        (weekly stats, {season: hash}, season stats) for all years
+    """
+    with ProcessPoolExecutor(max_workers=min(workers, len(years))) as pool:
+        results = list(pool.map(build_season, [source] * len(years), years, [stints] * len(years)))
+
+    hashes = {}
+    for _, season_hash, _ in results:
+        hashes.update(season_hash)
+    weekly_stats = pd.concat([weekly for weekly, _, _ in results], ignore_index=True)
+    season_stats = pd.concat([season for _, _, season in results], ignore_index=True)
+    return weekly_stats, hashes, season_stats
+
+
+# ---------- Build Manifest ----------
+# Records which seasons are built, a hash of their prepared weekly rows and a
+# hash of their coaching stints, so an incremental build can skip seasons
+# whose upstream data and coaching staff are unchanged.
+MANIFEST_PATH = "data/manifest.json"
+
+# Bump when the build logic or storage schema changes; a manifest written by
+# a different version forces a full rebuild.
+BUILD_VERSION = 3
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """
+    Return the build manifest, or an empty one if it is missing or was
+    written by a different BUILD_VERSION.
+    """
+    empty = {"version": BUILD_VERSION, "seasons": {}}
+    if not os.path.exists(path):
+        return empty
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != BUILD_VERSION:
+        print(f"Manifest is from build version {manifest.get('version')}; rebuilding everything")
+        return empty
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _hash_seasons(df, sort_keys):
+    hashes = {}
+    for season, season_df in df.groupby("season", sort=True):
+        season_df = season_df.sort_values(sort_keys, kind="stable")
+        digest = hashlib.sha256(",".join(season_df.columns).encode())
+        digest.update(pd.util.hash_pandas_object(season_df, index=False).values.tobytes())
+        hashes[int(season)] = digest.hexdigest()[:16]
+    return hashes
+
+
+def season_hashes(weekly_stats):
+    """
+    Content hash of each season's prepared weekly rows.
+
+    Rows are put in a fixed order first, so the hash only changes when the
+    data does, not when upstream returns rows in a different order.
+
+    Returns
+    -------
+    dict
+        {season: hex digest}
+    """
+    return _hash_seasons(weekly_stats, WEEKLY_SORT_KEYS)
+
+
+def stint_hashes(stints):
+    """
+    Content hash of each season's coaching stints (coaching_stints()).
+
+    The coaching CSV is read on every build, so comparing these with the
+    manifest finds the seasons a coaching edit touched without fetching
+    any weekly data.
+
+    Returns
+    -------
+    dict
+        {season: hex digest}, for seasons in YEARS
+    """
+    return _hash_seasons(stints[stints["season"].isin(YEARS)], ["season", "week", "team_id"])
+
+
+def seasons_to_fetch(manifest, refresh, stints_digests=None):
+    """
+    Seasons an incremental build must fetch: those never built, the ones
+    explicitly refreshed (by default the latest, in-progress season) and
+    those whose coaching stints changed since they were built.
+    """
+    built = {int(season) for season in manifest["seasons"]}
+    restaffed = {
+        season for season, digest in (stints_digests or {}).items()
+        if manifest["seasons"].get(str(season), {}).get("stints_hash") != digest
+    }
+    return sorted({year for year in YEARS if year not in built} | set(refresh) | restaffed)
+
+
+def merge_season_stats(season_stats, seasons, path="data/season_stats.parquet"):
+    """
+    Replace the rows for seasons in the existing season stats file with
+    season_stats, keeping every other season as built.
+    """
+    if not os.path.exists(path):
+        return season_stats
+    existing = pd.read_parquet(path)
+    kept = existing[~existing["season"].isin(seasons)]
+    # Categories differ between the two frames; compact() re-types the result
+    kept = kept.astype({col: str for col in kept.select_dtypes("category").columns})
+    return pd.concat([kept, season_stats], ignore_index=True).sort_values(
+        ["season", "player_id"], kind="stable", ignore_index=True
+    )
+
+
+# ---------- Compact Storage Types ----------
+def compact(df, table):
+    """
+    Apply the typed storage schema for table and print how much memory it saves.
+    """
+    typed = apply_schema(df, table)
+    total = memory_report(df, typed).loc["TOTAL"]
+    print(
+        f"  {table}: {total['kb_before']:,.0f} KB -> {total['kb_after']:,.0f} KB "
+        f"({total['saved_pct']:.0f}% smaller)"
+    )
+    return typed
+
+
+# ---------- Arrow Snapshot ----------
+def export_snapshot():
+    """
+    Export every app dataset as a memory-mappable Arrow IPC snapshot.
+
+    Tables are read back through the app's own loaders, so the snapshot
+    holds exactly what the app would otherwise load from the data files.
+    """
+    from utils.data_loader import DATASETS
+
+    write_snapshot({name: loader() for name, loader in DATASETS.items()})
+
+
 # ---------- Save Parquet Files ----------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the app's data files.")
+    parser.add_argument(
+        "--snapshot", action="store_true",
+        help=f"Also export an Arrow IPC snapshot to {SNAPSHOT_DIR}/ for zero-copy, shared loading"
+    )
+    parser.add_argument(
+        "--snapshot-only", action="store_true",
+        help="Export the snapshot from the existing data files without rebuilding them"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help=f"Only fetch seasons missing from {MANIFEST_PATH}, --refresh seasons and seasons "
+             "whose coaching stints changed, and rewrite only the seasons whose content changed"
+    )
+    parser.add_argument(
+        "--refresh", type=int, nargs="*", default=None, metavar="SEASON",
+        help="Seasons always re-fetched rather than read from the raw cache, "
+             "even by an incremental build (default: the latest season when "
+             "--incremental, otherwise none)"
+    )
+    parser.add_argument(
+        "--source", choices=["cache", "live", "fixture"], default="cache",
+        help=f"cache: nfl_data_py behind an on-disk raw cache in {RAW_CACHE_DIR}/ (default); "
+             "live: always download; fixture: local files only, no network"
+    )
+    parser.add_argument(
+        "--fixture-dir", default=FIXTURE_DIR,
+        help="Directory holding weekly.parquet (or weekly/) for --source fixture"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Fetch and transform seasons on this many worker processes "
+             f"(default: 1, serial; this machine has {os.cpu_count()} cores)"
+    )
+    args = parser.parse_args()
+
     os.makedirs("data", exist_ok=True)
+    rebuilt = False
+
+    if not args.snapshot_only:
+        manifest = load_manifest() if args.incremental else {"version": BUILD_VERSION, "seasons": {}}
+        incremental = bool(manifest["seasons"])
+        # An incremental build re-fetches the in-progress season by default;
+        # a full build only re-fetches seasons passed to --refresh
+        refresh = args.refresh if args.refresh is not None else ([YEARS[-1]] if args.incremental else [])
+
+        with stage("Building coaching stints"):
+            stints = coaching_stints()
+            stints.to_parquet("data/coaching_stints.parquet", index=False)
+            stints_digests = stint_hashes(stints)
+        years = seasons_to_fetch(manifest, refresh, stints_digests) if incremental else YEARS
+
+        source = get_source(args.source, fixture_root=args.fixture_dir)
+        # Refreshed seasons may have new games upstream, so never serve them from the cache
+        source.invalidate("weekly", refresh)
+
+        season_stats = None
+        if not years:
+            weekly_stats, hashes = pd.DataFrame(), {}
+        elif args.workers > 1:
+            workers = min(args.workers, len(years))
+            with stage(f"Building {len(years)} season(s) on {workers} workers ({source.name})"):
+                weekly_stats, hashes, season_stats = build_seasons_parallel(source, years, workers, stints)
+        else:
+            with stage(f"Fetching weekly data ({len(years)} season(s), {source.name})"):
+                raw_weekly = fetch_weekly(source, years)
+            with stage("Normalizing teams"):
+                weekly_stats = prepare_weekly(raw_weekly)
+            with stage("Attributing coaches to weeks"):
+                # Coach columns are hashed too, so a season fetched because
+                # its stints changed is rewritten along with its aggregates
+                weekly_stats = attach_coaching_stints(weekly_stats, stints)
+            with stage("Hashing seasons"):
+                hashes = season_hashes(weekly_stats)
+
+        changed = [
+            season for season, digest in hashes.items()
+            if manifest["seasons"].get(str(season), {}).get("hash") != digest
+        ]
+        if changed:
+            weekly_stats = weekly_stats[weekly_stats["season"].isin(changed)]
+        print(f"  changed seasons: {changed or 'none'}")
+
+        if changed:
+            with stage("Aggregating season stats"):
+                if season_stats is None:
+                    season_stats = aggregate_season(weekly_stats)
+                else:
+                    # Already aggregated per season by the workers
+                    season_stats = season_stats[season_stats["season"].isin(changed)]
+                if incremental:
+                    season_stats = merge_season_stats(season_stats, changed)
+            with stage("Compacting dtypes"):
+                season_stats = compact(season_stats, "season_stats")
+                weekly_stats = compact(weekly_stats, "weekly_stats")
+            with stage("Writing season stats"):
+                season_stats.to_parquet("data/season_stats.parquet", index=False)
+            with stage("Building aggregate tables"):
+                # Derived from the full season table, so incremental builds refresh them too
+                os.makedirs(AGGREGATES_DIR, exist_ok=True)
+                for name, table in build_aggregates(season_stats).items():
+                    table = apply_schema(table, name)
+                    table.to_parquet(os.path.join(AGGREGATES_DIR, f"{name}.parquet"), index=False)
+                # Weekly aggregates only cover the changed seasons' partitions
+                for name, build in WEEKLY_AGGREGATES.items():
+                    table = apply_schema(build(weekly_stats), name)
+                    write_season_partitions(table, os.path.join(AGGREGATES_DIR, name))
+            with stage("Writing weekly partitions"):
+                # Only the changed seasons' partitions are replaced.
+                # Partitioned by season, sorted by player for fast single-player reads
+                write_season_partitions(weekly_stats, WEEKLY_STATS_DIR, sort_by=WEEKLY_SORT_KEYS)
+
+            built_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            season_rows = weekly_stats["season"].value_counts()
+            for season in changed:
+                manifest["seasons"][str(season)] = {
+                    "hash": hashes[season],
+                    "rows": int(season_rows[season]),
+                    "built_at": built_at,
+                }
+            rebuilt = True
 
-    print("Building season stats...")
-    season_stats = build_stats(level="season")
-    season_stats.to_parquet("data/season_stats.parquet", index=False)
-    print("Saved data/season_stats.parquet")
+        # Every fetched season now matches the current stints, changed or not
+        for season in hashes:
+            manifest["seasons"][str(season)]["stints_hash"] = stints_digests.get(season)
+        if hashes:
+            save_manifest(manifest)
 
-    print("Building weekly stats...")
-    weekly_stats = build_stats(level="weekly")
-    weekly_stats.to_parquet("data/weekly_stats.parquet", index=False)
-    print("Saved data/weekly_stats.parquet")
+    # An existing snapshot is always refreshed so it never shadows newer data
+    if args.snapshot or args.snapshot_only or (rebuilt and has_snapshot("season_stats")):
+        with stage("Exporting Arrow snapshot"):
+            export_snapshot()
 
+    print_stage_timings()
     print("Data files generated successfully!")
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def repo_root(monkeypatch):
+    """Run from the repository root, where the loaders find data/ and the coaching CSV."""
+    monkeypatch.chdir(ROOT)
+    return ROOT
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from generate_data_files import (
+    BUILD_VERSION,
+    YEARS,
+    load_manifest,
+    save_manifest,
+    season_hashes,
+    seasons_to_fetch,
+    stint_hashes,
+)
+from utils.coaching_stints import build_coaching_stints
+from utils.data_loader import load_coaching_data
+
+
+@pytest.fixture
+def coaching(repo_root):
+    return load_coaching_data()
+
+
+def _built(stints_digests):
+    """A manifest with every season in YEARS built under these stint hashes."""
+    return {
+        "version": BUILD_VERSION,
+        "seasons": {str(season): {"hash": "x", "stints_hash": stints_digests[season]} for season in YEARS},
+    }
+
+
+def test_season_hashes_ignore_row_order_but_not_content():
+    weekly = pd.DataFrame({
+        "season": [2023, 2023, 2024],
+        "week": [1, 2, 1],
+        "player_id": ["a", "a", "b"],
+        "season_type": ["REG", "REG", "REG"],
+        "fantasy_points": [10.0, 12.0, 8.0],
+    })
+    hashes = season_hashes(weekly)
+    assert season_hashes(weekly.iloc[::-1]) == hashes
+
+    edited = weekly.assign(fantasy_points=[10.0, 12.5, 8.0])
+    assert season_hashes(edited)[2023] != hashes[2023]
+    assert season_hashes(edited)[2024] == hashes[2024]
+
+
+def test_stint_hashes_cover_built_seasons_only(coaching):
+    digests = stint_hashes(build_coaching_stints(coaching))
+    assert sorted(digests) == YEARS
+
+
+def test_a_coaching_edit_refetches_only_that_season(coaching):
+    digests = stint_hashes(build_coaching_stints(coaching))
+    manifest = _built(digests)
+    assert seasons_to_fetch(manifest, refresh=[], stints_digests=digests) == []
+
+    # A new offensive coordinator for the 2017 Giants
+    oc = (coaching["Season"] == 2017) & (coaching["Team Abbr"] == "NYG") & (
+        coaching["Coach Type"] == "Offensive Coordinator"
+    )
+    assert oc.any()
+    edited = coaching.assign(Coach=coaching["Coach"].where(~oc, "Someone Else"))
+    digests = stint_hashes(build_coaching_stints(edited))
+    assert seasons_to_fetch(manifest, refresh=[], stints_digests=digests) == [2017]
+    assert seasons_to_fetch(manifest, refresh=[YEARS[-1]], stints_digests=digests) == [2017, YEARS[-1]]
+
+
+def test_seasons_built_without_a_stints_hash_are_refetched(coaching):
+    digests = stint_hashes(build_coaching_stints(coaching))
+    manifest = _built(digests)
+    del manifest["seasons"]["2019"]["stints_hash"]
+    del manifest["seasons"]["2020"]
+    assert seasons_to_fetch(manifest, refresh=[], stints_digests=digests) == [2019, 2020]
+    # Without stint hashes only unbuilt and refreshed seasons are fetched
+    assert seasons_to_fetch(manifest, refresh=[2024]) == [2020, 2024]
+
+
+def test_manifest_round_trip_and_version_check(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    assert load_manifest(path) == {"version": BUILD_VERSION, "seasons": {}}
+
+    manifest = {"version": BUILD_VERSION, "seasons": {"2024": {"hash": "abc", "stints_hash": "def"}}}
+    save_manifest(manifest, path)
+    assert load_manifest(path) == manifest
+
+    save_manifest({**manifest, "version": BUILD_VERSION - 1}, path)
+    assert load_manifest(path)["seasons"] == {}
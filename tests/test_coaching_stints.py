@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from utils.coaching_stints import (
+    POSTSEASON_WEEKS,
+    attach_coaching_stints,
+    build_coaching_stints,
+    regular_season_weeks,
+)
+
+COLUMNS = ["Season", "Team Abbr", "Team ID", "Coach Type", "Coach", "Coached From", "Coached To",
+           "Playing Calling Duties"]
+
+
+def _coaching(rows):
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def _week(stints, season, week, team_id=1):
+    match = stints[(stints["season"] == season) & (stints["week"] == week) & (stints["team_id"] == team_id)]
+    assert len(match) == 1
+    return match.iloc[0]
+
+
+def test_missing_weeks_cover_the_whole_season_and_playoffs():
+    coaching = _coaching([
+        (2020, "KC", 1, "Head Coach", "Andy Reid", np.nan, np.nan, "Yes"),
+        (2021, "KC", 1, "Head Coach", "Andy Reid", np.nan, np.nan, "Yes"),
+    ])
+    assert regular_season_weeks(coaching).tolist() == [17, 18]
+
+    weeks = build_coaching_stints(coaching).groupby("season")["week"].agg(["min", "max"])
+    assert weeks.loc[2020].tolist() == [1, 17 + POSTSEASON_WEEKS]
+    assert weeks.loc[2021].tolist() == [1, 18 + POSTSEASON_WEEKS]
+
+
+def test_an_interim_is_credited_from_the_week_they_took_over():
+    coaching = _coaching([
+        # The fired coach's range overlaps the interim's first week
+        (2022, "IND", 1, "Head Coach", "Frank Reich", 1, 9, "No"),
+        (2022, "IND", 1, "Interim Head Coach", "Jeff Saturday", 9, 18, "No"),
+        (2022, "IND", 1, "Offensive Coordinator", "Marcus Brady", 1, 18, ""),
+    ])
+    assert regular_season_weeks(coaching).tolist() == [9, 10, 18]
+
+    stints = build_coaching_stints(coaching)
+    assert _week(stints, 2022, 8)["hc"] == "Frank Reich"
+    assert not _week(stints, 2022, 8)["hc_interim"]
+    assert _week(stints, 2022, 9)["hc"] == "Jeff Saturday"
+    assert _week(stints, 2022, 9)["hc_interim"]
+    # Only a range running to the final week carries on into the playoffs
+    assert stints["week"].max() == 18 + POSTSEASON_WEEKS
+    assert stints["week"].is_unique
+
+
+def test_play_caller_is_the_oc_unless_the_head_coach_calls_plays():
+    coaching = _coaching([
+        (2023, "KC", 1, "Head Coach", "Andy Reid", 1, 18, "Yes"),
+        (2023, "KC", 1, "Offensive Coordinator", "Matt Nagy", 1, 18, ""),
+        (2023, "NYG", 2, "Head Coach", "Brian Daboll", 1, 18, "No"),
+        (2023, "NYG", 2, "Offensive Coordinator", "Mike Kafka", 1, 18, ""),
+        (2023, "ARI", 3, "Head Coach", "Jonathan Gannon", 1, 18, "No"),
+    ])
+    stints = build_coaching_stints(coaching)
+    assert _week(stints, 2023, 1, team_id=1)["play_caller"] == "Andy Reid"
+    assert _week(stints, 2023, 1, team_id=2)["play_caller"] == "Mike Kafka"
+    # No offensive coordinator listed: the head coach calls plays
+    assert _week(stints, 2023, 1, team_id=3)["play_caller"] == "Jonathan Gannon"
+    assert pd.isna(_week(stints, 2023, 1, team_id=3)["oc"])
+
+
+def test_attach_matches_weekly_rows_on_season_week_and_team():
+    coaching = _coaching([
+        (2022, "IND", 1, "Head Coach", "Frank Reich", 1, 8, "No"),
+        (2022, "IND", 1, "Interim Head Coach", "Jeff Saturday", 9, 18, "No"),
+    ])
+    weekly = pd.DataFrame({
+        "player_id": ["a", "a", "b"],
+        "season": np.array([2022, 2022, 2022], dtype="int16"),
+        "week": np.array([8, 9, 9], dtype="int8"),
+        "team_id": np.array([1, 1, 2], dtype="int8"),
+    })
+    attached = attach_coaching_stints(weekly, build_coaching_stints(coaching))
+    assert attached["hc"].tolist()[:2] == ["Frank Reich", "Jeff Saturday"]
+    assert pd.isna(attached["hc"].iloc[2])
+    assert attached[["season", "week", "team_id"]].dtypes.tolist() == weekly[["season", "week", "team_id"]].dtypes.tolist()
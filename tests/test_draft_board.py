@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.draft_board import DEFAULT_LEAGUE_SETTINGS, DraftBoardIndex, assign_tiers, replacement_ranks
+
+
+def _league(**settings):
+    return {**DEFAULT_LEAGUE_SETTINGS, "flex": 0, **settings}
+
+
+def test_replacement_rank_is_the_last_starter():
+    points = {pos: np.arange(40.0, 0, -1) for pos in ["QB", "RB", "WR", "TE"]}
+    assert replacement_ranks(points, _league()) == {"QB": 12, "RB": 24, "WR": 24, "TE": 12}
+
+
+def test_flex_spots_go_to_the_best_leftover_players():
+    points = {
+        "QB": np.array([30.0, 20.0]),
+        "RB": np.array([10.0, 9.0, 8.0, 7.0]),
+        "WR": np.array([10.0, 9.0, 6.0, 5.0]),
+        "TE": np.array([10.0, 3.0]),
+    }
+    settings = _league(teams=2, starters={"QB": 1, "RB": 1, "WR": 1, "TE": 1}, flex=1)
+    # Leftovers after starters: RB 8, 7; WR 6, 5; TE 3 -> both flex spots go to RBs
+    assert replacement_ranks(points, settings) == {"QB": 2, "RB": 4, "WR": 2, "TE": 2}
+
+
+def test_baselines_override_the_derived_rank():
+    points = {pos: np.arange(40.0, 0, -1) for pos in ["QB", "RB", "WR", "TE"]}
+    ranks = replacement_ranks(points, _league(baselines={"QB": 15, "TE": 0}))
+    assert ranks["QB"] == 15
+    assert ranks["TE"] == 12
+
+
+def test_a_position_nobody_starts_is_replaced_by_its_best_player():
+    points = {pos: np.arange(40.0, 0, -1) for pos in ["QB", "RB", "WR", "TE"]}
+    ranks = replacement_ranks(points, _league(starters={"QB": 0, "RB": 2, "WR": 2, "TE": 0}))
+    assert ranks["QB"] == 1
+    assert ranks["TE"] == 1
+
+
+def test_tiers_break_at_unusually_large_drops():
+    board = pd.DataFrame({
+        "position": ["QB"] * 6 + ["TE"] * 3,
+        "VOR": [50.0, 48.0, 46.0, 20.0, 18.0, -5.0, 10.0, 9.0, 8.0],
+    })
+    assert assign_tiers(board).tolist() == [1, 1, 1, 2, 2, 3, 1, 1, 1]
+
+
+@pytest.fixture
+def boards():
+    season_stats = pd.DataFrame({
+        "season": [2024] * 6,
+        "player_id": ["qb1", "qb2", "rb1", "rb2", "rb2", "rb3"],
+        "player_display_name": ["QB One", "QB Two", "RB One", "RB Two", "RB Two", "RB Three"],
+        # rb2 was traded: two rows, most games with NYJ
+        "recent_team": ["KC", "BUF", "SF", "NYJ", "MIA", "DAL"],
+        "position": ["QB", "QB", "RB", "RB", "RB", "RB"],
+        "games_played": [17, 17, 17, 10, 7, 17],
+        "fantasy_points": [300.0, 250.0, 200.0, 100.0, 80.0, 120.0],
+        "fantasy_points_ppr": [300.0, 250.0, 260.0, 130.0, 100.0, 150.0],
+    })
+    active_rosters = pd.DataFrame({
+        "player_id": ["qb1", "rb2", "rb3"],
+        "player_name": ["QB One", "RB Two", "RB Three"],
+        "team": ["KC", "MIA", "DAL"],
+        "position": ["QB", "RB", "RB"],
+    })
+    return DraftBoardIndex(season_stats, active_rosters)
+
+
+def test_board_values_players_over_replacement(boards):
+    settings = {"season": 2024, "teams": 1, "starters": {"QB": 1, "RB": 2, "WR": 0, "TE": 0},
+                "flex": 0, "baselines": {}}
+    board = boards.board(settings, scoring="ppr").set_index("player_id")
+
+    # The traded player's season is one line: both teams' points, main team
+    assert board.loc["rb2", "Points"] == 230.0
+    assert board.loc["rb2", "Games"] == 17
+    assert board.loc["rb2", "Team"] == "NYJ"
+    # Replacement: QB1 and RB2 in a one-team league
+    assert board.loc["qb1", "VOR"] == 0.0
+    assert board.loc["rb1", "VOR"] == 30.0
+    assert board.loc["rb3", "VOR"] == -80.0
+    assert board["Rank"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_boards_are_cached_per_scoring_and_settings(boards):
+    settings = {**DEFAULT_LEAGUE_SETTINGS, "season": 2024}
+    ppr = boards.board(settings, scoring="ppr")
+    assert boards.board(settings, scoring="ppr").equals(ppr)
+    assert not boards.board(settings, scoring="std").equals(ppr)
+
+
+def test_draft_pool_uses_current_rosters(boards):
+    settings = {**DEFAULT_LEAGUE_SETTINGS, "season": 2024}
+    pool = boards.draft_pool(settings).set_index("player_id")
+    assert sorted(pool.index) == ["qb1", "rb2", "rb3"]
+    assert pool.loc["rb2", "Team"] == "MIA"
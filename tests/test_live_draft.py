@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.draft_board import DRAFT_POSITIONS
+from utils.live_draft import ROSTER_NEED_WEIGHTS, LiveDraft
+
+SETTINGS = {
+    "season": 2024,
+    "teams": 2,
+    "starters": {"QB": 1, "RB": 1, "WR": 1, "TE": 1},
+    "flex": 1,
+    "baselines": {},
+}
+
+
+def _pool(players):
+    """Draft pool rows from (player_id, position, VOR), in board order."""
+    df = pd.DataFrame(players, columns=["player_id", "position", "VOR"])
+    return df.assign(
+        Player=df["player_id"].str.upper(),
+        Team="KC",
+        Rank=np.arange(1, len(df) + 1),
+    )
+
+
+def test_picks_follow_snake_order():
+    draft = LiveDraft(_pool([("a", "QB", 1.0)]), {**SETTINGS, "teams": 3}, rounds=2)
+    assert [draft.team_for_pick(pick) for pick in range(6)] == [0, 1, 2, 2, 1, 0]
+    assert draft.on_the_clock() == (1, 1, 1)
+
+
+def test_pick_and_undo():
+    draft = LiveDraft(_pool([("qb", "QB", 50.0), ("rb", "RB", 40.0)]), SETTINGS, rounds=1)
+    draft.pick("qb")
+    assert draft.on_the_clock() == (1, 2, 2)
+    assert draft.best_available()["player_id"].tolist() == ["rb"]
+    with pytest.raises(ValueError, match="already been drafted"):
+        draft.pick("qb")
+    with pytest.raises(ValueError, match="not in the draft pool"):
+        draft.pick("nobody")
+
+    draft.undo()
+    assert draft.picks == []
+    assert draft.best_available()["player_id"].tolist() == ["qb", "rb"]
+
+    draft.pick("qb")
+    draft.pick("rb")
+    assert draft.complete
+    assert draft.on_the_clock() is None
+    with pytest.raises(ValueError, match="complete"):
+        draft.pick("rb")
+    assert draft.roster(0)["player_id"].tolist() == ["qb"]
+    assert draft.pick_log()["Drafted By"].tolist() == [1, 2]
+
+
+def test_needs_fill_starters_then_flex_then_bench():
+    pool = _pool([("rb1", "RB", 30.0), ("qb1", "QB", 20.0), ("qb2", "QB", 15.0), ("rb2", "RB", 10.0)])
+    draft = LiveDraft(pool, SETTINGS)
+    assert draft.needs(0)["RB"] == "starter"
+    draft.pick("rb1")
+    assert draft.needs(0) == {"QB": "starter", "RB": "flex", "WR": "starter", "TE": "starter"}
+    draft.pick("qb1")
+    draft.pick("qb2")
+    assert draft.needs(1)["QB"] == "bench"
+    draft.pick("rb2")
+    # Team 1's second RB took its flex spot: RB/WR/TE past their starters go to the bench
+    assert draft.needs(0) == {"QB": "starter", "RB": "bench", "WR": "starter", "TE": "starter"}
+
+
+def test_a_flex_fill_ranks_below_an_open_starting_spot():
+    pool = _pool([("rb1", "RB", 100.0), ("rb2", "RB", 100.0), ("wr", "WR", 90.0), ("qb", "QB", 150.0)])
+    draft = LiveDraft(pool, SETTINGS)
+    draft.pick("rb1")
+    draft.pick("qb")
+
+    # Team 1 has its RB starter, so another RB would fill its flex spot:
+    # RB x flex (100 x 0.8 = 80) ranks below WR x starter (90)
+    best = draft.best_available(team=0)
+    assert best["player_id"].tolist() == ["wr", "rb2"]
+    assert best["Need"].tolist() == ["starter", "flex"]
+    assert best["Score"].tolist() == [90.0, 100.0 * ROSTER_NEED_WEIGHTS["flex"]]
+
+
+def test_negative_values_are_never_promoted_by_a_small_weight():
+    pool = _pool([("qb1", "QB", 10.0), ("qb2", "QB", -10.0), ("te", "TE", -12.0)])
+    draft = LiveDraft(pool, SETTINGS)
+    draft.pick("qb1")
+    # Team 2 still needs a QB; team 1 would bench one: -10 / 0.5 = -20 < -12
+    assert draft.best_available(team=0)["player_id"].tolist() == ["te", "qb2"]
+    assert draft.best_available(team=1)["player_id"].tolist() == ["qb2", "te"]
+
+
+def test_best_available_matches_a_full_sort():
+    rng = np.random.default_rng(0)
+    positions = rng.choice(DRAFT_POSITIONS, size=120)
+    values = rng.normal(20, 30, 120).round(2)
+    pool = _pool([(f"p{i}", pos, float(vor)) for i, (pos, vor) in enumerate(zip(positions, values))])
+    draft = LiveDraft(pool, {**SETTINGS, "teams": 4})
+    for player_id in rng.choice(pool["player_id"], size=30, replace=False):
+        draft.pick(player_id)
+
+    team = draft.team_for_pick(len(draft.picks))
+    weights = {pos: ROSTER_NEED_WEIGHTS[need] for pos, need in draft.needs(team).items()}
+    available = draft.available()
+    weight = available["position"].map(weights)
+    score = np.where(available["VOR"] > 0, available["VOR"] * weight, available["VOR"] / weight)
+    expected = available.assign(score=score).sort_values("score", ascending=False, kind="stable")
+
+    best = draft.best_available(limit=25)
+    np.testing.assert_allclose(best["Score"], expected["score"].round(2).head(25))
+    for pos in DRAFT_POSITIONS:
+        best_pos = draft.best_available(pos, limit=5)
+        assert best_pos["player_id"].tolist() == expected[expected["position"] == pos]["player_id"].head(5).tolist()
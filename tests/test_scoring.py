@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_loader import load_season_stats
+from utils.scoring import (
+    LEAGUE_POINTS,
+    SCORABLE_STATS,
+    SCORING_DATASETS,
+    SCORING_RULES,
+    ScoringEngine,
+    rules_key,
+)
+
+
+def _weekly(rows):
+    """Weekly stat lines with every scorable stat defaulting to 0."""
+    df = pd.DataFrame(rows)
+    for stat in SCORABLE_STATS:
+        if stat not in df.columns:
+            df[stat] = 0.0
+    return df
+
+
+@pytest.fixture
+def engine():
+    weekly = _weekly([
+        # QB: 300 yds, 2 TD, 1 INT
+        {"player_id": "qb", "season": 2024, "week": 1, "season_type": "REG", "recent_team": "KC",
+         "position": "QB", "passing_yards": 300, "passing_tds": 2, "interceptions": 1},
+        # TE: 5 catches, 60 yds, 1 TD
+        {"player_id": "te", "season": 2024, "week": 1, "season_type": "REG", "recent_team": "KC",
+         "position": "TE", "receptions": 5, "receiving_yards": 60, "receiving_tds": 1},
+        {"player_id": "te", "season": 2024, "week": 2, "season_type": "REG", "recent_team": "KC",
+         "position": "TE", "receptions": 3, "receiving_yards": 20},
+        # Playoff games never count towards season points
+        {"player_id": "te", "season": 2024, "week": 19, "season_type": "POST", "recent_team": "KC",
+         "position": "TE", "receptions": 10, "receiving_yards": 100},
+    ])
+    season = pd.DataFrame({
+        "season": [2024, 2024],
+        "player_id": ["qb", "te"],
+        "recent_team": ["KC", "KC"],
+        "position": ["QB", "TE"],
+        "games_played": [1, 2],
+    })
+    return ScoringEngine(weekly, season)
+
+
+def test_weekly_points_follow_the_rule_set(engine):
+    np.testing.assert_allclose(engine.weekly_points("std"), [18.0, 12.0, 2.0, 10.0])
+    np.testing.assert_allclose(engine.weekly_points("ppr"), [18.0, 17.0, 5.0, 20.0])
+    np.testing.assert_allclose(engine.weekly_points("ppr_6pt_pass_td"), [22.0, 17.0, 5.0, 20.0])
+
+
+def test_position_overrides_only_apply_to_that_position(engine):
+    # TE premium: 1.5 per TE reception, the QB scores as in PPR
+    np.testing.assert_allclose(engine.weekly_points("te_premium"), [18.0, 19.5, 6.5, 25.0])
+
+
+def test_season_points_sum_regular_season_weeks(engine):
+    season = engine.score("ppr").season
+    assert season[LEAGUE_POINTS].tolist() == [18.0, 22.0]
+    assert season["fantasy_points_league_pg"].tolist() == [18.0, 11.0]
+
+
+def test_rule_sets_that_score_alike_share_a_cache_entry(engine):
+    # Same points as PPR, plus a stat worth nothing
+    alias = {"label": "Custom PPR", "points": {**SCORING_RULES["ppr"]["points"], "carries": 0.0}}
+    assert rules_key(alias) == rules_key("ppr")
+    assert engine.score(alias) is engine.score("ppr")
+
+
+def test_unknown_stats_are_rejected(engine):
+    with pytest.raises(ValueError, match="Cannot score"):
+        engine.score({"label": "Bad", "points": {"tackles": 1.0}})
+
+
+@pytest.mark.parametrize("rules, column", [("std", "fantasy_points"), ("ppr", "fantasy_points_ppr")])
+def test_built_in_rule_sets_reproduce_the_nflverse_columns(repo_root, rules, column):
+    weekly = load_season_stats(
+        level="weekly", columns=SCORING_DATASETS["weekly_stats"] + [column], use_snapshot=False
+    )
+    season = load_season_stats(level="season", use_snapshot=False)
+    engine = ScoringEngine(weekly, season[SCORING_DATASETS["season_stats"]])
+
+    np.testing.assert_allclose(engine.weekly_points(rules), weekly[column].to_numpy(dtype=float), atol=1e-3)
+    np.testing.assert_allclose(
+        engine.score(rules).season[LEAGUE_POINTS].to_numpy(dtype=float),
+        season[column].to_numpy(dtype=float),
+        atol=1e-3,
+    )
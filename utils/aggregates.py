@@ -0,0 +1,192 @@
+import pandas as pd
+
+# ------------------------------
+# Materialized Aggregate Tables
+# ------------------------------
+
+# Derived from season_stats at build time (generate_data_files.py) and read
+# back through load_aggregate(), so views look results up instead of
+# re-aggregating season stats on every rerun.
+AGGREGATES_DIR = "data/aggregates"
+
+# Scoring format -> season_stats points column
+SCORING_COLUMNS = {
+    "std": "fantasy_points",
+    "ppr": "fantasy_points_ppr",
+}
+
+# League-wide "startable" pool per position: top 32 QBs/TEs, top 40 RBs/WRs
+POSITION_TOP_N = {"QB": 32, "RB": 40, "WR": 40, "TE": 32}
+
+_TEAM_SUM_COLUMNS = [
+    "attempts", "completions", "passing_yards", "passing_tds", "interceptions",
+    "carries", "rushing_yards", "rushing_tds",
+    "targets", "receptions", "receiving_yards", "receiving_tds",
+    "fantasy_points", "fantasy_points_ppr",
+]
+
+
+def _season_rank(df, col, by=("season",)):
+    """Descending 1-based rank of col within each group; ties share the best rank."""
+    return df.groupby(list(by), observed=True)[col].rank(method="min", ascending=False).astype("int16")
+
+
+def build_team_season_totals(season_stats):
+    """
+    One row per (season, team): summed player stats plus per-season ranks.
+
+    Returns
+    -------
+    pd.DataFrame
+        season, recent_team, team_id, the summed stat columns, and
+        - offense_yards: passing + rushing yards
+        - total_yards: passing + rushing + receiving yards
+        - pass_yards_rank, rush_yards_rank, offense_yards_rank,
+          pass_tds_rank, rush_tds_rank: rank among all teams that season
+    """
+    totals = (
+        season_stats
+        .groupby(["season", "recent_team"], as_index=False, observed=True)
+        .agg({"team_id": "first", **{col: "sum" for col in _TEAM_SUM_COLUMNS}})
+    )
+    totals["offense_yards"] = totals["passing_yards"] + totals["rushing_yards"]
+    totals["total_yards"] = totals["offense_yards"] + totals["receiving_yards"]
+
+    totals["pass_yards_rank"] = _season_rank(totals, "passing_yards")
+    totals["rush_yards_rank"] = _season_rank(totals, "rushing_yards")
+    totals["offense_yards_rank"] = _season_rank(totals, "offense_yards")
+    totals["pass_tds_rank"] = _season_rank(totals, "passing_tds")
+    totals["rush_tds_rank"] = _season_rank(totals, "rushing_tds")
+    return totals
+
+
+def build_team_position_totals(season_stats):
+    """
+    One row per (season, team, position): the position group's summed
+    targets and points, ranked against every other team's group.
+
+    Returns
+    -------
+    pd.DataFrame
+        season, recent_team, team_id, position, targets, fantasy_points,
+        fantasy_points_ppr, std_rank, ppr_rank (rank of the group's points
+        among all teams that season)
+    """
+    totals = (
+        season_stats
+        .groupby(["season", "recent_team", "position"], as_index=False, observed=True)
+        .agg({"team_id": "first", "targets": "sum", "fantasy_points": "sum", "fantasy_points_ppr": "sum"})
+    )
+    for scoring, col in SCORING_COLUMNS.items():
+        totals[f"{scoring}_rank"] = _season_rank(totals, col, by=("season", "position"))
+    return totals
+
+
+def build_player_ranks(season_stats, scoring_columns=SCORING_COLUMNS):
+    """
+    League rank of every season_stats row within its season and position,
+    for standard and PPR scoring (or the formats in scoring_columns).
+
+    Rows keep the season_stats grain (a player traded mid-season has one
+    row per team), so merging on (season, player_id) behaves exactly as
+    ranking season_stats in place did.
+
+    Returns
+    -------
+    pd.DataFrame
+        season, player_id, recent_team, position, std_rank, ppr_rank
+        (one <scoring>_rank column per key of scoring_columns)
+    """
+    ranks = season_stats[["season", "player_id", "recent_team", "position"]].copy()
+    for scoring, col in scoring_columns.items():
+        ranks[f"{scoring}_rank"] = _season_rank(season_stats, col, by=("season", "position"))
+    return ranks
+
+
+def build_position_cutoffs(season_stats, scoring_columns=SCORING_COLUMNS):
+    """
+    The league-wide top-N pool per season, position and scoring format
+    (standard and PPR unless scoring_columns says otherwise), with N from
+    POSITION_TOP_N.
+
+    Returns
+    -------
+    pd.DataFrame
+        season, position, scoring ("std"/"ppr"), top_n,
+        cutoff_points (lowest points still inside the top N) and
+        mean_points (average over the top N, ties at the cutoff included)
+    """
+    frames = []
+    for position, top_n in POSITION_TOP_N.items():
+        pos_stats = season_stats[season_stats["position"] == position]
+        for scoring, col in scoring_columns.items():
+            ranked = pos_stats.assign(rank=_season_rank(pos_stats, col))
+            top = ranked[ranked["rank"] <= top_n]
+            cutoffs = (
+                top.groupby("season", as_index=False)[col]
+                .agg(cutoff_points="min", mean_points="mean")
+                .assign(position=position, scoring=scoring, top_n=top_n)
+            )
+            frames.append(cutoffs)
+    columns = ["season", "position", "scoring", "top_n", "cutoff_points", "mean_points"]
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
+def build_coach_stint_stats(weekly_stats):
+    """
+    Regular-season player totals per coaching stint: every week is credited
+    to the head coach, coordinator and play-caller in charge that week, so
+    a coach fired mid-season and the interim replacement each get exactly
+    their own games.
+
+    Parameters
+    ----------
+    weekly_stats : pd.DataFrame
+        Weekly stats with the coach columns from attach_coaching_stints().
+
+    Returns
+    -------
+    pd.DataFrame
+        season, recent_team, team_id, hc, oc, play_caller, hc_interim,
+        oc_interim, player_id, player_display_name, position, the summed
+        stat columns, and games_played within the stint
+    """
+    keys = [
+        "season", "recent_team", "team_id", "hc", "oc", "play_caller", "hc_interim", "oc_interim",
+        "player_id", "player_display_name", "position",
+    ]
+    regular = weekly_stats[weekly_stats["season_type"] == "REG"]
+    return (
+        regular
+        .groupby(keys, as_index=False, observed=True, dropna=False)
+        .agg({**{col: "sum" for col in _TEAM_SUM_COLUMNS}, "week": "nunique"})
+        .rename(columns={"week": "games_played"})
+    )
+
+
+# Aggregate table name -> builder over season_stats
+AGGREGATES = {
+    "team_season_totals": build_team_season_totals,
+    "team_position_totals": build_team_position_totals,
+    "player_ranks": build_player_ranks,
+    "position_cutoffs": build_position_cutoffs,
+}
+
+# Aggregate table name -> builder over coach-attributed weekly stats. These
+# are stored season-partitioned, so incremental builds rewrite only the
+# seasons that changed.
+WEEKLY_AGGREGATES = {
+    "coach_stint_stats": build_coach_stint_stats,
+}
+
+
+def build_aggregates(season_stats):
+    """
+    Build every season-level materialized aggregate from season stats.
+
+    Returns
+    -------
+    dict
+        {table name: pd.DataFrame}
+    """
+    return {name: build(season_stats) for name, build in AGGREGATES.items()}
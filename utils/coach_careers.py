@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from utils.coaching_stints import regular_season_weeks
+from utils.scoring import LEAGUE_POINTS
+
+# ------------------------------
+# Coach Career Index
+# ------------------------------
+
+# Roles a coach's career is built from (interim stints are credited to the
+# full-time staff in Coach View, as before)
+CAREER_ROLES = ["Head Coach", "Offensive Coordinator"]
+
+STINT_COLUMNS = ["Season", "Team ID", "Team Abbr", "Coach Type", "weeks"]
+
+_POINT_COLUMNS = ["fantasy_points", "fantasy_points_ppr"]
+
+
+def _position_stats(history, point_columns):
+    # One row per player season a coach oversaw, even if they held two
+    # roles on the team that season
+    players = history.drop_duplicates(["Coach", "season", "recent_team", "player_id"])
+    grouped = players.groupby(["Coach", "season", "position"], observed=True)
+    return pd.concat(
+        [
+            grouped[point_columns].sum(),
+            grouped[point_columns].max().add_prefix("top_"),
+            grouped.size().rename("players"),
+        ],
+        axis=1,
+    ).reset_index()
+
+
+class CoachCareerIndex:
+    """
+    Every HC/OC's career, resolved once per data version.
+
+    Holds, per coach:
+        - their stints: one row per (season, team, role) with the number of
+          regular-season weeks held (stints())
+        - the season stats of every player they coached, pre-joined on
+          (season, team_id), so a coach's history is a slice rather than a
+          merge of the full stats table (history())
+        - per (season, position) aggregates of that history, which
+          compare() overlays for several coaches at once
+
+    Coaches are stored contiguously, sorted by name, with an offset array
+    marking where each coach's rows start.
+    """
+
+    def __init__(self, coaching_df, stats_df):
+        careers = coaching_df[coaching_df["Coach Type"].isin(CAREER_ROLES)]
+        careers = careers.assign(weeks=regular_season_weeks(careers))
+        self._stints = careers.sort_values(["Coach", "Season"], kind="stable").reset_index(drop=True)
+
+        # Same rows, column order and per-coach row order as merging
+        # stats_df with one coach's history
+        history = stats_df.merge(
+            careers.drop(columns="weeks"),
+            left_on=["season", "team_id"],
+            right_on=["Season", "Team ID"],
+            how="inner"
+        )
+        self._history = history.sort_values("Coach", kind="stable").reset_index(drop=True)
+
+        self.coaches = pd.Index(self._stints["Coach"].unique())
+        self._stint_offsets = self._offsets(self._stints["Coach"])
+        self._history_offsets = self._offsets(self._history["Coach"])
+
+        self.position_stats = _position_stats(self._history, _POINT_COLUMNS)
+
+    def _offsets(self, coach_col):
+        # Start of each coach's block in a frame sorted by coach name
+        return np.searchsorted(coach_col.to_numpy(), self.coaches.to_numpy(), side="left").tolist() + [len(coach_col)]
+
+    def _slice(self, frame, offsets, coach):
+        i = self.coaches.get_indexer([coach])[0]
+        if i < 0:
+            return frame.iloc[0:0]
+        return frame.iloc[offsets[i]:offsets[i + 1]]
+
+    def stints(self, coach):
+        """A coach's HC/OC coaching rows plus a "weeks" column, by season."""
+        return self._slice(self._stints, self._stint_offsets, coach)
+
+    def history(self, coach):
+        """Season stats of every player on the coach's teams, with their coaching row."""
+        return self._slice(self._history, self._history_offsets, coach)
+
+    def summary(self, coaches):
+        """
+        One career line per coach: seasons, teams, roles and weeks as HC/OC.
+
+        Parameters
+        ----------
+        coaches : list of str
+        """
+        stints = self._stints[self._stints["Coach"].isin(coaches)]
+        summary = stints.groupby("Coach").agg(
+            First=("Season", "min"),
+            Last=("Season", "max"),
+            Seasons=("Season", "nunique"),
+            Teams=("Team Abbr", lambda teams: ", ".join(dict.fromkeys(teams.astype(str)))),
+            Roles=("Coach Type", lambda roles: ", ".join(sorted(set(roles.astype(str))))),
+            Weeks=("weeks", "sum"),
+        )
+        return summary.reindex([c for c in coaches if c in summary.index]).reset_index()
+
+    def compare(self, coaches, position, metric_col, league=None):
+        """
+        Per-season position aggregates for several coaches in one pass.
+
+        Parameters
+        ----------
+        coaches : list of str
+        position : str
+            "QB", "RB", "WR" or "TE".
+        metric_col : str
+            Column of position_stats, e.g. "fantasy_points_ppr" (position
+            total) or "top_fantasy_points_ppr" (best player), or the
+            league points column (with or without "top_").
+        league : LeagueScores, optional
+            Custom rule set; its aggregates are built from just these
+            coaches' histories.
+
+        Returns
+        -------
+        pd.DataFrame
+            Coach, season, players and metric_col, one row per coach season.
+        """
+        stats = self.position_stats
+        if league is not None and metric_col.endswith(LEAGUE_POINTS):
+            history = league.rescore(pd.concat([self.history(coach) for coach in coaches]))
+            stats = _position_stats(history, [LEAGUE_POINTS])
+        rows = stats[stats["Coach"].isin(coaches) & (stats["position"] == position)]
+        return rows[["Coach", "season", "players", metric_col]].reset_index(drop=True)
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Coach Offensive-Profile Similarity
+# ------------------------------
+
+# Feature column -> display name
+FEATURES = {
+    "pass_rate": "Pass Rate",
+    "rb_touch_share": "RB Touch Share",
+    "wr_target_share": "WR Target Share",
+    "te_target_share": "TE Target Share",
+    "top_target_share": "Top Target Share",
+    "qb_points_share": "QB Points Share",
+    "rb_points_share": "RB Points Share",
+    "wr_points_share": "WR Points Share",
+    "te_points_share": "TE Points Share",
+    "ppr_per_game": "Team PPR/Game",
+}
+
+PROFILE_ROLES = ["Head Coach", "Offensive Coordinator"]
+INTERIM_ROLES = ["Interim Head Coach", "Interim Offensive Coordinator"]
+
+
+def _share(numerator, denominator):
+    return (numerator / denominator.where(denominator > 0)).fillna(0)
+
+
+def build_team_season_features(stats_df):
+    """
+    Offensive profile of every (season, team_id) from player season stats.
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexed by (season, team_id), one column per key of FEATURES:
+        pass rate, the RB share of carries + targets, WR/TE and top-player
+        target shares, each position's share of team PPR points, and team
+        PPR points per game.
+    """
+    keys = ["season", "team_id"]
+    team = stats_df.groupby(keys, observed=True).agg(
+        pass_attempts=("team_pass_attempts", "first"),
+        total_plays=("team_total_plays", "first"),
+        targets=("targets", "sum"),
+        top_targets=("targets", "max"),
+        points=("fantasy_points_ppr", "sum"),
+    )
+    by_position = (
+        stats_df.groupby(keys + ["position"], observed=True)[["carries", "targets", "fantasy_points_ppr"]]
+        .sum()
+        .unstack("position", fill_value=0)
+        .reindex(team.index, fill_value=0)
+    )
+
+    def position(col, pos):
+        return by_position[(col, pos)] if (col, pos) in by_position.columns else 0
+
+    team_carries = team["total_plays"] - team["pass_attempts"]
+    games = np.where(team.index.get_level_values("season") <= 2020, 16, 17)
+    return pd.DataFrame({
+        "pass_rate": _share(team["pass_attempts"], team["total_plays"]),
+        "rb_touch_share": _share(position("carries", "RB") + position("targets", "RB"), team_carries + team["targets"]),
+        "wr_target_share": _share(position("targets", "WR"), team["targets"]),
+        "te_target_share": _share(position("targets", "TE"), team["targets"]),
+        "top_target_share": _share(team["top_targets"], team["targets"]),
+        "qb_points_share": _share(position("fantasy_points_ppr", "QB"), team["points"]),
+        "rb_points_share": _share(position("fantasy_points_ppr", "RB"), team["points"]),
+        "wr_points_share": _share(position("fantasy_points_ppr", "WR"), team["points"]),
+        "te_points_share": _share(position("fantasy_points_ppr", "TE"), team["points"]),
+        "ppr_per_game": team["points"] / games,
+    }, index=team.index)[list(FEATURES)]
+
+
+class CoachSimilarityIndex:
+    """
+    Nearest-neighbor search over coaches' offensive profiles.
+
+    Every (season, team) gets a feature vector (build_team_season_features),
+    standardized across the league. A coach's profile is the mean vector of
+    the team seasons they ran as HC/OC, or as an interim if that is all they
+    have. Built once per data version by the dataset store, so a query is
+    one vectorized distance computation against the profile matrix.
+    """
+
+    def __init__(self, coaching_df, stats_df):
+        self.team_features = build_team_season_features(stats_df)
+        values = self.team_features.to_numpy(dtype=float)
+        self._mean = values.mean(axis=0)
+        self._std = values.std(axis=0)
+        self._std[self._std == 0] = 1
+
+        stints = coaching_df[coaching_df["Coach Type"].isin(PROFILE_ROLES + INTERIM_ROLES)]
+        rows = self.team_features.index.get_indexer(
+            pd.MultiIndex.from_arrays([stints["Season"].astype(int), stints["Team ID"].astype(int)])
+        )
+        stints = stints.assign(
+            _row=rows,
+            _interim=stints["Coach Type"].isin(INTERIM_ROLES).to_numpy(),
+        )
+        stints = stints[stints["_row"] >= 0]
+        # Full-time seasons where a coach has them, interim seasons otherwise
+        has_full = ~stints.groupby("Coach")["_interim"].transform("min").astype(bool)
+        stints = stints[~(has_full & stints["_interim"])]
+        stints = stints.drop_duplicates(["Coach", "_row"])
+
+        raw = pd.DataFrame(values[stints["_row"].to_numpy()], columns=list(FEATURES))
+        raw["Coach"] = stints["Coach"].to_numpy()
+        grouped = raw.groupby("Coach")
+        self.profiles = grouped[list(FEATURES)].mean()
+        self.seasons = grouped.size().rename("Seasons")
+        self._matrix = self._standardize(self.profiles.to_numpy())
+
+    def _standardize(self, values):
+        return (values - self._mean) / self._std
+
+    def coach_profile(self, coach):
+        """A coach's mean raw feature vector, or None without a profile."""
+        if coach not in self.profiles.index:
+            return None
+        return self.profiles.loc[coach]
+
+    def team_profile(self, team_id):
+        """The team's most recent season profile, or None if it has none."""
+        if team_id not in self.team_features.index.get_level_values("team_id"):
+            return None
+        return self.team_features.xs(team_id, level="team_id", drop_level=False).iloc[-1]
+
+    def nearest(self, profile, k=5, exclude=()):
+        """
+        Coaches whose profile is closest to profile.
+
+        Parameters
+        ----------
+        profile : pd.Series
+            Raw feature vector (coach_profile() or team_profile()).
+        k : int
+            Number of coaches to return.
+        exclude : iterable of str
+            Coaches to leave out (e.g. the coach being queried).
+
+        Returns
+        -------
+        pd.DataFrame
+            Coach, Similarity (0–100, 100 = identical profile), Seasons and
+            the raw feature columns, closest first.
+        """
+        query = self._standardize(profile[list(FEATURES)].to_numpy(dtype=float))
+        distances = np.sqrt(((self._matrix - query) ** 2).sum(axis=1))
+        mask = self.profiles.index.isin(list(exclude))
+        distances = np.where(mask, np.inf, distances)
+
+        k = min(k, int((~mask).sum()))
+        closest = np.argpartition(distances, k - 1)[:k] if k > 0 else np.array([], dtype=int)
+        closest = closest[np.argsort(distances[closest], kind="stable")]
+
+        result = self.profiles.iloc[closest].reset_index()
+        result.insert(1, "Similarity", (100 / (1 + distances[closest])).round(1))
+        result.insert(2, "Seasons", self.seasons.iloc[closest].to_numpy())
+        return result
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+from utils.teams import TEAM_ID_MAP
+
+# ------------------------------
+# Coaching Staff Index
+# ------------------------------
+
+# Coaching CSV "Coach Type" -> index column
+STAFF_ROLES = {
+    "Head Coach": "hc",
+    "Head coach": "hc",
+    "Offensive Coordinator": "oc",
+    "Interim Head Coach": "interim_hc",
+    "Interim Offensive Coordinator": "interim_oc",
+}
+
+ROLE_COLUMNS = ["hc", "oc", "interim_hc", "interim_oc"]
+STAFF_COLUMNS = ["hc", "oc", "interim_hc", "interim_oc", "play_caller", "label"]
+
+# Display names used by the views
+DISPLAY_NAMES = {
+    "hc": "HC",
+    "oc": "OC",
+    "interim_hc": "Interim HC",
+    "interim_oc": "Interim OC",
+    "play_caller": "Play Caller",
+    "label": "Coach Label",
+}
+
+
+def _join_names(names):
+    return ", ".join(sorted(set(names.dropna())))
+
+
+class CoachStaffIndex:
+    """
+    Season-level coaching staff for every (team, season), resolved once.
+
+    Built from the coaching data by the dataset store and shared by every
+    view, so resolving staff for a table or chart is a single vectorized
+    lookup instead of a scan of the coaching data per row.
+
+    Each (team, season) row holds:
+        hc, oc, interim_hc, interim_oc
+            Coach names; several coaches in one role are joined with ", ".
+        play_caller
+            The head coach when listed with play-calling duties, otherwise
+            the offensive coordinator, falling back to the head coach.
+        label
+            "HC: A (Interim: B), OC: C" summary for tooltips.
+    """
+
+    def __init__(self, coaching_df):
+        df = coaching_df[coaching_df["Coach Type"].isin(STAFF_ROLES)]
+        df = df.assign(
+            role=df["Coach Type"].astype(str).map(STAFF_ROLES),
+            team_abbr=df["Team Abbr"].astype(str),
+        )
+
+        staff = (
+            df.groupby(["Season", "team_abbr", "role"], observed=True)["Coach"]
+            .agg(_join_names)
+            .unstack("role")
+            .reindex(columns=ROLE_COLUMNS)
+        )
+        staff.index = staff.index.set_names(["season", "team_abbr"])
+
+        play_calling_hc = df[(df["role"] == "hc") & (df["Playing Calling Duties"] == "Yes")] \
+            .groupby(["Season", "team_abbr"], observed=True)["Coach"].agg(_join_names)
+        play_calling_hc.index = play_calling_hc.index.set_names(["season", "team_abbr"])
+        staff["play_caller"] = play_calling_hc.reindex(staff.index) \
+            .fillna(staff["oc"]).fillna(staff["hc"])
+
+        hc_label = ("HC: " + staff["hc"]).fillna("")
+        hc_label = hc_label.where(staff["interim_hc"].isna(), hc_label + " (Interim: " + staff["interim_hc"] + ")")
+        oc_label = ("OC: " + staff["oc"]).fillna("")
+        oc_label = oc_label.where(staff["interim_oc"].isna(), oc_label + " (Interim: " + staff["interim_oc"] + ")")
+        staff["label"] = np.where(
+            (hc_label != "") & (oc_label != ""), hc_label + ", " + oc_label, hc_label + oc_label
+        )
+
+        self.table = staff[STAFF_COLUMNS]
+        self._abbr_index = self.table.index
+        # Same rows keyed by stable team ID, for callers holding team_id columns
+        self._id_index = pd.MultiIndex.from_arrays([
+            self._abbr_index.get_level_values("season"),
+            self._abbr_index.get_level_values("team_abbr").map(TEAM_ID_MAP),
+        ])
+
+    def _positions(self, teams, seasons):
+        teams, seasons = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(teams, dtype=object)),
+            np.atleast_1d(np.asarray(seasons)),
+        )
+        teams = pd.Series(teams.tolist())
+        numeric = pd.api.types.is_numeric_dtype(teams)
+        index = self._id_index if numeric else self._abbr_index
+        keys = teams.astype(int) if numeric else teams.astype(str)
+        return index.get_indexer(pd.MultiIndex.from_arrays([seasons.astype(int), keys]))
+
+    def lookup(self, teams, seasons, columns=None, display=False, missing=None):
+        """
+        Staff for many (team, season) keys in one call.
+
+        Parameters
+        ----------
+        teams : str, int or array-like
+            Team abbreviations or team IDs; a single team is broadcast
+            against seasons.
+        seasons : int or array-like
+            One season for all teams, or one per team.
+        columns : list of str, optional
+            Subset of STAFF_COLUMNS (default: all).
+        display : bool
+            Rename columns to their display names ("HC", "Interim OC", ...).
+        missing : str, optional
+            Value for unknown keys and empty roles (default: NaN).
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per key, in input order, with a fresh RangeIndex.
+        """
+        columns = list(columns or STAFF_COLUMNS)
+        positions = self._positions(teams, seasons)
+        values = self.table[columns].to_numpy(dtype=object)
+        result = pd.DataFrame(
+            np.where(positions[:, None] >= 0, values[positions], None),
+            columns=columns,
+        )
+        if missing is not None:
+            result = result.fillna(missing)
+        return result.rename(columns=DISPLAY_NAMES) if display else result
+
+    def get(self, team, season):
+        """Staff for a single (team, season) as a dict; NaN for unknown roles."""
+        return self.lookup([team], season).iloc[0].to_dict()
+
+    def roles(self, teams, seasons):
+        """HC / OC / Interim HC / Interim OC display columns, "N/A" when unknown."""
+        return self.lookup(teams, seasons, columns=ROLE_COLUMNS, display=True, missing="N/A")
+
+    def labels(self, teams, seasons):
+        """Vectorized "HC: ..., OC: ..." labels for tooltips."""
+        return self.lookup(teams, seasons, columns=["label"], missing="")["label"]
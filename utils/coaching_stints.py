@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Week-Level Coaching Stints
+# ------------------------------
+
+# Coaching CSV "Coach Type" -> (role, interim)
+ROLE_TYPES = {
+    "Head Coach": ("hc", False),
+    "Head coach": ("hc", False),
+    "Interim Head Coach": ("hc", True),
+    "Offensive Coordinator": ("oc", False),
+    "Interim Offensive Coordinator": ("oc", True),
+}
+
+# Columns attach_coaching_stints() adds to weekly stats
+STINT_COLUMNS = ["hc", "oc", "play_caller", "hc_interim", "oc_interim"]
+
+POSTSEASON_WEEKS = 4
+
+
+def _week_bounds(coaching_df):
+    """
+    First and last week of every coaching row, and the season's final
+    regular-season week. Missing Coached From/To means the whole season.
+    """
+    seasons = coaching_df["Season"].to_numpy(dtype=int)
+    # Final regular-season week: 17 through 2020, 18 since the 17-game 2021 season
+    last_week = np.where(seasons <= 2020, 17, 18)
+    start = coaching_df["Coached From"].fillna(1).to_numpy(dtype=int)
+    end = coaching_df["Coached To"].fillna(pd.Series(last_week, index=coaching_df.index)).to_numpy(dtype=int)
+    return start, end, last_week
+
+
+def regular_season_weeks(coaching_df):
+    """
+    Number of regular-season weeks each coaching row covers.
+
+    Returns
+    -------
+    np.ndarray
+        One count per row of coaching_df.
+    """
+    start, end, last_week = _week_bounds(coaching_df)
+    return np.maximum(np.minimum(end, last_week) - start + 1, 0)
+
+
+def _expand_weeks(coaching_df):
+    """
+    One row per (season, team, role, week) a coach held the role.
+
+    Missing Coached From/To means the whole season. A range that runs to
+    the final regular-season week carries on through the playoffs.
+    """
+    df = coaching_df[coaching_df["Coach Type"].isin(ROLE_TYPES)]
+    roles = df["Coach Type"].astype(str).map(lambda t: ROLE_TYPES[t][0])
+    interim = df["Coach Type"].astype(str).map(lambda t: ROLE_TYPES[t][1])
+
+    seasons = df["Season"].to_numpy(dtype=int)
+    start, end, last_week = _week_bounds(df)
+    end = np.where(end >= last_week, last_week + POSTSEASON_WEEKS, end)
+
+    lengths = np.maximum(end - start + 1, 0)
+    rows = np.repeat(np.arange(len(df)), lengths)
+    # Week offsets within each repeated block: 0, 1, ... lengths-1
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    return pd.DataFrame({
+        "season": seasons[rows],
+        "week": start[rows] + offsets,
+        "team_id": df["Team ID"].to_numpy()[rows],
+        "team_abbr": df["Team Abbr"].astype(str).to_numpy()[rows],
+        "role": roles.to_numpy()[rows],
+        "interim": interim.to_numpy()[rows],
+        "coach": df["Coach"].to_numpy()[rows],
+        "start": start[rows],
+        "calls_plays": (df["Playing Calling Duties"] == "Yes").to_numpy()[rows],
+    })
+
+
+def build_coaching_stints(coaching_df):
+    """
+    Resolve who held each role for every (season, week, team).
+
+    When ranges overlap (a fired coach and the interim replacement, or two
+    listed coordinators), the stint that started latest wins, so an interim
+    is credited only from the week they took over.
+
+    Parameters
+    ----------
+    coaching_df : pd.DataFrame
+        Coaching data as returned by load_coaching_data().
+
+    Returns
+    -------
+    pd.DataFrame
+        season, week, team_id, team_abbr, hc, oc, play_caller,
+        hc_interim, oc_interim. play_caller is the head coach when the head
+        coach has play-calling duties, otherwise the offensive coordinator
+        (or the head coach if there is none).
+    """
+    weeks = _expand_weeks(coaching_df)
+    keys = ["season", "week", "team_id"]
+    current = (
+        weeks.sort_values(keys + ["role", "start"], kind="stable")
+        .drop_duplicates(keys + ["role"], keep="last")
+    )
+
+    hc = current[current["role"] == "hc"].set_index(keys)
+    oc = current[current["role"] == "oc"].set_index(keys)
+    stints = pd.DataFrame({
+        "team_abbr": hc["team_abbr"].combine_first(oc["team_abbr"]),
+        "hc": hc["coach"],
+        "oc": oc["coach"],
+        "hc_interim": hc["interim"],
+        "oc_interim": oc["interim"],
+        "hc_calls_plays": hc["calls_plays"],
+    })
+    stints["hc_calls_plays"] = stints["hc_calls_plays"].fillna(False).astype(bool)
+    stints["play_caller"] = stints["oc"].where(~stints["hc_calls_plays"] & stints["oc"].notna(), stints["hc"])
+    stints["hc_interim"] = stints["hc_interim"].fillna(False).astype(bool)
+    stints["oc_interim"] = stints["oc_interim"].fillna(False).astype(bool)
+
+    columns = ["team_abbr", "hc", "oc", "play_caller", "hc_interim", "oc_interim"]
+    return stints[columns].reset_index().sort_values(keys, ignore_index=True)
+
+
+def attach_coaching_stints(weekly_stats, stints):
+    """
+    Add the week's head coach, offensive coordinator and play-caller to
+    every weekly stats row, matched on (season, week, team_id).
+
+    Returns
+    -------
+    pd.DataFrame
+        weekly_stats with STINT_COLUMNS added (replaced if already present)
+    """
+    keys = ["season", "week", "team_id"]
+    lookup = stints[keys + STINT_COLUMNS].astype({col: "int64" for col in keys})
+    weekly_stats = weekly_stats.drop(columns=[c for c in STINT_COLUMNS if c in weekly_stats.columns])
+    attached = weekly_stats.astype({col: "int64" for col in keys}).merge(lookup, on=keys, how="left")
+    # Keep the original key dtypes (compact int8/int16 after apply_schema)
+    return attached.astype({col: weekly_stats[col].dtype for col in keys})
@@ -1,64 +1,406 @@
+import os
+import threading
+
 import pandas as pd
+import streamlit as st
+
+from utils.aggregates import AGGREGATES, AGGREGATES_DIR, WEEKLY_AGGREGATES
+from utils.coach_careers import CoachCareerIndex
+from utils.coach_similarity import CoachSimilarityIndex
+from utils.coach_staff import CoachStaffIndex
+from utils.coaching_stints import STINT_COLUMNS, attach_coaching_stints, build_coaching_stints
+from utils.draft_board import BOARD_DATASETS, DraftBoardIndex
+from utils.parquet_io import WEEKLY_STATS_DIR, has_snapshot, read_parquet, read_snapshot
+from utils.player_index import PLAYER_INDEX_DATASETS, PlayerIndex
+from utils.rank_index import RankIndex
+from utils.readonly import enable_copy_on_write, freeze, share
+from utils.schema import apply_schema
+from utils.scoring import SCORING_DATASETS, ScoringEngine
+from utils.search_index import SearchIndex
+from utils.teams import TEAM_ABBR_MAP, normalize_teams
 
 # ------------------------------
 # Load Season & Weekly Stats
 # ------------------------------
 
-def load_season_stats(level="season"):
+def _as_list(value):
+    """Wrap a scalar filter value in a list; pass lists/tuples/sets through."""
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _parquet_filters(season=None, player_id=None, position=None, team=None):
+    """
+    Build pyarrow row filters from keyword arguments.
+
+    Each argument accepts a single value or a list of values. Team filters
+    also match the legacy abbreviations of the same franchise, so they work
+    against files built before team normalization.
+    """
+    filters = []
+    if season is not None:
+        filters.append(("season", "in", [int(s) for s in _as_list(season)]))
+    if player_id is not None:
+        filters.append(("player_id", "in", _as_list(player_id)))
+    if position is not None:
+        filters.append(("position", "in", _as_list(position)))
+    if team is not None:
+        teams = set(_as_list(team))
+        teams |= {old for old, new in TEAM_ABBR_MAP.items() if new in teams}
+        filters.append(("recent_team", "in", sorted(teams)))
+    return filters or None
+
+
+def load_season_stats(level="season", columns=None, season=None, player_id=None, position=None, team=None,
+                      use_snapshot=True):
     """
     Load aggregated season stats or weekly stats from parquet files.
 
+    Column selection and row filters are pushed down into the parquet
+    reader: unrequested columns are never decoded and row groups whose
+    statistics rule out a match are skipped entirely. Weekly stats are
+    read from the season-partitioned layout (data/weekly_stats/) when it
+    exists, so season filters also skip whole partitions. If an Arrow
+    snapshot has been exported (generate_data_files.py --snapshot), it is
+    memory-mapped instead and shared with every other server process.
+
     Parameters
     ----------
     level : str
         "season" -> returns aggregated season stats
         "weekly" -> returns weekly stats
+    columns : list of str, optional
+        Only read these columns (default: all)
+    season, player_id, position, team : scalar or list, optional
+        Only return rows matching these values (default: no filter)
+    use_snapshot : bool
+        Read from the Arrow snapshot when one exists (default: True)
 
     Returns
     -------
     pd.DataFrame
     """
     if level == "season":
+        table_name = "season_stats"
         file_path = "data/season_stats.parquet"
     elif level == "weekly":
-        file_path = "data/weekly_stats.parquet"
+        table_name = "weekly_stats"
+        # Prefer the season-partitioned layout; fall back to the flat file
+        if os.path.isdir(WEEKLY_STATS_DIR):
+            file_path = WEEKLY_STATS_DIR
+        else:
+            file_path = "data/weekly_stats.parquet"
     else:
         raise ValueError("Invalid level. Choose 'season' or 'weekly'.")
 
-    return pd.read_parquet(file_path)
+    filters = _parquet_filters(season=season, player_id=player_id, position=position, team=team)
+
+    if use_snapshot and has_snapshot(table_name):
+        df = read_snapshot(table_name, columns=columns, filters=filters)
+    else:
+        df = read_parquet(file_path, columns=columns, filters=filters)
+
+    # Files built before team normalization moved into the build still carry
+    # legacy abbreviations; this is a no-op for current files.
+    if "recent_team" in df.columns:
+        id_col = "team_id" if "team_id" in df.columns else None
+        df = normalize_teams(df, "recent_team", id_col)
+    return apply_schema(df, table_name)
 
 
 # ------------------------------
 # Load Coaching Data (CSV)
 # ------------------------------
 
-def load_coaching_data():
+def load_coaching_data(columns=None):
     """
     Load NFL coaching data (historical) from CSV.
+
+    Team abbreviations and IDs are normalized to the canonical franchise
+    dimension (utils/teams.py).
     """
     file_path = "utils/nfl_coaching_data - Coaching Staff.csv"
-    return pd.read_csv(file_path).drop_duplicates()
+    coaching_df = normalize_teams(pd.read_csv(file_path), "Team Abbr", "Team ID").drop_duplicates()
+    coaching_df = apply_schema(coaching_df, "coaching")
+    return coaching_df if columns is None else coaching_df[columns]
+
+
+# ------------------------------
+# Load Coaching Stints
+# ------------------------------
+
+def load_coaching_stints(columns=None):
+    """
+    Load the week-level (season, week, team) -> HC/OC/play-caller table
+    built from the coaching CSV's Coached From/To weeks.
+    """
+    file_path = "data/coaching_stints.parquet"
+    if os.path.exists(file_path):
+        df = pd.read_parquet(file_path, columns=columns)
+    else:
+        df = build_coaching_stints(load_coaching_data())
+        df = df if columns is None else df[columns]
+    return apply_schema(df, "coaching_stints")
 
 
 # ------------------------------
 # Load Active Rosters
 # ------------------------------
 
-def load_active_rosters():
+def load_active_rosters(columns=None):
     """
     Load active NFL rosters from parquet.
     """
     file_path = "data/active_rosters.parquet"
-    return pd.read_parquet(file_path)
+    df = pd.read_parquet(file_path, columns=columns)
+    if "team" in df.columns:
+        df = normalize_teams(df, "team")
+    return apply_schema(df, "active_rosters")
 
 
 # ------------------------------
 # Load Active Contracts
 # ------------------------------
 
-def load_active_contracts():
+def load_active_contracts(columns=None):
     """
     Load active NFL contracts from parquet.
     """
     file_path = "data/active_contracts.parquet"
-    return pd.read_parquet(file_path)
+    return apply_schema(pd.read_parquet(file_path, columns=columns), "active_contracts")
+
+
+# ------------------------------
+# Load Materialized Aggregates
+# ------------------------------
+
+def load_aggregate(name, columns=None, season=None, position=None, team=None):
+    """
+    Load a materialized aggregate table built by generate_data_files.py.
+
+    Parameters
+    ----------
+    name : str
+        Key in utils.aggregates.AGGREGATES ("team_season_totals",
+        "team_position_totals", "player_ranks", "position_cutoffs") or WEEKLY_AGGREGATES
+        ("coach_stint_stats").
+    columns : list of str, optional
+        Only read these columns (default: all)
+    season, position, team : scalar or list, optional
+        Only return rows matching these values (default: no filter)
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if name not in AGGREGATES and name not in WEEKLY_AGGREGATES:
+        known = sorted([*AGGREGATES, *WEEKLY_AGGREGATES])
+        raise ValueError(f"Unknown aggregate '{name}'. Choose from {known}.")
+    filters = _parquet_filters(season=season, position=position, team=team)
+    # Weekly aggregates are season-partitioned directories
+    file_path = os.path.join(AGGREGATES_DIR, name if name in WEEKLY_AGGREGATES else f"{name}.parquet")
+    if os.path.exists(file_path):
+        df = read_parquet(file_path, columns=columns, filters=filters)
+    else:
+        # Data built before aggregates were materialized: derive on the fly
+        if name in AGGREGATES:
+            df = AGGREGATES[name](load_season_stats(level="season", use_snapshot=False))
+        else:
+            weekly = load_season_stats(level="weekly", season=season, use_snapshot=False)
+            if not set(STINT_COLUMNS) <= set(weekly.columns):
+                weekly = attach_coaching_stints(weekly, load_coaching_stints())
+            df = WEEKLY_AGGREGATES[name](weekly)
+        if filters:
+            for col, _, values in filters:
+                df = df[df[col].isin(values)]
+        if columns is not None:
+            df = df[columns]
+    return apply_schema(df.reset_index(drop=True), name)
+
+
+# ------------------------------
+# Dataset Registry
+# ------------------------------
+
+# Every dataset the app can load, keyed by name. Each loader reads the
+# source files and accepts an optional list of columns to read.
+DATASETS = {
+    "coaching": load_coaching_data,
+    "coaching_stints": load_coaching_stints,
+    "season_stats": lambda columns=None: load_season_stats(level="season", columns=columns, use_snapshot=False),
+    "weekly_stats": lambda columns=None: load_season_stats(level="weekly", columns=columns, use_snapshot=False),
+    "active_rosters": load_active_rosters,
+    "active_contracts": load_active_contracts,
+    **{
+        name: (lambda columns=None, name=name: load_aggregate(name, columns=columns))
+        for name in [*AGGREGATES, *WEEKLY_AGGREGATES]
+    },
+}
+
+
+def load_dataset(name, columns=None):
+    """
+    Load a registered dataset, preferring its memory-mapped Arrow snapshot.
+
+    Parameters
+    ----------
+    name : str
+        Key in DATASETS.
+    columns : list of str, optional
+        Only load these columns (default: all).
+    """
+    if name not in DATASETS:
+        raise ValueError(f"Unknown dataset '{name}'. Choose from {sorted(DATASETS)}.")
+    if has_snapshot(name):
+        return read_snapshot(name, columns=columns)
+    return DATASETS[name](columns=columns)
+
+
+# Index name -> (builder, {dataset name: columns}). Builders receive the
+# declared datasets positionally, like the views do.
+INDEXES = {
+    "coach_staff": (CoachStaffIndex, {"coaching": None}),
+    "league_ranks": (RankIndex, {"player_ranks": None}),
+    "coach_careers": (CoachCareerIndex, {"coaching": None, "season_stats": None}),
+    "coach_similarity": (CoachSimilarityIndex, {"coaching": None, "season_stats": None}),
+    "players": (PlayerIndex, PLAYER_INDEX_DATASETS),
+    "search": (SearchIndex, {"coaching": None, "active_rosters": PLAYER_INDEX_DATASETS["active_rosters"]}),
+    "scoring": (ScoringEngine, SCORING_DATASETS),
+    "draft_board": (DraftBoardIndex, BOARD_DATASETS),
+}
+
+
+# ------------------------------
+# Shared Dataset Store
+# ------------------------------
+
+class DatasetStore:
+    """
+    Process-wide, lazily filled container holding one copy of each dataset.
+
+    Built once per server process by get_dataset_store() and shared by
+    every session and rerun. Nothing is read until a view first asks for
+    it, and only the columns views have asked for are kept in memory, so
+    a session that never opens Player View never loads weekly stats.
+
+    Each access hands out a Copy-on-Write view of the shared frame (or
+    the read-only frame itself in guard mode), so a view can never modify
+    what other sessions see.
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._complete = set()
+        self._indexes = {}
+        self._index_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, name, columns=None):
+        """
+        Return a read-only handle to the named dataset.
+
+        Parameters
+        ----------
+        name : str
+            Key in DATASETS.
+        columns : list of str, optional
+            Columns the caller needs (default: all). Columns not yet in
+            memory are read from disk and kept for later callers.
+        """
+        with self._lock:
+            frame = self._frames.get(name)
+            if columns is None:
+                if name not in self._complete:
+                    self._frames[name] = freeze(load_dataset(name))
+                    self._complete.add(name)
+            elif frame is None:
+                self._frames[name] = freeze(load_dataset(name, columns=list(columns)))
+            else:
+                missing = [c for c in columns if c not in frame.columns]
+                if missing:
+                    # Same file, same row order: new columns line up with the cached ones
+                    extra = load_dataset(name, columns=missing).set_axis(frame.index)
+                    self._frames[name] = freeze(pd.concat([frame, extra], axis=1))
+            frame = self._frames[name]
+
+        if columns is not None:
+            frame = freeze(frame[list(columns)])
+        return share(frame)
+
+    def get_many(self, datasets):
+        """
+        Return the frames a view declares, in declaration order.
+
+        Parameters
+        ----------
+        datasets : dict
+            {dataset name: list of columns, or None for all columns}
+        """
+        return [self.get(name, columns) for name, columns in datasets.items()]
+
+    def index(self, name):
+        """
+        Return the named lookup index, building it on first use.
+
+        Indexes are derived from datasets that never change while the
+        process runs, so each is built once and shared by every session.
+        Sessions asking for an index while it is being built wait for that
+        build instead of starting their own.
+
+        Parameters
+        ----------
+        name : str
+            Key in INDEXES.
+        """
+        if name not in INDEXES:
+            raise ValueError(f"Unknown index '{name}'. Choose from {sorted(INDEXES)}.")
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+
+        # One lock per index: the build reads datasets through get(), which
+        # takes the store lock, and other indexes can build meanwhile
+        with self._lock:
+            build_lock = self._index_locks.setdefault(name, threading.Lock())
+        with build_lock:
+            index = self._indexes.get(name)
+            if index is None:
+                build, datasets = INDEXES[name]
+                index = build(*self.get_many(datasets))
+                self._indexes[name] = index
+        return index
+
+    @property
+    def coaching(self):
+        return self.get("coaching")
+
+    @property
+    def season_stats(self):
+        return self.get("season_stats")
+
+    @property
+    def weekly_stats(self):
+        return self.get("weekly_stats")
+
+    @property
+    def active_rosters(self):
+        return self.get("active_rosters")
+
+    @property
+    def active_contracts(self):
+        return self.get("active_contracts")
+
+
+@st.cache_resource
+def get_dataset_store():
+    """
+    Return the shared DatasetStore.
+
+    st.cache_resource hands every session the same object (no pickling or
+    per-session copies), unlike st.cache_data. Datasets load on first use.
+    Copy-on-Write is switched on first, since every frame the store hands
+    out is shared.
+    """
+    enable_copy_on_write()
+    return DatasetStore()
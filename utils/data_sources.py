@@ -0,0 +1,141 @@
+import os
+
+import pandas as pd
+
+from utils.parquet_io import read_parquet
+
+# ------------------------------
+# Build Data Sources
+# ------------------------------
+
+# Raw datasets the build can fetch -> nfl_data_py import function
+NFL_IMPORTS = {
+    "weekly": "import_weekly_data",
+}
+
+RAW_CACHE_DIR = "data/raw_cache"
+FIXTURE_DIR = "data/fixtures"
+
+
+class DataSource:
+    """
+    Where the build gets raw upstream data from.
+
+    fetch(dataset, seasons) returns the raw rows for those seasons, exactly
+    as nfl_data_py would, so the build stages never know which source ran.
+    """
+
+    name = "base"
+
+    def fetch(self, dataset, seasons):
+        raise NotImplementedError
+
+    def invalidate(self, dataset, seasons):
+        """Forget any stored copy of these seasons. No-op for uncached sources."""
+
+
+class NflDataPySource(DataSource):
+    """
+    Live download through nfl_data_py. The only source that needs the network.
+    """
+
+    name = "live"
+
+    def fetch(self, dataset, seasons):
+        # Imported here so offline builds from the cache or fixtures don't need it
+        import nfl_data_py as nfl
+
+        if dataset not in NFL_IMPORTS:
+            raise ValueError(f"Unknown dataset {dataset!r}; expected one of {sorted(NFL_IMPORTS)}")
+        return getattr(nfl, NFL_IMPORTS[dataset])(list(seasons))
+
+
+class RawCacheSource(DataSource):
+    """
+    On-disk cache of raw downloads in front of another source.
+
+    Each (dataset, season) is stored as root/dataset/season=YYYY.parquet.
+    Seasons already cached are read from disk; the rest are fetched from
+    upstream in one call and cached before being returned.
+    """
+
+    name = "cache"
+
+    def __init__(self, upstream=None, root=RAW_CACHE_DIR):
+        self.upstream = upstream or NflDataPySource()
+        self.root = root
+
+    def path(self, dataset, season):
+        return os.path.join(self.root, dataset, f"season={int(season)}.parquet")
+
+    def fetch(self, dataset, seasons):
+        seasons = sorted(int(season) for season in seasons)
+        missing = [season for season in seasons if not os.path.exists(self.path(dataset, season))]
+        if missing:
+            fetched = self.upstream.fetch(dataset, missing)
+            os.makedirs(os.path.join(self.root, dataset), exist_ok=True)
+            for season in missing:
+                season_df = fetched[fetched["season"] == season]
+                # Written to a temp path and renamed so an interrupted build
+                # never leaves a truncated season behind
+                tmp_path = self.path(dataset, season) + ".tmp"
+                season_df.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, self.path(dataset, season))
+
+        frames = [pd.read_parquet(self.path(dataset, season)) for season in seasons]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def invalidate(self, dataset, seasons):
+        for season in seasons:
+            path = self.path(dataset, season)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class FixtureSource(DataSource):
+    """
+    Local parquet fixtures, one file or season-partitioned directory per
+    dataset (root/weekly.parquet or root/weekly/). Never touches the network,
+    so the pipeline can be built and benchmarked offline.
+    """
+
+    name = "fixture"
+
+    def __init__(self, root=FIXTURE_DIR, paths=None):
+        self.root = root
+        self.paths = paths or {}
+
+    def path(self, dataset):
+        if dataset in self.paths:
+            return self.paths[dataset]
+        directory = os.path.join(self.root, dataset)
+        return directory if os.path.isdir(directory) else directory + ".parquet"
+
+    def fetch(self, dataset, seasons):
+        path = self.path(dataset)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No fixture for {dataset!r} at {path}")
+        return read_parquet(path, filters=[("season", "in", [int(s) for s in seasons])])
+
+
+def get_source(name, fixture_root=FIXTURE_DIR, cache_root=RAW_CACHE_DIR):
+    """
+    Build a data source by name.
+
+    Parameters
+    ----------
+    name : str
+        "live" (nfl_data_py), "cache" (raw cache in front of nfl_data_py)
+        or "fixture" (local files only).
+
+    Returns
+    -------
+    DataSource
+    """
+    if name == "live":
+        return NflDataPySource()
+    if name == "cache":
+        return RawCacheSource(NflDataPySource(), root=cache_root)
+    if name == "fixture":
+        return FixtureSource(root=fixture_root)
+    raise ValueError(f"Unknown source {name!r}; expected 'live', 'cache' or 'fixture'")
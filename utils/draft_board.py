@@ -0,0 +1,229 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.readonly import freeze, share
+from utils.scoring import BUILT_IN_SCORING, LEAGUE_POINTS, rules_key
+
+# ------------------------------
+# Value-Over-Replacement Draft Board
+# ------------------------------
+
+DRAFT_POSITIONS = ["QB", "RB", "WR", "TE"]
+FLEX_POSITIONS = ["RB", "WR", "TE"]
+
+# Starting lineup per team; "baselines" overrides the replacement rank of
+# a position (e.g. {"QB": 15}) instead of deriving it from the lineup
+DEFAULT_LEAGUE_SETTINGS = {
+    "teams": 12,
+    "starters": {"QB": 1, "RB": 2, "WR": 2, "TE": 1},
+    "flex": 1,
+    "baselines": {},
+}
+
+# Datasets (and columns) the board index holds, in the order DraftBoardIndex takes them
+BOARD_DATASETS = {
+    "season_stats": [
+        "season", "player_id", "player_display_name", "recent_team", "position",
+        "games_played", "fantasy_points", "fantasy_points_ppr",
+    ],
+    "active_rosters": ["player_id", "player_name", "team", "position"],
+}
+
+# (scoring, league settings) boards kept (least recently used dropped first)
+BOARD_CACHE_SIZE = 32
+
+
+def settings_key(settings):
+    """Hashable form of league settings, for caching boards."""
+    return (
+        int(settings["season"]),
+        int(settings["teams"]),
+        tuple(int(settings["starters"].get(pos, 0)) for pos in DRAFT_POSITIONS),
+        int(settings.get("flex", 0)),
+        tuple(int(settings.get("baselines", {}).get(pos) or 0) for pos in DRAFT_POSITIONS),
+    )
+
+
+def replacement_ranks(points_by_position, settings):
+    """
+    The replacement rank of each position: the last player a league of
+    this size would start.
+
+    Every team starts settings["starters"][pos] players at each position;
+    flex spots go to the best RB/WR/TE left once those starters are taken.
+    A position listed in settings["baselines"] uses that rank instead. A
+    position nobody has to start is replaced by its best player (rank 1),
+    so none of its players has positive value.
+
+    Parameters
+    ----------
+    points_by_position : dict
+        {position: np.ndarray of points, best first}
+    settings : dict
+        League settings (see DEFAULT_LEAGUE_SETTINGS).
+
+    Returns
+    -------
+    dict
+        {position: 1-based replacement rank}
+    """
+    teams = int(settings["teams"])
+    ranks = {pos: teams * int(settings["starters"].get(pos, 0)) for pos in DRAFT_POSITIONS}
+
+    flex_spots = teams * int(settings.get("flex", 0))
+    if flex_spots:
+        leftover = [points_by_position.get(pos, np.array([]))[ranks[pos]:] for pos in FLEX_POSITIONS]
+        labels = np.repeat(np.arange(len(FLEX_POSITIONS)), [len(points) for points in leftover])
+        best = np.argsort(-np.concatenate(leftover), kind="stable")[:flex_spots]
+        for i, extra in enumerate(np.bincount(labels[best], minlength=len(FLEX_POSITIONS))):
+            ranks[FLEX_POSITIONS[i]] += int(extra)
+
+    for pos, rank in settings.get("baselines", {}).items():
+        if rank:
+            ranks[pos] = int(rank)
+    return {pos: max(rank, 1) for pos, rank in ranks.items()}
+
+
+def assign_tiers(board, value_col="VOR", by="position"):
+    """
+    Tier number per row: within each position (board sorted best first), a
+    new tier starts wherever the drop from the previous player is larger
+    than the mean plus one standard deviation of the position's drops among
+    players above replacement.
+    """
+    gaps = -board.groupby(by, sort=False)[value_col].diff().fillna(0)
+    draftable_gaps = gaps.where(board[value_col] > 0)
+    grouped = draftable_gaps.groupby(board[by], sort=False)
+    threshold = (grouped.transform("mean") + grouped.transform("std")).fillna(np.inf)
+    breaks = (gaps > threshold).astype(int)
+    return breaks.groupby(board[by], sort=False).cumsum() + 1
+
+
+class DraftBoardIndex:
+    """
+    Value-based drafting (VBD) boards for any scoring and league settings.
+
+    A player's value is their points in a basis season minus the points of
+    their position's replacement player (replacement_ranks()), so a QB and
+    a WR can be ranked on one board. Player seasons are grouped once (a
+    player traded mid-season has one season_stats row per team), so a new
+    board is one bincount plus a per-position sort. Boards are kept in a
+    small LRU cache keyed by (scoring, league settings) and shared by all
+    sessions, so regenerating a board while settings change only computes
+    settings not seen before.
+    """
+
+    def __init__(self, season_stats, active_rosters):
+        self._rows = season_stats.reset_index(drop=True)
+        keys = pd.MultiIndex.from_arrays([
+            self._rows["season"].to_numpy(dtype=int),
+            self._rows["player_id"].astype(str).to_numpy(),
+        ])
+        self._codes, player_seasons = keys.factorize()
+        games = np.bincount(self._codes, weights=self._rows["games_played"].to_numpy(dtype=float))
+
+        # Team a player spent most of the season with
+        main_team = (
+            self._rows.assign(_code=self._codes)
+            .sort_values(["_code", "games_played"], ascending=[True, False], kind="stable")
+            .drop_duplicates("_code")
+            .set_index("_code")
+        )
+        self.players = pd.DataFrame({
+            "season": player_seasons.get_level_values(0),
+            "player_id": player_seasons.get_level_values(1),
+            "Player": main_team["player_display_name"].astype(str).to_numpy(),
+            "position": main_team["position"].astype(str).to_numpy(),
+            "Team": main_team["recent_team"].astype(str).to_numpy(),
+            "Games": games.astype(int),
+        })
+        self.seasons = sorted(self.players["season"].unique().tolist(), reverse=True)
+
+        rosters = active_rosters[active_rosters["position"].isin(DRAFT_POSITIONS)]
+        self._rosters = pd.DataFrame({
+            "player_id": rosters["player_id"].astype(str).to_numpy(),
+            "Player": rosters["player_name"].astype(str).to_numpy(),
+            "Team": rosters["team"].astype(str).to_numpy(),
+        })
+
+        self._boards = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _points(self, scoring, league):
+        if league is not None:
+            return league.rescore(self._rows)[LEAGUE_POINTS].fillna(0).to_numpy(dtype=float)
+        return self._rows[BUILT_IN_SCORING[scoring]].to_numpy(dtype=float)
+
+    def board(self, settings, scoring="ppr", league=None):
+        """
+        The draft board for one scoring format and league settings.
+
+        Parameters
+        ----------
+        settings : dict
+            DEFAULT_LEAGUE_SETTINGS plus "season", the season whose points
+            value players.
+        scoring : str
+            "std" or "ppr", when league is None.
+        league : LeagueScores, optional
+            Custom rule set to score players with.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rank, Player, position, Team, Games, Points, PPG, Pos Rank,
+            Baseline (replacement points), VOR and Tier, best VOR first.
+            Read-only: derive a new frame before adding columns.
+        """
+        key = (rules_key(league.rules if league is not None else scoring), settings_key(settings))
+        with self._lock:
+            board = self._boards.get(key)
+            if board is not None:
+                self._boards.move_to_end(key)
+                return share(board)
+
+        points = np.bincount(self._codes, weights=self._points(scoring, league), minlength=len(self.players))
+        players = self.players.assign(Points=points.round(2))
+        players = players[(players["season"] == settings["season"]) & players["position"].isin(DRAFT_POSITIONS)]
+        players = players.sort_values(["position", "Points"], ascending=[True, False], kind="stable")
+        players["Pos Rank"] = players.groupby("position", sort=False).cumcount() + 1
+
+        # Replacement points: the player at each position's replacement rank
+        # (or the last player, in a position with fewer)
+        by_position = {pos: group.to_numpy() for pos, group in players.groupby("position", sort=False)["Points"]}
+        ranks = replacement_ranks(by_position, settings)
+        baselines = {
+            pos: float(pos_points[min(ranks[pos], len(pos_points)) - 1]) if len(pos_points) else 0.0
+            for pos, pos_points in by_position.items()
+        }
+        players["Baseline"] = players["position"].map(baselines).astype(float)
+        players["VOR"] = (players["Points"] - players["Baseline"]).round(2)
+        players["PPG"] = (players["Points"] / players["Games"].where(players["Games"] > 0)).round(2)
+        players["Tier"] = assign_tiers(players)
+
+        board = players.sort_values(["VOR", "Points"], ascending=False, kind="stable").reset_index(drop=True)
+        board.insert(0, "Rank", np.arange(1, len(board) + 1))
+        columns = ["Rank", "player_id", "Player", "position", "Team", "Games", "Points", "PPG",
+                   "Pos Rank", "Baseline", "VOR", "Tier"]
+        board = freeze(board[columns])
+
+        with self._lock:
+            board = self._boards.setdefault(key, board)
+            self._boards.move_to_end(key)
+            while len(self._boards) > BOARD_CACHE_SIZE:
+                self._boards.popitem(last=False)
+        return share(board)
+
+    def draft_pool(self, settings, scoring="ppr", league=None):
+        """
+        The players available to draft: board() rows of players on an active
+        roster, under their current name and team. Players without a line in
+        the basis season (rookies, players who missed it) have no value to
+        rank them by and are left out.
+        """
+        board = self.board(settings, scoring=scoring, league=league)
+        pool = board.drop(columns=["Player", "Team"]).merge(self._rosters, on="player_id", how="inner")
+        return pool[board.columns].sort_values("Rank", kind="stable").reset_index(drop=True)
@@ -0,0 +1,202 @@
+import heapq
+from itertools import islice
+
+import numpy as np
+
+from utils.draft_board import DRAFT_POSITIONS, FLEX_POSITIONS, settings_key
+
+# ------------------------------
+# Live Draft
+# ------------------------------
+
+# Weight on a player's value by what they would fill on the roster of the
+# team on the clock: an open starting spot, an open flex spot, or the bench.
+# A flex fill ranks below an open starting spot, because the flex can still
+# go to any RB/WR/TE later. Negative values are divided by the weight
+# instead, so a smaller weight always ranks a player lower and never
+# reorders a position.
+ROSTER_NEED_WEIGHTS = {"starter": 1.0, "flex": 0.8, "bench": 0.5}
+
+DEFAULT_ROUNDS = 15
+
+
+class LiveDraft:
+    """
+    State of one snake draft over a draft pool (DraftBoardIndex.draft_pool).
+
+    Each position's pool rows are held best VOR first, with an availability
+    flag per row and a head pointer to each position's best undrafted
+    player. A pick clears one flag and moves that position's head past
+    drafted rows, so registering it never re-sorts or re-filters the pool.
+    Roster-need weights are constant within a position, so the need-weighted
+    best-available list is a k-way heap merge of the position heads and
+    costs O(limit), not O(pool).
+    """
+
+    def __init__(self, pool, settings, rounds=DEFAULT_ROUNDS):
+        self.pool = pool.reset_index(drop=True)
+        self.settings = settings
+        self.settings_key = settings_key(settings)
+        self.teams = int(settings["teams"])
+        self.rounds = int(rounds)
+
+        vor = self.pool["VOR"].to_numpy(dtype=float)
+        positions = self.pool["position"].astype(str).to_numpy()
+        self._position_col = {pos: i for i, pos in enumerate(DRAFT_POSITIONS)}
+        self._position_codes = np.array([self._position_col[pos] for pos in positions], dtype=int)
+
+        # Pool rows of each position, best VOR first, and each row's place there
+        order = np.lexsort((-vor, self._position_codes))
+        self._order = {}
+        self._place = np.empty(len(self.pool), dtype=int)
+        for pos, code in self._position_col.items():
+            rows = order[self._position_codes[order] == code]
+            self._order[pos] = rows.tolist()
+            self._place[rows] = np.arange(len(rows))
+        self._head = dict.fromkeys(DRAFT_POSITIONS, 0)
+        self._vor = vor.tolist()
+        self._available = [True] * len(self.pool)
+        self._rows = {player_id: row for row, player_id in enumerate(self.pool["player_id"].astype(str))}
+
+        # Players drafted per team and position
+        self._counts = np.zeros((self.teams, len(DRAFT_POSITIONS)), dtype=int)
+        self.picks = []
+
+    # ------------------------------
+    # Draft order
+    # ------------------------------
+    @property
+    def total_picks(self):
+        return self.teams * self.rounds
+
+    @property
+    def complete(self):
+        return len(self.picks) >= self.total_picks
+
+    def team_for_pick(self, pick):
+        """0-based team making a 0-based overall pick (snake order)."""
+        draft_round, slot = divmod(pick, self.teams)
+        return slot if draft_round % 2 == 0 else self.teams - 1 - slot
+
+    def on_the_clock(self):
+        """(round, pick in round, team), all 1-based, or None once the draft is complete."""
+        if self.complete:
+            return None
+        draft_round, slot = divmod(len(self.picks), self.teams)
+        return draft_round + 1, slot + 1, self.team_for_pick(len(self.picks)) + 1
+
+    # ------------------------------
+    # Picks
+    # ------------------------------
+    def _advance(self, pos):
+        rows = self._order[pos]
+        head = self._head[pos]
+        while head < len(rows) and not self._available[rows[head]]:
+            head += 1
+        self._head[pos] = head
+
+    def pick(self, player_id):
+        """Draft a player for the team on the clock."""
+        if self.complete:
+            raise ValueError("The draft is complete.")
+        row = self._rows.get(str(player_id))
+        if row is None:
+            raise ValueError(f"Player '{player_id}' is not in the draft pool.")
+        if not self._available[row]:
+            raise ValueError(f"{self.pool['Player'].iat[row]} has already been drafted.")
+
+        team = self.team_for_pick(len(self.picks))
+        self._available[row] = False
+        self._counts[team, self._position_codes[row]] += 1
+        self.picks.append((team, row))
+        self._advance(DRAFT_POSITIONS[self._position_codes[row]])
+
+    def undo(self):
+        """Return the most recent pick to the pool."""
+        if not self.picks:
+            return
+        team, row = self.picks.pop()
+        pos = DRAFT_POSITIONS[self._position_codes[row]]
+        self._available[row] = True
+        self._counts[team, self._position_codes[row]] -= 1
+        self._head[pos] = min(self._head[pos], self._place[row])
+
+    # ------------------------------
+    # Rankings
+    # ------------------------------
+    def needs(self, team):
+        """{position: "starter", "flex" or "bench"}: what the team's next player there would fill."""
+        counts = dict(zip(DRAFT_POSITIONS, self._counts[team]))
+        starters = self.settings["starters"]
+        flex_used = sum(max(counts[pos] - int(starters.get(pos, 0)), 0) for pos in FLEX_POSITIONS)
+        flex_open = int(self.settings.get("flex", 0)) - flex_used > 0
+        return {
+            pos: "starter" if counts[pos] < int(starters.get(pos, 0))
+            else "flex" if pos in FLEX_POSITIONS and flex_open
+            else "bench"
+            for pos in DRAFT_POSITIONS
+        }
+
+    def _ranked(self, pos, weight):
+        """(negated need-weighted VOR, row) of a position's undrafted rows, best first."""
+        rows = self._order[pos]
+        for place in range(self._head[pos], len(rows)):
+            row = rows[place]
+            if self._available[row]:
+                vor = self._vor[row]
+                yield -(vor * weight if vor > 0 else vor / weight), row
+
+    def best_available(self, position=None, limit=10, team=None):
+        """
+        Best undrafted players, ranked by need-weighted VOR for a team (by
+        default the team on the clock).
+
+        Parameters
+        ----------
+        position : str, optional
+            Only this position; all positions (merged) when omitted.
+        limit : int
+            Players to return.
+        team : int, optional
+            0-based team whose roster needs weight the ranking.
+
+        Returns
+        -------
+        pd.DataFrame
+            Pool rows with "Need" and "Score" (need-weighted VOR) columns.
+        """
+        if team is None:
+            team = self.team_for_pick(min(len(self.picks), self.total_picks - 1))
+        needs = self.needs(team)
+        weights = {pos: ROSTER_NEED_WEIGHTS[need] for pos, need in needs.items()}
+
+        positions = [position] if position else DRAFT_POSITIONS
+        ranked = list(islice(heapq.merge(*(self._ranked(pos, weights[pos]) for pos in positions)), limit))
+        rows = [row for _, row in ranked]
+        return self.pool.iloc[rows].assign(
+            Need=[needs[DRAFT_POSITIONS[code]] for code in self._position_codes[rows]],
+            Score=np.round([-score for score, _ in ranked], 2),
+        )
+
+    def available(self):
+        """Every undrafted pool row, in board order."""
+        return self.pool[np.array(self._available)]
+
+    # ------------------------------
+    # Results
+    # ------------------------------
+    def pick_log(self):
+        """Every pick so far: Pick, Round, Team and the player's pool row."""
+        if not self.picks:
+            return self.pool.iloc[[]].assign(**{"Pick": [], "Round": [], "Drafted By": []})
+        teams, rows = map(list, zip(*self.picks))
+        picks = np.arange(1, len(rows) + 1)
+        return self.pool.iloc[rows].assign(**{
+            "Pick": picks,
+            "Round": (picks - 1) // self.teams + 1,
+            "Drafted By": np.array(teams) + 1,
+        })
+
+    def roster(self, team):
+        """Pool rows a 0-based team has drafted, in pick order."""
+        return self.pool.iloc[[row for t, row in self.picks if t == team]]
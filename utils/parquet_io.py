@@ -0,0 +1,154 @@
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# ------------------------------
+# Weekly Stats Layout
+# ------------------------------
+
+# Hive-style layout: data/weekly_stats/season=2024/part-0.parquet, rows sorted
+# by player_id then week. Small row groups mean a single-player lookup only
+# decodes the one or two groups whose player_id min/max statistics match.
+WEEKLY_STATS_DIR = "data/weekly_stats"
+WEEKLY_SORT_KEYS = ["player_id", "week"]
+WEEKLY_ROW_GROUP_SIZE = 1024
+
+# Partition key type; must match how the column is stored before partitioning
+SEASON_PARTITIONING = ds.partitioning(pa.schema([("season", pa.int32())]), flavor="hive")
+
+
+def write_season_partitions(df, root, sort_by=None, row_group_size=WEEKLY_ROW_GROUP_SIZE):
+    """
+    Write df as one parquet file per season under root/season=YYYY/.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Must contain a "season" column.
+    root : str
+        Output directory. Partitions for the seasons in df are replaced;
+        other seasons already on disk are left alone.
+    sort_by : list of str, optional
+        Row order within each partition.
+    row_group_size : int
+        Maximum rows per parquet row group.
+    """
+    os.makedirs(root, exist_ok=True)
+    for season, season_df in df.groupby("season", sort=True):
+        if sort_by:
+            season_df = season_df.sort_values(sort_by, kind="stable")
+        season_df = season_df.drop(columns="season").reset_index(drop=True)
+
+        part_dir = os.path.join(root, f"season={int(season)}")
+        shutil.rmtree(part_dir, ignore_errors=True)
+        os.makedirs(part_dir)
+        pq.write_table(
+            pa.Table.from_pandas(season_df, preserve_index=False),
+            os.path.join(part_dir, "part-0.parquet"),
+            row_group_size=row_group_size,
+        )
+
+
+def read_parquet(path, columns=None, filters=None):
+    """
+    Read a parquet file or a season-partitioned directory into pandas.
+
+    Parameters
+    ----------
+    path : str
+        A single .parquet file or a directory written by write_season_partitions.
+    columns : list of str, optional
+        Only decode these columns.
+    filters : list of (column, op, value) tuples, optional
+        Row filters. On a partitioned directory, season filters prune whole
+        partitions; all filters also skip row groups via column statistics.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    partitioning = SEASON_PARTITIONING if os.path.isdir(path) else None
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+
+# ------------------------------
+# Arrow IPC Snapshot
+# ------------------------------
+
+# Uncompressed Arrow IPC (Feather v2) copies of the built tables. Every
+# server process memory-maps the same files, so their pages are shared
+# through the OS page cache instead of each worker holding its own copy.
+SNAPSHOT_DIR = os.environ.get("FF_SNAPSHOT_DIR", "data/snapshot")
+
+# Memory-mapped tables already opened by this process. A re-exported
+# snapshot is picked up by newly started workers.
+_snapshots = {}
+
+
+def snapshot_path(name, root=SNAPSHOT_DIR):
+    return os.path.join(root, f"{name}.arrow")
+
+
+def has_snapshot(name, root=SNAPSHOT_DIR):
+    return os.path.exists(snapshot_path(name, root))
+
+
+def write_snapshot(tables, root=SNAPSHOT_DIR):
+    """
+    Export DataFrames as uncompressed Arrow IPC files.
+
+    Parameters
+    ----------
+    tables : dict
+        {table name: pd.DataFrame}
+    root : str
+        Output directory. Each file is written to a temp path and renamed
+        into place, so running workers never map a half-written file.
+    """
+    os.makedirs(root, exist_ok=True)
+    for name, df in tables.items():
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        final_path = snapshot_path(name, root)
+        tmp_path = final_path + ".tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, final_path)
+
+
+def read_snapshot(name, columns=None, filters=None, root=SNAPSHOT_DIR):
+    """
+    Read a table from its memory-mapped Arrow IPC snapshot.
+
+    Numeric columns without nulls and Arrow-backed string columns are
+    converted without copying, so they point straight at the mapped pages.
+
+    Parameters
+    ----------
+    name : str
+        Table name passed to write_snapshot().
+    columns : list of str, optional
+        Only convert these columns.
+    filters : list of (column, op, value) tuples, optional
+        Row filters, evaluated on the Arrow table before conversion.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    path = snapshot_path(name, root)
+    table = _snapshots.get(path)
+    if table is None:
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        _snapshots[path] = table
+
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas(split_blocks=True)
@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.readonly import freeze, share
+
+# ------------------------------
+# Player-ID Sorted Index
+# ------------------------------
+
+# Dataset -> player ID column
+PLAYER_TABLES = {
+    "season_stats": "player_id",
+    "active_rosters": "player_id",
+    "active_contracts": "gsis_id",
+}
+
+# Datasets (and columns) the index holds, in the order PlayerIndex takes them
+PLAYER_INDEX_DATASETS = {
+    "season_stats": None,
+    "active_rosters": ["player_id", "player_name", "team", "position"],
+    "active_contracts": [
+        "gsis_id", "year_signed", "years", "value", "guaranteed",
+        "draft_year", "draft_team", "draft_round", "draft_overall"
+    ],
+}
+
+WEEKLY_METRICS = ["fantasy_points", "fantasy_points_ppr"]
+
+# Weekly columns read for a player, on demand
+WEEKLY_COLUMNS = ["season", "week", "recent_team"] + WEEKLY_METRICS
+
+# Players whose season x week grids are kept (least recently used dropped first)
+WEEKLY_GRID_CACHE_SIZE = 512
+
+
+class _SortedTable:
+    """One table stably sorted by its ID column, with per-ID row offsets."""
+
+    def __init__(self, frame, id_col):
+        ids = frame[id_col].fillna("").astype(str).to_numpy(dtype=object)
+        order = np.argsort(ids, kind="stable")
+        self.frame = frame.iloc[order]
+        self.ids, starts = np.unique(ids[order], return_index=True)
+        self.starts = starts
+        self.ends = np.append(starts[1:], len(order))
+
+    def rows(self, player_id):
+        i = np.searchsorted(self.ids, player_id)
+        if i == len(self.ids) or self.ids[i] != player_id:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[self.starts[i]:self.ends[i]]
+
+
+class PlayerIndex:
+    """
+    Season, roster and contract rows for any player as a slice, and their
+    weekly rows on demand.
+
+    Each table in PLAYER_TABLES is sorted once by player ID (stably, so a
+    player's rows keep their original order) with start/end offsets per
+    ID. A lookup is a binary search over the distinct IDs, so Player View
+    latency does not grow with table size. Weekly stats are not held: a
+    player's weekly rows are read with a player filter pushed down into
+    the parquet reader, and only the season x week grids of recently
+    viewed players are kept. Built once per data version by the dataset
+    store.
+    """
+
+    def __init__(self, season_stats, active_rosters, active_contracts):
+        frames = {
+            "season_stats": season_stats,
+            "active_rosters": active_rosters,
+            "active_contracts": active_contracts,
+        }
+        self._tables = {name: _SortedTable(frames[name], id_col) for name, id_col in PLAYER_TABLES.items()}
+        self._weekly_grids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def rows(self, table, player_id):
+        """
+        A player's rows of one table, in original order.
+
+        Parameters
+        ----------
+        table : str
+            Key in PLAYER_TABLES.
+        player_id : str
+            GSIS player ID.
+        """
+        if table not in self._tables:
+            raise ValueError(f"Unknown player table '{table}'. Choose from {sorted(self._tables)}.")
+        return self._tables[table].rows(player_id)
+
+    def weekly(self, player_id, season=None):
+        """A player's weekly rows, optionally for one season or a list of seasons, read from disk."""
+        # Imported here: the data loader builds this index
+        from utils.data_loader import load_season_stats
+
+        return load_season_stats(level="weekly", columns=WEEKLY_COLUMNS, player_id=player_id, season=season)
+
+    def weekly_seasons(self, player_id):
+        """Seasons with weekly rows for the player, most recent first."""
+        seasons = self.weekly_grid(player_id)["season"].unique()
+        return sorted((int(season) for season in seasons), reverse=True)
+
+    def weekly_grid(self, player_id):
+        """
+        A player's weekly points on a full season x week grid.
+
+        Every week from 1 to the last week the player appeared in, for each
+        season they appeared in; weeks without a row (byes, injuries) have
+        NaN points, so they show as gaps rather than being dropped.
+
+        Returns
+        -------
+        pd.DataFrame
+            season, week, recent_team and the WEEKLY_METRICS columns,
+            ordered by season then week. Read-only: derive a new frame
+            before adding columns.
+        """
+        with self._lock:
+            grid = self._weekly_grids.get(player_id)
+            if grid is not None:
+                self._weekly_grids.move_to_end(player_id)
+                return share(grid)
+
+        weekly = self.weekly(player_id)
+        # One row per week (a traded player's week never has two teams)
+        weekly = weekly.drop_duplicates(["season", "week"]).set_index(["season", "week"])
+        last_week = weekly.reset_index().groupby("season")["week"].max()
+        full_index = pd.MultiIndex.from_tuples(
+            [(season, week) for season, last in last_week.items() for week in range(1, int(last) + 1)],
+            names=["season", "week"],
+        )
+        grid = freeze(weekly.reindex(full_index).reset_index())
+
+        with self._lock:
+            self._weekly_grids[player_id] = grid
+            while len(self._weekly_grids) > WEEKLY_GRID_CACHE_SIZE:
+                self._weekly_grids.popitem(last=False)
+        return share(grid)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Position Rooms
+# ------------------------------
+
+def build_position_room(players, metric_col, qualifies, by=("season",), depth=2):
+    """
+    The starters of every position room (e.g. a coach's RBs in one season)
+    in one grouped pass.
+
+    Within each group players are ordered by metric_col, best first, with
+    ties kept in their order in players. The top player always starts;
+    players 2..depth start only where qualifies is True (e.g. they
+    finished inside the league-wide top 40).
+
+    Parameters
+    ----------
+    players : pd.DataFrame
+        One row per player season at a single position.
+    metric_col : str
+        Column that orders the room (e.g. "fantasy_points_ppr").
+    qualifies : array-like of bool
+        Per row of players: may this player start beyond slot 1?
+    by : sequence of str
+        Columns that define a room (default: one room per season).
+    depth : int
+        Most starters per room.
+
+    Returns
+    -------
+    pd.DataFrame
+        The starting rows of players plus "slot" (1 = top player), rooms in
+        order of first appearance in players, best player first within each.
+    """
+    by = list(by)
+    rooms = players.assign(
+        _room=players.groupby(by, sort=False).ngroup().to_numpy(),
+        _qualifies=np.asarray(qualifies, dtype=bool),
+    )
+    rooms = rooms.sort_values(["_room", metric_col], ascending=[True, False], kind="stable")
+    rooms["slot"] = rooms.groupby("_room").cumcount() + 1
+    starters = (rooms["slot"] == 1) | ((rooms["slot"] <= depth) & rooms["_qualifies"])
+    return rooms[starters].drop(columns=["_room", "_qualifies"])
+
+
+def room_totals(room, metric_col, metric_label, by=("season",), name_col="player_display_name"):
+    """
+    Combine each room's starters into one row: their names joined with
+    " / " under "Players" and their summed metric_col under metric_label.
+    """
+    return (
+        room.groupby(list(by), sort=False, observed=True)
+        .agg(Players=(name_col, " / ".join), **{metric_label: (metric_col, "sum")})
+        .reset_index()
+    )
+
+
+def room_share(room, numerator, denominator, by=("season",)):
+    """
+    Each starter's numerator as a share of the room's team total.
+
+    The team total is read from the room's top player, and is 0 where the
+    total is not positive.
+
+    Parameters
+    ----------
+    numerator : pd.Series
+        Per starter (aligned with room), e.g. carries + targets.
+    denominator : pd.Series
+        Team totals per row of room, e.g. team_total_plays.
+    """
+    team_total = denominator.groupby([room[col] for col in by], sort=False).transform("first")
+    return (numerator / team_total).where(team_total > 0, 0)
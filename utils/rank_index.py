@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from utils.aggregates import POSITION_TOP_N, SCORING_COLUMNS
+
+# ------------------------------
+# League Rank Index
+# ------------------------------
+
+RANK_KEYS = ["season", "position", "scoring", "player_id", "recent_team"]
+
+
+class RankIndex:
+    """
+    League rank of every player season, keyed by
+    (season, position, scoring, player_id).
+
+    Built once per data version from the materialized player_ranks table
+    (see build_player_ranks) by the dataset store, so switching position or
+    scoring format in Coach View is a lookup rather than a filter, rank and
+    merge on every rerun.
+
+    A player traded mid-season has one season_stats row per team, each
+    ranked on its own, so rows are additionally keyed by recent_team and a
+    lookup returns the rank of that team's row.
+
+    scorings names the <scoring>_rank columns of ranks_df to index
+    (default: standard and PPR).
+    """
+
+    def __init__(self, ranks_df, scorings=tuple(SCORING_COLUMNS)):
+        long = pd.concat(
+            [
+                pd.DataFrame({
+                    "season": ranks_df["season"].to_numpy(dtype=int),
+                    "position": ranks_df["position"].astype(str).to_numpy(),
+                    "scoring": scoring,
+                    "player_id": ranks_df["player_id"].astype(str).to_numpy(),
+                    "recent_team": ranks_df["recent_team"].astype(str).to_numpy(),
+                    "rank": ranks_df[f"{scoring}_rank"].to_numpy(),
+                })
+                for scoring in scorings
+            ],
+            ignore_index=True,
+        )
+        self.table = long.set_index(RANK_KEYS).sort_index()
+        self._ranks = self.table["rank"].to_numpy()
+
+        # (season, player_id) pairs inside the league-wide top N, per
+        # (position, scoring); a traded player qualifies if any team row does
+        top = long[long["rank"] <= long["position"].map(POSITION_TOP_N)]
+        self._top_n = {
+            key: pd.MultiIndex.from_frame(group[["season", "player_id"]].drop_duplicates())
+            for key, group in top.groupby(["position", "scoring"])
+        }
+
+    def lookup(self, position, scoring, seasons, player_ids, teams):
+        """
+        Ranks for many player seasons in one call.
+
+        Parameters
+        ----------
+        position : str
+            "QB", "RB", "WR" or "TE".
+        scoring : str
+            One of the indexed scorings ("std" or "ppr" by default).
+        seasons, player_ids, teams : array-like
+            One entry per row to look up.
+
+        Returns
+        -------
+        np.ndarray
+            Rank per row, int16; float with NaN if any row is unranked.
+        """
+        n = len(player_ids)
+        keys = pd.MultiIndex.from_arrays([
+            np.asarray(seasons, dtype=int),
+            np.full(n, position, dtype=object),
+            np.full(n, scoring, dtype=object),
+            np.asarray(player_ids).astype(str),
+            np.asarray(teams).astype(str),
+        ])
+        positions = self.table.index.get_indexer(keys)
+        ranks = self._ranks[positions]
+        if (positions < 0).any():
+            ranks = np.where(positions >= 0, ranks, np.nan)
+        return ranks
+
+    def ranks_for(self, df, position, scoring):
+        """lookup() for the season, player_id and recent_team columns of df."""
+        return self.lookup(position, scoring, df["season"], df["player_id"], df["recent_team"])
+
+    def in_top_n(self, position, scoring, seasons, player_ids):
+        """Boolean array: whether each (season, player_id) is in the league-wide top N."""
+        index = self._top_n.get((position, scoring))
+        if index is None:
+            return np.zeros(len(player_ids), dtype=bool)
+        keys = pd.MultiIndex.from_arrays([
+            np.asarray(seasons, dtype=int),
+            np.asarray(player_ids).astype(str),
+        ])
+        return index.get_indexer(keys) >= 0
@@ -0,0 +1,132 @@
+import os
+
+import pandas as pd
+
+# ------------------------------
+# Copy-on-Write
+# ------------------------------
+
+def enable_copy_on_write():
+    """
+    Switch on Copy-on-Write, so frames derived from the shared datasets
+    never write back into them.
+
+    pandas >= 3.0 always uses it; older versions need the option set. This
+    is a process-wide setting, so the app opts in when it creates the
+    dataset store rather than every importer (e.g. build scripts) getting
+    it as a side effect.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+# Set FF_READONLY_GUARD=1 to make shared frames raise on any write attempt.
+READONLY_GUARD = os.environ.get("FF_READONLY_GUARD", "0") == "1"
+
+
+class ReadOnlyFrameError(TypeError):
+    """Raised when a view tries to modify a shared, read-only dataset."""
+
+
+def _raise_readonly(*args, **kwargs):
+    raise ReadOnlyFrameError(
+        "Shared datasets are read-only. Derive a new frame instead, "
+        "e.g. df.assign(...) or df[mask].copy()."
+    )
+
+
+class _ReadOnlyIndexer:
+    """
+    Wraps a frame's .loc/.iloc/.at/.iat indexer: reads pass through, item
+    assignment raises. Only public pandas API is used, so the guard does not
+    depend on pandas' private indexer classes.
+    """
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __call__(self, axis=None):
+        return _ReadOnlyIndexer(self._indexer(axis))
+
+    def __getattr__(self, name):
+        if name.startswith("_setitem"):
+            _raise_readonly()
+        return getattr(self._indexer, name)
+
+    __setitem__ = _raise_readonly
+
+
+class ReadOnlyDataFrame(pd.DataFrame):
+    """
+    DataFrame that refuses in-place modification.
+
+    Column assignment, .loc/.iloc/.at/.iat writes, del, insert/pop and any
+    inplace=True method raise ReadOnlyFrameError. Arrays handed out by
+    .values/.to_numpy() are already read-only views under Copy-on-Write.
+    Anything derived from it (filters, merges, copies, groupbys) is a plain,
+    writable DataFrame.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+    __setitem__ = _raise_readonly
+    __delitem__ = _raise_readonly
+    insert = _raise_readonly
+    pop = _raise_readonly
+    update = _raise_readonly
+    _set_value = _raise_readonly
+    _update_inplace = _raise_readonly
+
+    def __setattr__(self, name, value):
+        # Allow pandas to initialise internals; block axis and column rebinding
+        if name in ("index", "columns") or (
+            "_mgr" in self.__dict__ and name in self.columns
+        ):
+            _raise_readonly()
+        super().__setattr__(name, value)
+
+
+def freeze(df):
+    """
+    Wrap a frame for sharing across sessions.
+
+    In guard mode the result is a ReadOnlyDataFrame that fails fast on
+    writes; otherwise it is returned unchanged and callers rely on
+    Copy-on-Write through share().
+    """
+    if READONLY_GUARD:
+        return ReadOnlyDataFrame(df)
+    return df
+
+
+def share(df):
+    """
+    Hand out a shared frame to a caller.
+
+    A shallow copy is a new DataFrame object over the same buffers, so
+    column assignment or .loc writes in a view only ever touch that view's
+    copy (Copy-on-Write) and never the process-wide original.
+    """
+    if isinstance(df, ReadOnlyDataFrame):
+        return df
+    return df.copy(deep=False)
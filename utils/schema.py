@@ -0,0 +1,147 @@
+import pandas as pd
+
+# ------------------------------
+# Typed Table Schemas
+# ------------------------------
+
+# Per-table storage types. Low-cardinality strings become categoricals and
+# numeric columns are narrowed to the smallest type that safely holds them.
+# Counting stats stay 32-bit so season/career sums never overflow (pandas
+# sums integer columns as int64 anyway). Columns not listed keep their type.
+_STAT_INTS = [
+    "attempts", "completions", "passing_tds", "carries", "rushing_tds",
+    "targets", "receptions", "receiving_tds",
+]
+_STAT_FLOATS = [
+    "passing_yards", "interceptions", "rushing_yards", "receiving_yards",
+    "fantasy_points", "fantasy_points_ppr",
+]
+
+SCHEMAS = {
+    "season_stats": {
+        "category": ["player_display_name", "recent_team", "position"],
+        "int16": ["season", "team_total_plays", "team_pass_attempts"],
+        "int8": ["team_id", "games_played"],
+        "int32": _STAT_INTS,
+        "float32": _STAT_FLOATS + [
+            "usage", "target_share", "fantasy_points_pg", "fantasy_points_ppr_pg",
+        ],
+    },
+    "weekly_stats": {
+        "category": [
+            "player_name", "player_display_name", "position", "position_group",
+            "headshot_url", "recent_team", "season_type", "opponent_team",
+            "hc", "oc", "play_caller",
+        ],
+        "int16": ["season"],
+        "int8": ["team_id", "week"],
+        "int32": _STAT_INTS,
+        "float32": _STAT_FLOATS,
+    },
+    "coaching": {
+        "category": ["Team", "Team Abbr", "Coach Type", "Playing Calling Duties"],
+        "int16": ["Season"],
+        "int8": ["Team ID"],
+        "float32": ["Coached From", "Coached To"],
+    },
+    "active_rosters": {
+        "category": ["team", "position", "depth_chart_position", "status", "college"],
+        "int16": ["season"],
+    },
+    "active_contracts": {
+        "category": ["position", "team", "draft_team", "college"],
+        "int16": ["year_signed"],
+    },
+    "coaching_stints": {
+        "category": ["team_abbr", "hc", "oc", "play_caller"],
+        "int16": ["season"],
+        "int8": ["week", "team_id"],
+    },
+    # Materialized aggregates (utils/aggregates.py)
+    "team_season_totals": {
+        "category": ["recent_team"],
+        "int16": ["season"],
+        "int8": [
+            "team_id", "pass_yards_rank", "rush_yards_rank", "offense_yards_rank",
+            "pass_tds_rank", "rush_tds_rank",
+        ],
+        "int32": _STAT_INTS,
+        "float32": _STAT_FLOATS + ["offense_yards", "total_yards"],
+    },
+    "team_position_totals": {
+        "category": ["recent_team", "position"],
+        "int16": ["season"],
+        "int8": ["team_id", "std_rank", "ppr_rank"],
+        "int32": ["targets"],
+        "float32": ["fantasy_points", "fantasy_points_ppr"],
+    },
+    "player_ranks": {
+        "category": ["recent_team", "position"],
+        "int16": ["season", "std_rank", "ppr_rank"],
+    },
+    "coach_stint_stats": {
+        "category": ["recent_team", "hc", "oc", "play_caller", "player_display_name", "position"],
+        "int16": ["season"],
+        "int8": ["team_id", "games_played"],
+        "int32": _STAT_INTS,
+        "float32": _STAT_FLOATS,
+    },
+    "position_cutoffs": {
+        "category": ["position", "scoring"],
+        "int16": ["season"],
+        "int8": ["top_n"],
+        "float32": ["cutoff_points", "mean_points"],
+    },
+}
+
+
+def apply_schema(df, table):
+    """
+    Return df with the storage types declared for table in SCHEMAS.
+
+    Columns missing from df are skipped and columns already of the target
+    type are left alone, so this is safe to run at build time and again at
+    load time.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    table : str
+        Key in SCHEMAS.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    dtypes = {}
+    for dtype, columns in SCHEMAS.get(table, {}).items():
+        for col in columns:
+            if col not in df.columns or str(df[col].dtype) == dtype:
+                continue
+            # Integer columns with missing values cannot be narrowed safely
+            if dtype.startswith("int") and df[col].isna().any():
+                continue
+            dtypes[col] = dtype
+    return df.astype(dtypes) if dtypes else df
+
+
+def memory_report(before, after):
+    """
+    Compare per-column memory use of a frame before and after apply_schema().
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column plus a "TOTAL" row, with dtypes and sizes in KB.
+    """
+    before_kb = before.memory_usage(deep=True, index=False) / 1024
+    after_kb = after.memory_usage(deep=True, index=False) / 1024
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.astype(str),
+        "kb_before": before_kb.round(1),
+        "kb_after": after_kb.round(1),
+    })
+    report.loc["TOTAL"] = ["", "", round(before_kb.sum(), 1), round(after_kb.sum(), 1)]
+    report["saved_pct"] = (100 * (1 - report["kb_after"] / report["kb_before"])).round(1)
+    return report
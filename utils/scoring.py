@@ -0,0 +1,292 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregates import build_player_ranks, build_position_cutoffs
+from utils.rank_index import RankIndex
+from utils.readonly import freeze
+
+# ------------------------------
+# Custom Scoring Engine
+# ------------------------------
+
+# nflverse standard scoring: exactly what the fantasy_points column holds
+STANDARD_POINTS = {
+    "passing_yards": 0.04,
+    "passing_tds": 4.0,
+    "interceptions": -2.0,
+    "passing_2pt_conversions": 2.0,
+    "rushing_yards": 0.1,
+    "rushing_tds": 6.0,
+    "rushing_2pt_conversions": 2.0,
+    "receiving_yards": 0.1,
+    "receiving_tds": 6.0,
+    "receiving_2pt_conversions": 2.0,
+    "sack_fumbles_lost": -2.0,
+    "rushing_fumbles_lost": -2.0,
+    "receiving_fumbles_lost": -2.0,
+    "special_teams_tds": 6.0,
+}
+
+_PPR_POINTS = {**STANDARD_POINTS, "receptions": 1.0}
+
+# Rule set key -> display label, points per unit of each weekly stat, and
+# per-position overrides of those points
+SCORING_RULES = {
+    "std": {"label": "Standard", "points": STANDARD_POINTS},
+    "half_ppr": {"label": "Half PPR", "points": {**STANDARD_POINTS, "receptions": 0.5}},
+    "ppr": {"label": "PPR", "points": _PPR_POINTS},
+    "ppr_6pt_pass_td": {"label": "PPR, 6-pt Pass TDs", "points": {**_PPR_POINTS, "passing_tds": 6.0}},
+    "te_premium": {
+        "label": "PPR, TE Premium",
+        "points": _PPR_POINTS,
+        "position_points": {"TE": {"receptions": 1.5}},
+    },
+    "ppr_per_carry": {"label": "PPR + 0.1/Carry", "points": {**_PPR_POINTS, "carries": 0.1}},
+}
+
+# Rule sets the nflverse columns already hold
+BUILT_IN_SCORING = {"std": "fantasy_points", "ppr": "fantasy_points_ppr"}
+
+# Weekly stat columns a rule set may score
+SCORABLE_STATS = [
+    "attempts", "completions", "passing_yards", "passing_tds", "interceptions", "sacks",
+    "passing_first_downs", "passing_2pt_conversions",
+    "carries", "rushing_yards", "rushing_tds", "rushing_first_downs", "rushing_2pt_conversions",
+    "targets", "receptions", "receiving_yards", "receiving_tds", "receiving_first_downs",
+    "receiving_2pt_conversions",
+    "sack_fumbles_lost", "rushing_fumbles_lost", "receiving_fumbles_lost", "special_teams_tds",
+]
+
+# Datasets (and columns) the engine holds, in the order ScoringEngine takes them
+SCORING_DATASETS = {
+    "weekly_stats": ["player_id", "season", "week", "season_type", "recent_team", "position"] + SCORABLE_STATS,
+    "season_stats": ["season", "player_id", "recent_team", "position", "games_played"],
+}
+
+# Columns league points are attached under
+LEAGUE_POINTS = "fantasy_points_league"
+LEAGUE_POINTS_PG = "fantasy_points_league_pg"
+
+# Rule sets whose scores are kept (least recently used dropped first)
+SCORES_CACHE_SIZE = 16
+
+
+def resolve_rules(rules):
+    """
+    Validate a rule set, given as a key in SCORING_RULES or as a dict
+    {"label", "points", "position_points" (optional)}.
+    """
+    if isinstance(rules, str):
+        if rules not in SCORING_RULES:
+            raise ValueError(f"Unknown scoring rule set '{rules}'. Choose from {sorted(SCORING_RULES)}.")
+        rules = SCORING_RULES[rules]
+    scored = set(rules["points"])
+    for overrides in rules.get("position_points", {}).values():
+        scored |= set(overrides)
+    unknown = sorted(scored - set(SCORABLE_STATS))
+    if unknown:
+        raise ValueError(f"Cannot score {unknown}. Rule sets may score {SCORABLE_STATS}.")
+    return rules
+
+
+def rules_key(rules):
+    """Hashable form of a rule set: two rule sets that score alike share a key."""
+    rules = resolve_rules(rules)
+    points = tuple(sorted((stat, float(p)) for stat, p in rules["points"].items() if p))
+    overrides = tuple(sorted(
+        (position, tuple(sorted((stat, float(p)) for stat, p in stats.items())))
+        for position, stats in rules.get("position_points", {}).items()
+    ))
+    return points, overrides
+
+
+def _weights(points):
+    return np.array([points.get(stat, 0.0) for stat in SCORABLE_STATS], dtype=float)
+
+
+class LeagueScores:
+    """
+    Points, ranks and top-N pools under one rule set.
+
+    Season points are summed from the weekly points of each season_stats
+    row's regular-season weeks, so they sit at the season_stats grain (one
+    row per player, season and team) and line up with every table derived
+    from it. Ranks and top-N pools are built with the same helpers as the
+    materialized player_ranks and position_cutoffs tables, under the
+    scoring key "league".
+    """
+
+    def __init__(self, rules, weekly_keys, weekly_points, season, season_rows):
+        self.rules = rules
+        self.label = rules["label"]
+
+        regular = season_rows >= 0
+        points = np.bincount(season_rows[regular], weights=weekly_points[regular], minlength=len(season))
+        points = points.round(2)
+        games = season["games_played"].to_numpy(dtype=float)
+        self.season = freeze(season.assign(**{
+            LEAGUE_POINTS: points,
+            LEAGUE_POINTS_PG: points / np.where(games > 0, games, np.nan),
+        }))
+        self._season_index = pd.MultiIndex.from_arrays([
+            season["season"].to_numpy(dtype=int),
+            season["player_id"].astype(str).to_numpy(),
+            season["recent_team"].astype(str).to_numpy(),
+        ])
+        self._weekly_keys = weekly_keys
+        self._weekly_points = weekly_points
+
+        self.ranks = RankIndex(build_player_ranks(self.season, {"league": LEAGUE_POINTS}), scorings=("league",))
+        self.cutoffs = freeze(build_position_cutoffs(self.season, {"league": LEAGUE_POINTS}))
+
+    def lookup(self, seasons, player_ids, teams):
+        """
+        League points and points per game for many player seasons.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (points, points per game), NaN where a row has no season line.
+        """
+        keys = pd.MultiIndex.from_arrays([
+            np.asarray(seasons, dtype=int),
+            np.asarray(player_ids).astype(str),
+            np.asarray(teams).astype(str),
+        ])
+        rows = self._season_index.get_indexer(keys)
+        found = rows >= 0
+        points = np.where(found, self.season[LEAGUE_POINTS].to_numpy()[rows], np.nan)
+        per_game = np.where(found, self.season[LEAGUE_POINTS_PG].to_numpy()[rows], np.nan)
+        return points, per_game
+
+    def rescore(self, df):
+        """
+        df (at season_stats grain: season, player_id, recent_team) with
+        LEAGUE_POINTS and LEAGUE_POINTS_PG columns added.
+        """
+        points, per_game = self.lookup(df["season"], df["player_id"], df["recent_team"])
+        return df.assign(**{LEAGUE_POINTS: points, LEAGUE_POINTS_PG: per_game})
+
+    def rescore_totals(self, df):
+        """
+        df (any table of summed regular-season weekly stats, e.g. coaching
+        stint totals) with a LEAGUE_POINTS column added.
+
+        Scoring is linear in the stats, so league points are the standard
+        fantasy_points plus the rule set's difference from standard scoring
+        applied to the summed stats. Every stat the rule set scores
+        differently must be a column of df.
+        """
+        delta = {
+            stat: p - STANDARD_POINTS.get(stat, 0.0)
+            for stat, p in {**{s: 0.0 for s in STANDARD_POINTS}, **self.rules["points"]}.items()
+        }
+        position_points = self.rules.get("position_points", {})
+        needed = {stat for stat, d in delta.items() if d} | {s for o in position_points.values() for s in o}
+        missing = sorted(needed - set(df.columns))
+        if missing:
+            raise ValueError(f"Cannot rescore totals under '{self.label}' without columns {missing}.")
+
+        points = df["fantasy_points"].to_numpy(dtype=float).copy()
+        for stat, d in delta.items():
+            if d:
+                points += d * df[stat].fillna(0).to_numpy(dtype=float)
+        if position_points:
+            positions = df["position"].astype(str).to_numpy()
+            for position, overrides in position_points.items():
+                mask = positions == position
+                for stat, p in overrides.items():
+                    base = self.rules["points"].get(stat, 0.0)
+                    points[mask] += (p - base) * df[stat].fillna(0).to_numpy(dtype=float)[mask]
+        return df.assign(**{LEAGUE_POINTS: points.round(2)})
+
+    def weekly(self, player_id, seasons, weeks):
+        """League points per (season, week) of one player; NaN for weeks without a stat line."""
+        keys = pd.MultiIndex.from_arrays([
+            np.full(len(seasons), player_id, dtype=object),
+            np.asarray(seasons, dtype=int),
+            np.asarray(weeks, dtype=int),
+        ])
+        rows = self._weekly_keys.get_indexer(keys)
+        return np.where(rows >= 0, self._weekly_points[rows], np.nan)
+
+    def top_n_average(self, position):
+        """Average league points of the top 32/40 at a position, per season (season, mean_points)."""
+        return self.cutoffs[self.cutoffs["position"] == position][["season", "mean_points"]]
+
+
+class ScoringEngine:
+    """
+    Fantasy points for every weekly stat line under any rule set.
+
+    Holds the scorable weekly stats as one float matrix, so scoring a rule
+    set is a single matrix-vector product over all players and weeks (plus
+    one masked product per position override). Weekly rows are mapped to
+    their season_stats row once, so season totals are one bincount. Each
+    rule set's LeagueScores is kept in a small LRU cache keyed by
+    rules_key(), so switching back and forth between rule sets costs
+    nothing after the first time. Built once per data version by the
+    dataset store.
+    """
+
+    def __init__(self, weekly_stats, season_stats):
+        self._stats = weekly_stats[SCORABLE_STATS].fillna(0).to_numpy(dtype=float)
+        self._positions = weekly_stats["position"].astype(str).to_numpy()
+        self._weekly_keys = pd.MultiIndex.from_arrays([
+            weekly_stats["player_id"].astype(str).to_numpy(),
+            weekly_stats["season"].to_numpy(dtype=int),
+            weekly_stats["week"].to_numpy(dtype=int),
+        ])
+
+        # Regular-season weekly rows -> their season_stats row (-1: none)
+        self._season = season_stats.reset_index(drop=True)
+        season_index = pd.MultiIndex.from_arrays([
+            self._season["season"].to_numpy(dtype=int),
+            self._season["player_id"].astype(str).to_numpy(),
+            self._season["recent_team"].astype(str).to_numpy(),
+        ])
+        rows = season_index.get_indexer(pd.MultiIndex.from_arrays([
+            weekly_stats["season"].to_numpy(dtype=int),
+            weekly_stats["player_id"].astype(str).to_numpy(),
+            weekly_stats["recent_team"].astype(str).to_numpy(),
+        ]))
+        self._season_rows = np.where((weekly_stats["season_type"] == "REG").to_numpy(), rows, -1)
+
+        self._scores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def weekly_points(self, rules):
+        """Points of every weekly row under a rule set, in weekly_stats row order."""
+        rules = resolve_rules(rules)
+        base = rules["points"]
+        points = self._stats @ _weights(base)
+        for position, overrides in rules.get("position_points", {}).items():
+            mask = self._positions == position
+            delta = {stat: p - base.get(stat, 0.0) for stat, p in overrides.items()}
+            points[mask] += self._stats[mask] @ _weights(delta)
+        return points.round(2)
+
+    def score(self, rules):
+        """
+        LeagueScores for a rule set (a key in SCORING_RULES or a rule dict),
+        computed on first request and cached.
+        """
+        key = rules_key(rules)
+        with self._lock:
+            scores = self._scores.get(key)
+            if scores is not None:
+                self._scores.move_to_end(key)
+                return scores
+
+        rules = resolve_rules(rules)
+        scores = LeagueScores(rules, self._weekly_keys, self.weekly_points(rules), self._season, self._season_rows)
+
+        with self._lock:
+            scores = self._scores.setdefault(key, scores)
+            self._scores.move_to_end(key)
+            while len(self._scores) > SCORES_CACHE_SIZE:
+                self._scores.popitem(last=False)
+        return scores
@@ -0,0 +1,185 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+# ------------------------------
+# Typeahead Search Index
+# ------------------------------
+
+FANTASY_POSITIONS = ["QB", "RB", "WR", "TE"]
+
+# Result order for equally good matches
+KIND_ORDER = {"team": 0, "coach": 1, "player": 2}
+
+# Minimum trigram overlap (Jaccard) for a fuzzy token match
+FUZZY_THRESHOLD = 0.4
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation: "Ja'Marr Chase" -> "jamarr chase"."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode()
+    text = re.sub(r"['.’]", "", text.lower())
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    Prefix and fuzzy name search over players, coaches and teams.
+
+    Every entry (active fantasy-position player, 2025 HC/OC, team) is
+    split into normalized tokens: name words plus team abbreviation and,
+    for players, position. Tokens are kept in one sorted list, so each
+    query word is a binary search for its prefix range; entries must match
+    every query word. When prefixes find too few entries, words are matched
+    fuzzily through a trigram index over the same tokens. Built once per
+    data version by the dataset store, along with the sorted option lists
+    the app's selectboxes pick from.
+    """
+
+    def __init__(self, coaching_df, active_rosters_df):
+        self.entries = []
+        entry_tokens = []
+
+        def add(kind, key, label, name, extra=()):
+            self.entries.append({"kind": kind, "id": key, "label": label, "name": normalize(name)})
+            entry_tokens.append(set(normalize(name).split()) | {normalize(t) for t in extra})
+
+        current = coaching_df[coaching_df["Season"] == coaching_df["Season"].max()]
+        teams = current[["Team Abbr", "Team"]].drop_duplicates("Team Abbr").dropna()
+        for abbr, team in zip(teams["Team Abbr"].astype(str), teams["Team"].astype(str)):
+            add("team", abbr, f"{team} ({abbr})", team, extra=[abbr])
+
+        role_labels = {"Head Coach": "HC", "Offensive Coordinator": "OC"}
+        coaches = current[current["Coach Type"].isin(role_labels)][["Coach", "Team Abbr", "Coach Type"]].dropna()
+        for coach, abbr, role in zip(coaches["Coach"], coaches["Team Abbr"].astype(str), coaches["Coach Type"].astype(str)):
+            add("coach", coach, f"{coach} – {abbr} ({role_labels[role]})", coach, extra=[abbr])
+
+        rosters = active_rosters_df[active_rosters_df["position"].isin(FANTASY_POSITIONS)]
+        rosters = rosters.drop_duplicates("player_id")
+        for player_id, name, team, position in zip(
+            rosters["player_id"], rosters["player_name"], rosters["team"].astype(str), rosters["position"].astype(str)
+        ):
+            add("player", player_id, f"{name} – {team} ({position})", name, extra=[team, position])
+
+        # Entry ids of each kind, sorted by label, for selectbox options
+        self._options = {kind: [] for kind in KIND_ORDER}
+        for entry_id in sorted(range(len(self.entries)), key=lambda e: self.entries[e]["label"]):
+            self._options[self.entries[entry_id]["kind"]].append(entry_id)
+        self._entry_ids = {(entry["kind"], entry["id"]): e for e, entry in enumerate(self.entries)}
+
+        # Sorted token vocabulary -> entry ids
+        postings = {}
+        for entry_id, tokens in enumerate(entry_tokens):
+            for token in tokens:
+                postings.setdefault(token, []).append(entry_id)
+        self._vocab = sorted(postings)
+        self._postings = [postings[token] for token in self._vocab]
+
+        # Trigram -> vocabulary positions, for fuzzy matching
+        self._trigram_sizes = []
+        self._trigrams = {}
+        for position, token in enumerate(self._vocab):
+            grams = _trigrams(token)
+            self._trigram_sizes.append(len(grams))
+            for gram in grams:
+                self._trigrams.setdefault(gram, []).append(position)
+
+    def _prefix_matches(self, word):
+        lo = bisect_left(self._vocab, word)
+        hi = bisect_left(self._vocab, word + "\uffff")
+        return range(lo, hi)
+
+    def _fuzzy_matches(self, word):
+        grams = _trigrams(word)
+        shared = Counter(pos for gram in grams for pos in self._trigrams.get(gram, ()))
+        return [
+            pos for pos, count in shared.items()
+            if count / (len(grams) + self._trigram_sizes[pos] - count) >= FUZZY_THRESHOLD
+        ]
+
+    def _entries_for(self, word, fuzzy):
+        positions = self._fuzzy_matches(word) if fuzzy else self._prefix_matches(word)
+        scores = {}
+        for pos in positions:
+            # Whole-word hits outrank prefix/fuzzy hits
+            score = 2 if self._vocab[pos] == word else 1
+            for entry_id in self._postings[pos]:
+                scores[entry_id] = max(scores.get(entry_id, 0), score)
+        return scores
+
+    def _match(self, words, fuzzy):
+        scores = None
+        for word in words:
+            word_scores = self._entries_for(word, fuzzy)
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {e: s + word_scores[e] for e, s in scores.items() if e in word_scores}
+            if not scores:
+                return {}
+        return scores
+
+    def options(self, kinds=None):
+        """Entry ids of these kinds (all by default), by kind then label."""
+        kinds = set(kinds or KIND_ORDER)
+        return [e for kind in KIND_ORDER if kind in kinds for e in self._options[kind]]
+
+    def label(self, entry_id):
+        """Display label of an entry id, e.g. as a selectbox format_func."""
+        return self.entries[entry_id]["label"]
+
+    def entry_id(self, kind, key):
+        """Entry id of a player id, coach name or team abbreviation, or None."""
+        return self._entry_ids.get((kind, key))
+
+    def search(self, query, kinds=None, limit=10):
+        """
+        Best matches for a partial query.
+
+        Parameters
+        ----------
+        query : str
+            What the user has typed so far, e.g. "ja chase" or "kc wr".
+        kinds : iterable of str, optional
+            Only return these kinds ("player", "coach", "team").
+        limit : int
+            Most results to return.
+
+        Returns
+        -------
+        list of dict
+            {"entry", "kind", "id", "label"}, best match first.
+        """
+        words = normalize(query).split()
+        if not words:
+            return []
+        kinds = set(kinds or KIND_ORDER)
+
+        scores = self._match(words, fuzzy=False)
+        scores = {e: s for e, s in scores.items() if self.entries[e]["kind"] in kinds}
+        if len(scores) < limit:
+            # Typos: fill up with trigram matches, ranked below prefix hits
+            fuzzy = self._match(words, fuzzy=True)
+            for e, s in fuzzy.items():
+                if e not in scores and self.entries[e]["kind"] in kinds:
+                    scores[e] = s - 2 * len(words)
+
+        phrase = " ".join(words)
+
+        def rank(entry_id):
+            entry = self.entries[entry_id]
+            return (
+                -scores[entry_id],
+                not entry["name"].startswith(phrase),
+                KIND_ORDER[entry["kind"]],
+                entry["label"],
+            )
+
+        best = sorted(scores, key=rank)[:limit]
+        return [{"entry": e, **{key: self.entries[e][key] for key in ("kind", "id", "label")}} for e in best]
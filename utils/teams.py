@@ -0,0 +1,104 @@
+import pandas as pd
+
+# ------------------------------
+# Franchise Dimension
+# ------------------------------
+
+# One row per franchise with a stable ID. IDs match the "Team ID" column of
+# the coaching CSV and never change when a franchise relocates or renames.
+FRANCHISES = [
+    (1, "ARI", "Arizona Cardinals"),
+    (2, "ATL", "Atlanta Falcons"),
+    (3, "BAL", "Baltimore Ravens"),
+    (4, "BUF", "Buffalo Bills"),
+    (5, "CAR", "Carolina Panthers"),
+    (6, "CHI", "Chicago Bears"),
+    (7, "CIN", "Cincinnati Bengals"),
+    (8, "CLE", "Cleveland Browns"),
+    (9, "DAL", "Dallas Cowboys"),
+    (10, "DEN", "Denver Broncos"),
+    (11, "DET", "Detroit Lions"),
+    (12, "GB", "Green Bay Packers"),
+    (13, "HOU", "Houston Texans"),
+    (14, "IND", "Indianapolis Colts"),
+    (15, "JAX", "Jacksonville Jaguars"),
+    (16, "KC", "Kansas City Chiefs"),
+    (17, "LAC", "Los Angeles Chargers"),
+    (18, "LAR", "Los Angeles Rams"),
+    (19, "LV", "Las Vegas Raiders"),
+    (20, "MIA", "Miami Dolphins"),
+    (21, "MIN", "Minnesota Vikings"),
+    (22, "NE", "New England Patriots"),
+    (23, "NO", "New Orleans Saints"),
+    (24, "NYG", "New York Giants"),
+    (25, "NYJ", "New York Jets"),
+    (26, "PHI", "Philadelphia Eagles"),
+    (27, "PIT", "Pittsburgh Steelers"),
+    (28, "SEA", "Seattle Seahawks"),
+    (29, "SF", "San Francisco 49ers"),
+    (30, "TB", "Tampa Bay Buccaneers"),
+    (31, "TEN", "Tennessee Titans"),
+    (32, "WAS", "Washington Commanders"),
+]
+
+# Historical / relocated abbreviations -> canonical abbreviation
+TEAM_ABBR_MAP = {
+    "LA": "LAR",   # Rams (nfl_data_py)
+    "STL": "LAR",  # St. Louis Rams
+    "SD": "LAC",   # San Diego Chargers
+    "OAK": "LV",   # Oakland Raiders
+}
+
+# Canonical abbreviation -> stable team ID
+TEAM_ID_MAP = {abbr: team_id for team_id, abbr, _ in FRANCHISES}
+
+
+def franchise_table():
+    """
+    Return the franchise dimension as a DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: team_id, team_abbr, team_name
+    """
+    return pd.DataFrame(FRANCHISES, columns=["team_id", "team_abbr", "team_name"])
+
+
+def normalize_team_abbr(abbrs):
+    """
+    Map historical team abbreviations (STL, LA, SD, OAK) to canonical ones.
+
+    Parameters
+    ----------
+    abbrs : pd.Series
+        Team abbreviations.
+
+    Returns
+    -------
+    pd.Series
+    """
+    if not abbrs.isin(TEAM_ABBR_MAP.keys()).any():
+        return abbrs
+    if isinstance(abbrs.dtype, pd.CategoricalDtype):
+        abbrs = abbrs.astype(str)
+    return abbrs.replace(TEAM_ABBR_MAP)
+
+
+def normalize_teams(df, abbr_col, id_col=None):
+    """
+    Return df with canonical abbreviations in abbr_col and, if given,
+    stable franchise IDs in id_col.
+
+    Frames that are already canonical are returned unchanged, so this is
+    safe to call on freshly built and previously built data alike.
+    """
+    abbrs = normalize_team_abbr(df[abbr_col])
+    updates = {}
+    if abbrs is not df[abbr_col]:
+        updates[abbr_col] = abbrs
+    if id_col is not None:
+        team_ids = abbrs.map(TEAM_ID_MAP).astype("Int64")
+        if id_col not in df.columns or not team_ids.equals(df[id_col].astype("Int64")):
+            updates[id_col] = team_ids
+    return df.assign(**updates) if updates else df
@@ -2,27 +2,178 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 
-def show_coach_view(coaching_df, stats_df):
+from utils.coach_similarity import FEATURES
+from utils.position_room import build_position_room, room_share, room_totals
+from utils.scoring import LEAGUE_POINTS, LEAGUE_POINTS_PG
+
+# Datasets this view reads ({name: columns or None for all}), loaded on first use
+DATASETS = {
+    "coaching": None,
+    "position_cutoffs": None,
+}
+
+def show_coach_view(coaching_df, cutoffs_df, ranks, careers, similarity, league=None):
     st.title("Coach View")
 
+    # ----------------------
+    # Scoring Formats: Standard, PPR and the league's custom rule set (if any)
+    # ----------------------
+    # Toggle label -> (scoring key, points column, chart label)
+    scoring_formats = {
+        "Standard": ("std", "fantasy_points", "Fantasy Points"),
+        "PPR": ("ppr", "fantasy_points_ppr", "PPR Fantasy Points"),
+    }
+    if league is not None:
+        scoring_formats[league.label] = ("league", LEAGUE_POINTS, f"{league.label} Points")
+    scoring_keys = {col: key for key, col, _ in scoring_formats.values()}
+    league_tab_label = [f"Fantasy Points ({league.label})"] if league is not None else []
+
+    # ----------------------
+    # Helpers: League Ranks & Top-N Cutoffs (materialized at build time)
+    # ----------------------
+    def rank_index(scoring):
+        # Custom rule sets carry their own ranks, computed by the scoring engine
+        return league.ranks if scoring == "league" else ranks
+
+    def add_league_ranks(df, position, scorings=("std", "ppr", "league")):
+        # Season ranks within the position, looked up from the shared rank index
+        labels = {"std": "Fantasy Rank", "ppr": "PPR Rank", "league": "League Rank"}
+        scorings = [s for s in scorings if s != "league" or league is not None]
+        return df.assign(**{labels[s]: rank_index(s).ranks_for(df, position, s) for s in scorings})
+
+    def position_room(players, position, metric_col):
+        # Top player per season, plus the No. 2 if inside the league-wide top 32/40
+        scoring = scoring_keys[metric_col]
+        qualifies = rank_index(scoring).in_top_n(position, scoring, players["season"], players["player_id"])
+        return build_position_room(players, metric_col, qualifies)
+
+    def league_top_n_average(position, metric_col, metric_label):
+        # Average points of the league-wide top 32/40 at the position, per season
+        scoring = scoring_keys[metric_col]
+        cutoffs = league.cutoffs if scoring == "league" else cutoffs_df
+        return cutoffs[
+            (cutoffs["position"] == position) &
+            (cutoffs["scoring"] == scoring)
+        ][["season", "mean_points"]].rename(columns={"mean_points": metric_label})
+
+    def show_league_points(df, common_cols):
+        # Season points and position ranks under the league's rule set
+        st.dataframe(
+            df[common_cols + [LEAGUE_POINTS, "League Rank", LEAGUE_POINTS_PG]]
+            .rename(columns={
+                "player_display_name": "Player",
+                LEAGUE_POINTS: f"{league.label} Points",
+                LEAGUE_POINTS_PG: f"{league.label} Points/Game"
+            })
+            .sort_values(by="season", ascending=False),
+            use_container_width=True,
+            hide_index=True
+        )
+
     # ----------------------
     # Coach Selection: 2025 HC/OC only
     # ----------------------
     current_coaches_df = coaching_df[
         (coaching_df["Season"] == 2025) &
         (coaching_df["Coach Type"].isin(["Head Coach", "Offensive Coordinator"]))
-    ][["Team Abbr", "Coach", "Coach Type"]].dropna()
+    ][["Team Abbr", "Team ID", "Coach", "Coach Type"]].dropna()
 
     # Create display label: "KC – Andy Reid"
-    current_coaches_df["Display"] = current_coaches_df["Team Abbr"] + " – " + current_coaches_df["Coach"]
+    current_coaches_df["Display"] = current_coaches_df["Team Abbr"].astype(str) + " – " + current_coaches_df["Coach"]
 
     # Map display label to actual coach name
     coach_display_map = dict(zip(current_coaches_df["Display"], current_coaches_df["Coach"]))
 
-    # Dropdown with sorted display labels
+    # ----------------------
+    # Compare Mode: overlay 2–6 coaches
+    # ----------------------
+    def show_coach_comparison():
+        compare_selected = st.multiselect(
+            "Select 2–6 Coaches (2025 HC/OC Only)",
+            sorted(current_coaches_df["Display"]),
+            max_selections=6,
+            key="compare_coaches"
+        )
+        coaches = list(dict.fromkeys(coach_display_map[d] for d in compare_selected))
+        if len(coaches) < 2:
+            st.info("Select at least two coaches to compare.")
+            return
+
+        # Career summary
+        st.dataframe(
+            careers.summary(coaches).rename(columns={"Weeks": "Weeks as HC/OC"}),
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.markdown("### Position Production by Season")
+
+        compare_position = st.radio(
+            "Position:",
+            options=["QB", "RB", "WR", "TE"],
+            horizontal=True,
+            key="compare_position"
+        )
+        compare_scoring = st.radio(
+            "Scoring Format:",
+            options=list(scoring_formats),
+            horizontal=True,
+            key="compare_scoring"
+        )
+        compare_measure = st.radio(
+            "Measure:",
+            options=["Position Total", "Top Player"],
+            horizontal=True,
+            key="compare_measure"
+        )
+
+        _, metric_col, metric_label = scoring_formats[compare_scoring]
+        if compare_measure == "Top Player":
+            metric_col = f"top_{metric_col}"
+
+        # One batched lookup for every selected coach
+        compare_df = careers.compare(coaches, compare_position, metric_col, league=league).rename(
+            columns={metric_col: metric_label}
+        )
+
+        if compare_df.empty:
+            st.info(f"No {compare_position} data available for these coaches.")
+            return
+
+        compare_chart = alt.Chart(compare_df).mark_line(point=True).encode(
+            x=alt.X("season:O", title="Season"),
+            y=alt.Y(f"{metric_label}:Q", title=f"{compare_position} {metric_label} ({compare_measure})"),
+            color=alt.Color("Coach:N", title="Coach"),
+            tooltip=[
+                alt.Tooltip("Coach", title="Coach"),
+                alt.Tooltip("season", title="Season"),
+                alt.Tooltip(f"{metric_label}:Q", title=metric_label, format=".1f"),
+                alt.Tooltip("players", title=f"{compare_position}s Used")
+            ]
+        )
+
+        st.altair_chart(compare_chart, use_container_width=True)
+
+    coach_mode = st.radio(
+        "Mode:",
+        options=["Single Coach", "Compare Coaches"],
+        horizontal=True,
+        key="coach_mode"
+    )
+    if coach_mode == "Compare Coaches":
+        show_coach_comparison()
+        return
+
+    # Dropdown with sorted display labels, preselecting a coach chosen from the sidebar search
+    coach_options = sorted(current_coaches_df["Display"])
+    coach_default = next(
+        (i for i, d in enumerate(coach_options) if coach_display_map[d] == st.session_state.get("selected_coach")),
+        0
+    )
     coach_display_selected = st.selectbox(
         "Select a Coach (2025 HC/OC Only)",
-        sorted(current_coaches_df["Display"])
+        coach_options,
+        index=coach_default
     )
 
     # Get coach name
@@ -33,26 +184,52 @@ def show_coach_view(coaching_df, stats_df):
     st.write(f"**Selected:** {row_info['Coach']} ({row_info['Coach Type']}) – {row_info['Team Abbr']}")
 
     # ----------------------
-    # Get Coaching History
+    # Get Coaching History (pre-joined in the career index)
     # ----------------------
-    coach_history = coaching_df[
-        (coaching_df["Coach"] == coach_selected) &
-        (coaching_df["Coach Type"].isin(["Head Coach", "Offensive Coordinator"]))
-    ]
+    coach_history = careers.stints(coach_selected)
+
+    # ----------------------
+    # Coaches Like This One (offensive-profile nearest neighbors)
+    # ----------------------
+    def show_similar_coaches():
+        profile = similarity.coach_profile(coach_selected)
+        if profile is not None:
+            st.caption(f"Coaches whose offenses looked most like {coach_selected}'s HC/OC seasons.")
+        else:
+            # No history of their own: match on the offense they inherit
+            profile = similarity.team_profile(int(row_info["Team ID"]))
+            if profile is None:
+                st.info("No offensive profile available for this coach.")
+                return
+            st.caption(
+                f"{coach_selected} has no HC/OC history yet, so this matches on "
+                f"{row_info['Team Abbr']}'s {profile.name[0]} offense."
+            )
+
+        similar = similarity.nearest(profile, k=5, exclude=[coach_selected])
+        share_cols = [col for col in FEATURES if col.endswith(("_rate", "_share"))]
+        similar[share_cols] = (similar[share_cols] * 100).round(1)
+        similar["ppr_per_game"] = similar["ppr_per_game"].round(1)
+
+        st.dataframe(
+            similar.rename(columns={"Similarity": "Similarity (%)", **FEATURES}),
+            use_container_width=True,
+            hide_index=True
+        )
+
+    history_stats = careers.history(coach_selected)
+    if league is not None:
+        history_stats = league.rescore(history_stats)
+
+    # Rookies (no stats as HC/OC yet) see their closest matches up front
+    with st.expander("Coaches Like This One", expanded=history_stats.empty):
+        show_similar_coaches()
 
     # Handle rookie or no history
-    if coach_history.empty:
+    if coach_history.empty or history_stats.empty:
         st.info("No historical data available for this coach (rookie or no prior HC/OC experience).")
         return
 
-    # Merge with player stats
-    history_stats = stats_df.merge(
-        coach_history,
-        left_on=["season", "team_id"],
-        right_on=["Season", "Team ID"],
-        how="inner"
-    )
-
     # ----------------------
     # Season Filter
     # ----------------------
@@ -90,30 +267,19 @@ def show_coach_view(coaching_df, stats_df):
             st.info("No QB data available for this coach in the selected seasons.")
             return
 
-        # League-wide rank calculations
-        league_qb_data = stats_df[stats_df["position"] == "QB"].copy()
-        league_qb_data["Fantasy Rank"] = league_qb_data.groupby("season")["fantasy_points"] \
-            .rank(method="min", ascending=False).astype(int)
-        league_qb_data["PPR Rank"] = league_qb_data.groupby("season")["fantasy_points_ppr"] \
-            .rank(method="min", ascending=False).astype(int)
-
-        # Merge ranks into QB data
-        qb_data = qb_data.merge(
-            league_qb_data[["season", "player_id", "Fantasy Rank", "PPR Rank"]],
-            on=["season", "player_id"],
-            how="left"
-        )
+        # League-wide ranks (fantasy points & PPR)
+        qb_data = add_league_ranks(qb_data, "QB")
 
         # Common columns
         common_cols = ["season", "recent_team", "Coach Type", "player_display_name"]
 
         # Tabs for QB
-        tab1, tab2, tab3, tab4 = st.tabs([
+        tab1, tab2, tab3, tab4, *league_tab = st.tabs([
             "Passing Stats",
             "Rushing Stats",
             "Fantasy Points (Standard)",
             "Fantasy Points (PPR)"
-        ])
+        ] + league_tab_label)
 
         # Passing Tab
         with tab1:
@@ -163,28 +329,27 @@ def show_coach_view(coaching_df, stats_df):
                 hide_index=True
             )
 
+        # Fantasy League Tab
+        if league_tab:
+            with league_tab[0]:
+                show_league_points(qb_data, common_cols)
+
         # QB Fantasy Line Chart
         st.markdown("### QB Fantasy Points Year-Over-Year")
 
         scoring_choice = st.radio(
             "Scoring Format:",
-            options=["Standard", "PPR"],
+            options=list(scoring_formats),
             horizontal=True,
             key="qb_scoring_choice"
         )
 
-        metric_col = "fantasy_points" if scoring_choice == "Standard" else "fantasy_points_ppr"
-        metric_label = "Fantasy Points" if scoring_choice == "Standard" else "PPR Fantasy Points"
+        _, metric_col, metric_label = scoring_formats[scoring_choice]
 
         top_qbs = qb_data.loc[qb_data.groupby("season")[metric_col].idxmax()]
 
-        league_qbs = stats_df[stats_df["position"] == "QB"].copy()
-        league_qbs["Rank"] = league_qbs.groupby("season")[metric_col] \
-            .rank(method="min", ascending=False)
-        top32_qbs = league_qbs[league_qbs["Rank"] <= 32]
-
-        league_avg = top32_qbs.groupby("season")[metric_col].mean().reset_index()
-        league_avg.rename(columns={metric_col: metric_label}, inplace=True)
+        # League average (top 32 QBs)
+        league_avg = league_top_n_average("QB", metric_col, metric_label)
 
         coach_seasons = top_qbs["season"].unique()
         league_avg = league_avg[league_avg["season"].isin(coach_seasons)]
@@ -228,19 +393,8 @@ def show_coach_view(coaching_df, stats_df):
             st.info("No RB data available for this coach in the selected seasons.")
             return
 
-        # League-wide rank calculations (fantasy points & PPR)
-        league_rb_data = stats_df[stats_df["position"] == "RB"].copy()
-        league_rb_data["Fantasy Rank"] = league_rb_data.groupby("season")["fantasy_points"] \
-            .rank(method="min", ascending=False).astype(int)
-        league_rb_data["PPR Rank"] = league_rb_data.groupby("season")["fantasy_points_ppr"] \
-            .rank(method="min", ascending=False).astype(int)
-
-        # Merge ranks into RB data
-        coach_rbs = coach_rbs.merge(
-            league_rb_data[["season", "player_id", "Fantasy Rank", "PPR Rank"]],
-            on=["season", "player_id"],
-            how="left"
-        )
+        # League-wide ranks (fantasy points & PPR)
+        coach_rbs = add_league_ranks(coach_rbs, "RB")
 
         # Add yards per carry (formatted to 2 decimals)
         coach_rbs["yards_per_carry"] = coach_rbs.apply(
@@ -252,12 +406,12 @@ def show_coach_view(coaching_df, stats_df):
         common_cols = ["season", "recent_team", "Coach Type", "player_display_name"]
 
         # Tabs: Rushing, Receiving, Fantasy Std, Fantasy PPR
-        tab1, tab2, tab3, tab4 = st.tabs([
+        tab1, tab2, tab3, tab4, *league_tab = st.tabs([
             "Rushing Stats",
             "Receiving Stats",
             "Fantasy Points (Standard)",
             "Fantasy Points (PPR)"
-        ])
+        ] + league_tab_label)
 
         # --- Rushing Stats Tab ---
         with tab1:
@@ -326,6 +480,11 @@ def show_coach_view(coaching_df, stats_df):
                 hide_index=True
             )
 
+        # --- Fantasy Points (League) Tab ---
+        if league_tab:
+            with league_tab[0]:
+                show_league_points(coach_rbs, common_cols)
+
         # ----------------------------
         # RB Fantasy Points Line Chart (Top RB or Combined if RB2 in Top 40)
         # ----------------------------
@@ -334,72 +493,28 @@ def show_coach_view(coaching_df, stats_df):
         # Toggle between Standard and PPR scoring
         scoring_choice_rb = st.radio(
             "Scoring Format:",
-            options=["Standard", "PPR"],
+            options=list(scoring_formats),
             horizontal=True,
             key="rb_scoring_choice"
         )
 
         # Determine metric
-        if scoring_choice_rb == "Standard":
-            metric_col_rb = "fantasy_points"
-            metric_label_rb = "Fantasy Points"
-        else:
-            metric_col_rb = "fantasy_points_ppr"
-            metric_label_rb = "PPR Fantasy Points"
-
-        # League-wide RB data for top 40 ranking
-        league_rb_all = stats_df[stats_df["position"] == "RB"].copy()
-        league_rb_all["Rank"] = league_rb_all.groupby("season")[metric_col_rb] \
-            .rank(method="min", ascending=False)
+        _, metric_col_rb, metric_label_rb = scoring_formats[scoring_choice_rb]
 
-        # Filter top 40 RBs per season (league-wide)
-        top40_league_rbs = league_rb_all[league_rb_all["Rank"] <= 40]
+        # RB1 per season, plus RB2 if in the league-wide top 40
+        rb_room = position_room(coach_rbs, "RB", metric_col_rb)
 
         # ----------------------------
         # Build coach RB line data
         # ----------------------------
-        combined_rb_records = []
-
-        for season in coach_rbs["season"].unique():
-            season_rbs = coach_rbs[coach_rbs["season"] == season].copy()
-            if season_rbs.empty:
-                continue
-
-            # Sort by fantasy points
-            season_rbs = season_rbs.sort_values(by=metric_col_rb, ascending=False)
-
-            # Always take top RB
-            top_rb = season_rbs.iloc[0]
-
-            player_names = [top_rb["player_display_name"]]
-            total_points = top_rb[metric_col_rb]
-
-            # Check if RB2 qualifies (in league top 40)
-            if len(season_rbs) > 1:
-                rb2 = season_rbs.iloc[1]
-                rb2_rank = top40_league_rbs[
-                    (top40_league_rbs["season"] == season) &
-                    (top40_league_rbs["player_id"] == rb2["player_id"])
-                ]
-                if not rb2_rank.empty:
-                    player_names.append(rb2["player_display_name"])
-                    total_points += rb2[metric_col_rb]
-
-            combined_rb_records.append({
-                "season": season,
-                "Players": " / ".join(player_names),
-                metric_label_rb: total_points
-            })
-
-        rb_line_df = pd.DataFrame(combined_rb_records)
+        rb_line_df = room_totals(rb_room, metric_col_rb, metric_label_rb)
 
         # Handle empty case
         if rb_line_df.empty:
             st.info("No RB fantasy data available for this coach in the selected seasons.")
         else:
             # League average line (Top 40 RBs) filtered to coach's seasons
-            league_avg_rb = top40_league_rbs.groupby("season")[metric_col_rb].mean().reset_index()
-            league_avg_rb.rename(columns={metric_col_rb: metric_label_rb}, inplace=True)
+            league_avg_rb = league_top_n_average("RB", metric_col_rb, metric_label_rb)
 
             coach_seasons_rb = rb_line_df["season"].unique()
             league_avg_rb = league_avg_rb[league_avg_rb["season"].isin(coach_seasons_rb)]
@@ -440,54 +555,16 @@ def show_coach_view(coaching_df, stats_df):
             key="rb_usage_choice"
         )
 
-        # Prepare data
-        usage_records = []
-
-        for season in coach_rbs["season"].unique():
-            season_rbs = coach_rbs[coach_rbs["season"] == season].copy()
-            if season_rbs.empty:
-                continue
-
-            # Sort RBs by fantasy points
-            season_rbs = season_rbs.sort_values(by=metric_col_rb, ascending=False)
-
-            # Always take top RB
-            top_rb = season_rbs.iloc[0]
-
-            # Calculate usage for top RB
-            team_total_carries = season_rbs["team_total_plays"].iloc[0] - season_rbs["team_pass_attempts"].iloc[0]
-            team_total_plays = season_rbs["team_total_plays"].iloc[0]
-
-            top_run_usage = top_rb["carries"] / team_total_carries if team_total_carries > 0 else 0
-            top_total_usage = (top_rb["carries"] + top_rb["targets"]) / team_total_plays if team_total_plays > 0 else 0
-
-            usage_records.append({
-                "season": season,
-                "Player": top_rb["player_display_name"],
-                "Run Game Usage": top_run_usage * 100,
-                "Total Offensive Usage": top_total_usage * 100
-            })
-
-            # Check if RB2 qualifies (Top 40 league-wide)
-            if len(season_rbs) > 1:
-                rb2 = season_rbs.iloc[1]
-                rb2_rank = top40_league_rbs[
-                    (top40_league_rbs["season"] == season) &
-                    (top40_league_rbs["player_id"] == rb2["player_id"])
-                ]
-                if not rb2_rank.empty:
-                    rb2_run_usage = rb2["carries"] / team_total_carries if team_total_carries > 0 else 0
-                    rb2_total_usage = (rb2["carries"] + rb2["targets"]) / team_total_plays if team_total_plays > 0 else 0
-
-                    usage_records.append({
-                        "season": season,
-                        "Player": rb2["player_display_name"],
-                        "Run Game Usage": rb2_run_usage * 100,
-                        "Total Offensive Usage": rb2_total_usage * 100
-                    })
-
-        # Convert to DataFrame
-        usage_df = pd.DataFrame(usage_records)
+        # Usage of the same RB1/RB2 room, relative to the top RB's team totals
+        team_total_carries = rb_room["team_total_plays"] - rb_room["team_pass_attempts"]
+        usage_df = pd.DataFrame({
+            "season": rb_room["season"],
+            "Player": rb_room["player_display_name"],
+            "Run Game Usage": room_share(rb_room, rb_room["carries"], team_total_carries) * 100,
+            "Total Offensive Usage": room_share(
+                rb_room, rb_room["carries"] + rb_room["targets"], rb_room["team_total_plays"]
+            ) * 100
+        }).reset_index(drop=True)
 
         # Handle empty case
         if usage_df.empty:
@@ -521,19 +598,8 @@ def show_coach_view(coaching_df, stats_df):
         # Filter WR data
         wr_data = history_stats[history_stats["position"] == "WR"].copy()
 
-        # League-wide rank calculations (fantasy points & PPR)
-        league_wr_data = stats_df[stats_df["position"] == "WR"].copy()
-        league_wr_data["Fantasy Rank"] = league_wr_data.groupby("season")["fantasy_points"] \
-            .rank(method="min", ascending=False).astype(int)
-        league_wr_data["PPR Rank"] = league_wr_data.groupby("season")["fantasy_points_ppr"] \
-            .rank(method="min", ascending=False).astype(int)
-
-        # Merge ranks into WR data
-        wr_data = wr_data.merge(
-            league_wr_data[["season", "player_id", "Fantasy Rank", "PPR Rank"]],
-            on=["season", "player_id"],
-            how="left"
-        )
+        # League-wide ranks (fantasy points & PPR)
+        wr_data = add_league_ranks(wr_data, "WR")
 
         # Add yards per carry (2 decimals) for rushing tab
         wr_data["yards_per_carry"] = wr_data.apply(
@@ -545,12 +611,12 @@ def show_coach_view(coaching_df, stats_df):
         common_cols = ["season", "recent_team", "Coach Type", "player_display_name"]
 
         # Tabs: Receiving, Rushing, Fantasy Std, Fantasy PPR
-        tab1, tab2, tab3, tab4 = st.tabs([
+        tab1, tab2, tab3, tab4, *league_tab = st.tabs([
             "Receiving Stats",
             "Rushing Stats",
             "Fantasy Points (Standard)",
             "Fantasy Points (PPR)"
-        ])
+        ] + league_tab_label)
 
         # --- Receiving Stats Tab ---
         with tab1:
@@ -619,6 +685,11 @@ def show_coach_view(coaching_df, stats_df):
                 hide_index=True
             )
 
+        # --- Fantasy Points (League) Tab ---
+        if league_tab:
+            with league_tab[0]:
+                show_league_points(wr_data, common_cols)
+
         # ----------------------------
         # WR Fantasy Points Line Chart (Top WR or Combined if WR2 in Top 40)
         # ----------------------------
@@ -637,66 +708,20 @@ def show_coach_view(coaching_df, stats_df):
             # Scoring toggle
             scoring_choice_wr = st.radio(
                 "Scoring Format:",
-                options=["Standard", "PPR"],
+                options=list(scoring_formats),
                 horizontal=True,
                 key="wr_scoring_choice"
             )
 
             # Determine metric
-            if scoring_choice_wr == "Standard":
-                metric_col_wr = "fantasy_points"
-                metric_label_wr = "Fantasy Points"
-            else:
-                metric_col_wr = "fantasy_points_ppr"
-                metric_label_wr = "PPR Fantasy Points"
-
-            # League-wide WR data for ranking
-            league_wr_data = stats_df[stats_df["position"] == "WR"].copy()
-            league_wr_data["Rank"] = league_wr_data.groupby("season")[metric_col_wr] \
-                .rank(method="min", ascending=False)
-
-            # Top 40 WRs league-wide
-            top40_league_wrs = league_wr_data[league_wr_data["Rank"] <= 40]
-
-            # Build combined WR records for each season
-            combined_wr_records = []
-
-            for season in coach_wrs["season"].unique():
-                season_wrs = coach_wrs[coach_wrs["season"] == season].copy()
-                if season_wrs.empty:
-                    continue
-
-                # Sort by fantasy points
-                season_wrs = season_wrs.sort_values(by=metric_col_wr, ascending=False)
-
-                # Always take top WR
-                top_wr = season_wrs.iloc[0]
-                player_names = [top_wr["player_display_name"]]
-                total_points = top_wr[metric_col_wr]
-
-                # Check if WR2 qualifies (in top 40 league-wide)
-                if len(season_wrs) > 1:
-                    wr2 = season_wrs.iloc[1]
-                    wr2_rank = top40_league_wrs[
-                        (top40_league_wrs["season"] == season) &
-                        (top40_league_wrs["player_id"] == wr2["player_id"])
-                    ]
-                    if not wr2_rank.empty:
-                        player_names.append(wr2["player_display_name"])
-                        total_points += wr2[metric_col_wr]
-
-                combined_wr_records.append({
-                    "season": season,
-                    "Players": " / ".join(player_names),
-                    metric_label_wr: total_points
-                })
+            _, metric_col_wr, metric_label_wr = scoring_formats[scoring_choice_wr]
 
-            # Convert to DataFrame
-            wr_line_df = pd.DataFrame(combined_wr_records)
+            # WR1 per season, plus WR2 if in the league-wide top 40
+            wr_room = position_room(coach_wrs, "WR", metric_col_wr)
+            wr_line_df = room_totals(wr_room, metric_col_wr, metric_label_wr)
 
             # League average (Top 40 WRs) filtered to coach seasons
-            league_avg_wr = top40_league_wrs.groupby("season")[metric_col_wr].mean().reset_index()
-            league_avg_wr.rename(columns={metric_col_wr: metric_label_wr}, inplace=True)
+            league_avg_wr = league_top_n_average("WR", metric_col_wr, metric_label_wr)
             league_avg_wr = league_avg_wr[league_avg_wr["season"].isin(wr_line_df["season"].unique())]
 
             # Build Altair lines
@@ -738,16 +763,8 @@ def show_coach_view(coaching_df, stats_df):
             # Convert target share to percentage
             wr_target_data["Target Share (%)"] = wr_target_data["target_share"] * 100
 
-            # Merge league ranks for tooltips
-            league_wr_ranks = stats_df[stats_df["position"] == "WR"].copy()
-            league_wr_ranks["Fantasy Rank"] = league_wr_ranks.groupby("season")["fantasy_points"] \
-                .rank(method="min", ascending=False).astype(int)
-
-            wr_target_data = wr_target_data.merge(
-                league_wr_ranks[["season", "player_id", "Fantasy Rank"]],
-                on=["season", "player_id"],
-                how="left"
-            )
+            # League ranks for tooltips
+            wr_target_data = add_league_ranks(wr_target_data, "WR", scorings=("std",))
 
             # Build Altair grouped bar chart
             target_chart = alt.Chart(wr_target_data).mark_bar().encode(
@@ -779,19 +796,8 @@ def show_coach_view(coaching_df, stats_df):
         # Filter TE data
         te_data = history_stats[history_stats["position"] == "TE"].copy()
 
-        # League-wide rank calculations (fantasy points & PPR) for TEs only
-        league_te_data = stats_df[stats_df["position"] == "TE"].copy()
-        league_te_data["Fantasy Rank"] = league_te_data.groupby("season")["fantasy_points"] \
-            .rank(method="min", ascending=False).astype(int)
-        league_te_data["PPR Rank"] = league_te_data.groupby("season")["fantasy_points_ppr"] \
-            .rank(method="min", ascending=False).astype(int)
-
-        # Merge ranks into TE data
-        te_data = te_data.merge(
-            league_te_data[["season", "player_id", "Fantasy Rank", "PPR Rank"]],
-            on=["season", "player_id"],
-            how="left"
-        )
+        # League-wide ranks (fantasy points & PPR)
+        te_data = add_league_ranks(te_data, "TE")
 
         # Add yards per carry (for rushing tab, though rarely relevant)
         te_data["yards_per_carry"] = te_data.apply(
@@ -803,12 +809,12 @@ def show_coach_view(coaching_df, stats_df):
         common_cols = ["season", "recent_team", "Coach Type", "player_display_name"]
 
         # Tabs: Receiving, Rushing, Fantasy Std, Fantasy PPR
-        tab1, tab2, tab3, tab4 = st.tabs([
+        tab1, tab2, tab3, tab4, *league_tab = st.tabs([
             "Receiving Stats",
             "Rushing Stats",
             "Fantasy Points (Standard)",
             "Fantasy Points (PPR)"
-        ])
+        ] + league_tab_label)
 
         # --- Receiving Stats Tab ---
         with tab1:
@@ -879,6 +885,11 @@ def show_coach_view(coaching_df, stats_df):
                 hide_index=True
             )
 
+        # --- Fantasy Points (League) Tab ---
+        if league_tab:
+            with league_tab[0]:
+                show_league_points(te_data, common_cols)
+
         # ----------------------------
         # TE Fantasy Points Line Chart (Top TE per Year)
         # ----------------------------
@@ -887,14 +898,13 @@ def show_coach_view(coaching_df, stats_df):
 
         scoring_choice_te = st.radio(
             "Scoring Format:",
-            options=["Standard", "PPR"],
+            options=list(scoring_formats),
             horizontal=True,
             key="te_scoring_choice"
         )
 
         # Metric selection
-        metric_col_te = "fantasy_points" if scoring_choice_te == "Standard" else "fantasy_points_ppr"
-        metric_label_te = "Fantasy Points" if scoring_choice_te == "Standard" else "PPR Fantasy Points"
+        _, metric_col_te, metric_label_te = scoring_formats[scoring_choice_te]
 
         coach_tes = history_stats[history_stats["position"] == "TE"].copy()
         top_tes = coach_tes.loc[
@@ -902,11 +912,7 @@ def show_coach_view(coaching_df, stats_df):
         ]
 
         # League average (top 32 TEs)
-        league_tes = stats_df[stats_df["position"] == "TE"].copy()
-        league_tes["Rank"] = league_tes.groupby("season")[metric_col_te].rank(method="min", ascending=False)
-        top32_tes = league_tes[league_tes["Rank"] <= 32]
-        league_avg_te = top32_tes.groupby("season")[metric_col_te].mean().reset_index()
-        league_avg_te.rename(columns={metric_col_te: metric_label_te}, inplace=True)
+        league_avg_te = league_top_n_average("TE", metric_col_te, metric_label_te)
 
         # Filter league avg to coach seasons
         league_avg_te = league_avg_te[league_avg_te["season"].isin(top_tes["season"])]
@@ -947,15 +953,7 @@ def show_coach_view(coaching_df, stats_df):
         else:
             te_target_data["Target Share (%)"] = te_target_data["target_share"] * 100
 
-            league_te_ranks = stats_df[stats_df["position"] == "TE"].copy()
-            league_te_ranks["Fantasy Rank"] = league_te_ranks.groupby("season")["fantasy_points"] \
-                .rank(method="min", ascending=False).astype(int)
-
-            te_target_data = te_target_data.merge(
-                league_te_ranks[["season", "player_id", "Fantasy Rank"]],
-                on=["season", "player_id"],
-                how="left"
-            )
+            te_target_data = add_league_ranks(te_target_data, "TE", scorings=("std",))
 
             target_chart_te = alt.Chart(te_target_data).mark_bar().encode(
                 x=alt.X("season:O", title="Season"),
@@ -0,0 +1,178 @@
+import streamlit as st
+
+from utils.draft_board import DEFAULT_LEAGUE_SETTINGS, DRAFT_POSITIONS, settings_key
+from utils.live_draft import DEFAULT_ROUNDS, ROSTER_NEED_WEIGHTS, LiveDraft
+from utils.scoring import SCORING_RULES, rules_key
+
+def show_draft_view(boards, scoring, league=None):
+    st.title("Draft Board (Value Over Replacement)")
+    scoring_label = league.label if league is not None else SCORING_RULES[scoring]["label"]
+    st.caption(
+        f"{scoring_label} scoring. A player's value (VOR) is their points in the basis season minus "
+        "the points of the last starter at their position in a league of this size, so every "
+        "position is ranked on one board. Tiers break at unusually large drops within a position."
+    )
+
+    # ----------------------
+    # League Settings
+    # ----------------------
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        season = st.selectbox("Basis Season:", options=boards.seasons, key="draft_season")
+    with col2:
+        teams = st.number_input(
+            "Teams:", min_value=4, max_value=20,
+            value=DEFAULT_LEAGUE_SETTINGS["teams"], step=1, key="draft_teams"
+        )
+    with col3:
+        flex = st.number_input(
+            "Flex Spots (RB/WR/TE):", min_value=0, max_value=4,
+            value=DEFAULT_LEAGUE_SETTINGS["flex"], step=1, key="draft_flex"
+        )
+
+    starters = {}
+    for col, pos in zip(st.columns(len(DRAFT_POSITIONS)), DRAFT_POSITIONS):
+        with col:
+            starters[pos] = st.number_input(
+                f"{pos} Starters:", min_value=0, max_value=4,
+                value=DEFAULT_LEAGUE_SETTINGS["starters"][pos], step=1, key=f"draft_starters_{pos}"
+            )
+
+    baselines = {}
+    with st.expander("Replacement Baselines"):
+        st.caption("Replacement rank per position; 0 derives it from the starting lineup and flex spots.")
+        for col, pos in zip(st.columns(len(DRAFT_POSITIONS)), DRAFT_POSITIONS):
+            with col:
+                baselines[pos] = st.number_input(
+                    f"{pos} Replacement Rank:", min_value=0, max_value=100,
+                    value=0, step=1, key=f"draft_baseline_{pos}"
+                )
+
+    settings = {
+        "season": season,
+        "teams": teams,
+        "starters": starters,
+        "flex": flex,
+        "baselines": baselines,
+    }
+    if sum(starters.values()) + flex == 0:
+        st.warning("The starting lineup is empty, so no player has value over replacement. Add starters or flex spots.")
+    board = boards.board(settings, scoring=scoring, league=league)
+
+    # ----------------------
+    # Replacement Levels
+    # ----------------------
+    replacement = board.groupby("position", observed=True)["Baseline"].first()
+    for col, pos in zip(st.columns(len(DRAFT_POSITIONS)), DRAFT_POSITIONS):
+        with col:
+            if pos in replacement.index:
+                st.metric(f"{pos} Replacement Points", f"{replacement[pos]:.1f}")
+
+    mode = st.radio("Mode:", options=["Board", "Live Draft"], horizontal=True, key="draft_mode")
+
+    # ----------------------
+    # Board
+    # ----------------------
+    if mode == "Board":
+        positions = st.multiselect(
+            "Positions:", options=DRAFT_POSITIONS, default=DRAFT_POSITIONS, key="draft_positions"
+        )
+        shown = board[board["position"].isin(positions)].drop(columns=["player_id"])
+        shown = shown.rename(columns={"position": "Pos"})
+        st.dataframe(shown, use_container_width=True, hide_index=True)
+        return
+
+    # ----------------------
+    # Live Draft
+    # ----------------------
+    draft_key = (rules_key(league.rules if league is not None else scoring), settings_key(settings))
+
+    def start_draft():
+        pool = boards.draft_pool(settings, scoring=scoring, league=league)
+        st.session_state.live_draft = LiveDraft(pool, settings, rounds=st.session_state.draft_rounds)
+        st.session_state.live_draft_key = draft_key
+
+    def draft_player():
+        st.session_state.live_draft.pick(st.session_state.draft_pick_player)
+
+    def undo_pick():
+        st.session_state.live_draft.undo()
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.number_input("Rounds:", min_value=1, max_value=25, value=DEFAULT_ROUNDS, step=1, key="draft_rounds")
+    with col2:
+        st.caption(
+            "Players on active rosters, valued on the basis season above. Starting a new draft "
+            "applies the current scoring and league settings."
+        )
+        st.button("Start New Draft", on_click=start_draft)
+
+    if "live_draft" not in st.session_state:
+        start_draft()
+    draft = st.session_state.live_draft
+    if st.session_state.live_draft_key != draft_key:
+        st.info("Scoring or league settings have changed since this draft started. Start a new draft to apply them.")
+
+    clock = draft.on_the_clock()
+    if clock is None:
+        st.subheader(f"Draft complete: {draft.total_picks} picks")
+    else:
+        draft_round, pick_in_round, team = clock
+        st.subheader(f"Pick {len(draft.picks) + 1} (Round {draft_round}, Pick {pick_in_round}): Team {team} on the clock")
+
+    available = draft.available()
+    labels = dict(zip(
+        available["player_id"],
+        available["Player"] + " (" + available["position"] + ", " + available["Team"] + ")"
+    ))
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        st.selectbox(
+            "Player:", options=list(labels), format_func=labels.get,
+            key="draft_pick_player", disabled=clock is None
+        )
+    with col2:
+        st.button("Draft Player", on_click=draft_player, disabled=clock is None or not labels)
+    with col3:
+        st.button("Undo Last Pick", on_click=undo_pick, disabled=not draft.picks)
+
+    # ----------------------
+    # Best Available
+    # ----------------------
+    best_cols = ["Player", "position", "Team", "VOR", "Need", "Score"]
+    st.markdown("### Best Available")
+    st.caption(
+        "Ranked by VOR weighted by the roster needs of the team on the clock: "
+        + ", ".join(f"{need} x{weight:g}" for need, weight in ROSTER_NEED_WEIGHTS.items())
+        + "."
+    )
+    st.dataframe(
+        draft.best_available(limit=12)[best_cols].rename(columns={"position": "Pos"}),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    for col, pos in zip(st.columns(len(DRAFT_POSITIONS)), DRAFT_POSITIONS):
+        with col:
+            st.markdown(f"**{pos}**")
+            st.dataframe(
+                draft.best_available(pos, limit=8)[["Player", "VOR", "Need"]],
+                use_container_width=True,
+                hide_index=True
+            )
+
+    # ----------------------
+    # Picks and Rosters
+    # ----------------------
+    with st.expander("Draft Log"):
+        log = draft.pick_log()[["Pick", "Round", "Drafted By", "Player", "position", "Team", "VOR"]]
+        st.dataframe(log.rename(columns={"position": "Pos"}), use_container_width=True, hide_index=True)
+
+    with st.expander("Team Rosters"):
+        roster_team = st.selectbox(
+            "Team:", options=list(range(1, draft.teams + 1)),
+            format_func=lambda team: f"Team {team}", key="draft_roster_team"
+        )
+        roster = draft.roster(roster_team - 1)[["Player", "position", "Team", "Points", "VOR"]]
+        st.dataframe(roster.rename(columns={"position": "Pos"}), use_container_width=True, hide_index=True)
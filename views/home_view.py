@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 
-def show_home_view(coaching_df, stats_df):
+def show_home_view(coaching_df, stats_df, staff):
     # ----------------------
     # Title & Intro
     # ----------------------
@@ -38,16 +38,6 @@ def show_home_view(coaching_df, stats_df):
     # ----------------------
     st.subheader("2024 Season Overview")
 
-    # ----------------------------
-    # Normalize Rams Abbreviation
-    # ----------------------------
-    coaching_df = coaching_df.copy()
-    coaching_df["Team Abbr"] = coaching_df["Team Abbr"].replace(
-        {"LA": "LAR", "STL": "LAR"}
-    )
-    # Ensure Rams get proper Team ID (18)
-    coaching_df.loc[coaching_df["Team Abbr"] == "LAR", "Team ID"] = 18
-
     # ----------------------------
     # Filter 2024 Data
     # ----------------------------
@@ -72,64 +62,14 @@ def show_home_view(coaching_df, stats_df):
     ).astype(int)
 
     # ----------------------------
-    # Merge Head Coach (non-interim)
-    # ----------------------------
-    hc_data = coaches_2024[coaches_2024["Coach Type"] == "Head Coach"]
-    team_agg = team_agg.merge(
-        hc_data[["Team ID", "Coach"]].rename(columns={"Coach": "Head Coach"}),
-        left_on="team_id",
-        right_on="Team ID",
-        how="left"
-    ).drop(columns="Team ID")
-
-    # ----------------------------
-    # Merge Offensive Coordinator (non-interim)
-    # ----------------------------
-    oc_data = coaches_2024[coaches_2024["Coach Type"] == "Offensive Coordinator"]
-    team_agg = team_agg.merge(
-        oc_data[["Team ID", "Coach"]].rename(columns={"Coach": "Offensive Coordinator"}),
-        left_on="team_id",
-        right_on="Team ID",
-        how="left"
-    ).drop(columns="Team ID")
-
-    # ----------------------------
-    # Handle HC-as-OC Fallback
-    # ----------------------------
-    hc_playcallers = hc_data[hc_data["Playing Calling Duties"].str.lower() == "yes"]
-    for idx, row in hc_playcallers.iterrows():
-        team_id = row["Team ID"]
-        if team_agg.loc[team_agg["team_id"] == team_id, "Offensive Coordinator"].isna().any():
-            team_agg.loc[team_agg["team_id"] == team_id, "Offensive Coordinator"] = row["Coach"]
-
+    # Coaching Staff (one vectorized lookup by team ID)
     # ----------------------------
-    # Aggregate Interim Coaches (Combine Names)
-    # ----------------------------
-    # Interim Head Coaches
-    interim_hc_combined = (
-        coaches_2024[coaches_2024["Coach Type"] == "Interim Head Coach"]
-        .groupby("Team ID")["Coach"]
-        .apply(lambda names: ", ".join(names))
-        .reset_index()
-        .rename(columns={"Coach": "Interim HC"})
-    )
-
-    # Interim Offensive Coordinators
-    interim_oc_combined = (
-        coaches_2024[coaches_2024["Coach Type"] == "Interim Offensive Coordinator"]
-        .groupby("Team ID")["Coach"]
-        .apply(lambda names: ", ".join(names))
-        .reset_index()
-        .rename(columns={"Coach": "Interim OC"})
-    )
-
-    # Merge aggregated interim HCs and OCs
-    team_agg = team_agg.merge(interim_hc_combined, left_on="team_id", right_on="Team ID", how="left").drop(columns="Team ID")
-    team_agg = team_agg.merge(interim_oc_combined, left_on="team_id", right_on="Team ID", how="left").drop(columns="Team ID")
-
-    # Fill blanks with "-"
-    team_agg["Interim HC"] = team_agg["Interim HC"].fillna("-")
-    team_agg["Interim OC"] = team_agg["Interim OC"].fillna("-")
+    coaches = staff.lookup(team_agg["team_id"], 2024).set_axis(team_agg.index)
+    team_agg["Head Coach"] = coaches["hc"]
+    # HC-as-OC fallback for head coaches who call their own plays
+    team_agg["Offensive Coordinator"] = coaches["oc"].fillna(coaches["play_caller"])
+    team_agg["Interim HC"] = coaches["interim_hc"].fillna("-")
+    team_agg["Interim OC"] = coaches["interim_oc"].fillna("-")
 
     # ----------------------------
     # Merge Team Abbreviation for Display
@@ -177,7 +117,7 @@ def show_home_view(coaching_df, stats_df):
 
     # Aggregate total fantasy points by team + position
     position_totals = (
-        fantasy_2024.groupby(["team_id", "position"], as_index=False)["fantasy_points"]
+        fantasy_2024.groupby(["team_id", "position"], as_index=False, observed=True)["fantasy_points"]
         .sum()
     )
 
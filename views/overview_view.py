@@ -1,33 +1,18 @@
 import streamlit as st
-import pandas as pd
 
-@st.cache_data
-def load_season_stats():
-    return pd.read_parquet("data/season_stats.parquet")
+from utils.coach_staff import ROLE_COLUMNS
+from utils.scoring import LEAGUE_POINTS
 
-@st.cache_data
-def load_coaching_data():
-    return pd.read_csv("utils/nfl_coaching_data - Coaching Staff.csv")
+# Datasets this view reads ({name: columns or None for all}), loaded on first use
+DATASETS = {
+    "season_stats": None,
+    "team_season_totals": None,
+    "coach_stint_stats": None,
+}
 
-def show_overview_view():
+def show_overview_view(season_stats, team_totals_df, stint_stats_df, staff, league=None):
     st.title("Overview")
 
-    # ----------------------
-    # Load and Clean Data
-    # ----------------------
-    season_stats = load_season_stats()
-    coaching_df = load_coaching_data()
-
-    # Standardize team abbreviations (handle relocations)
-    team_abbr_map = {
-        "LA": "LAR",   # Rams
-        "STL": "LAR",  # Old Rams
-        "SD": "LAC",   # Old Chargers
-        "OAK": "LV"    # Old Raiders
-    }
-    season_stats["recent_team"] = season_stats["recent_team"].replace(team_abbr_map)
-    coaching_df["Team Abbr"] = coaching_df["Team Abbr"].replace(team_abbr_map)
-
     # ----------------------
     # Tabs
     # ----------------------
@@ -43,19 +28,17 @@ def show_overview_view():
         available_seasons = sorted(season_stats["season"].unique(), reverse=True)
         selected_season = st.selectbox("Select Season", available_seasons, index=0, key="team_season_select")
 
-        # Filter season stats
-        team_df = season_stats[season_stats["season"] == selected_season]
-
-        # --- Aggregate Team Stats ---
-        team_agg = team_df.groupby(["recent_team"], as_index=False).agg({
-            "passing_yards": "sum",
-            "passing_tds": "sum",
-            "attempts": "sum",
-            "completions": "sum",
-            "rushing_yards": "sum",
-            "rushing_tds": "sum",
-            "carries": "sum"
-        })
+        # --- Team Stats (materialized at build time) ---
+        team_agg = team_totals_df[team_totals_df["season"] == selected_season][[
+            "recent_team",
+            "passing_yards",
+            "passing_tds",
+            "attempts",
+            "completions",
+            "rushing_yards",
+            "rushing_tds",
+            "carries"
+        ]]
 
         # --- Calculate Metrics ---
         team_agg["completion_pct"] = (team_agg["completions"] / team_agg["attempts"] * 100).round(1)
@@ -67,77 +50,18 @@ def show_overview_view():
         team_agg["run_pct"] = ((team_agg["carries"] / team_agg["total_plays"]) * 100).round(2)
 
         # ==============================================================
-        # Merge Coaching Data (Grouped by Role)
+        # Coaching Staff (HC/OC marked with * if an interim took over)
         # ==============================================================
-        coaches_season = coaching_df[coaching_df["Season"] == selected_season]
-
-        # --- Helper: group and join names ---
-        def group_coaches(df, role):
-            role_df = df[df["Coach Type"] == role].groupby("Team Abbr")["Coach"].agg(
-                lambda x: ", ".join(sorted(set(x.dropna())))
-            )
-            return role_df.reset_index()
-
-        # Group by roles
-        hc_df = group_coaches(coaches_season, "Head Coach")
-        oc_df = group_coaches(coaches_season, "Offensive Coordinator")
-        ihc_df = group_coaches(coaches_season, "Interim Head Coach")
-        ioc_df = group_coaches(coaches_season, "Interim Offensive Coordinator")
-
-        # --- Merge into team_agg ---
-        team_agg = team_agg.merge(hc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-            columns={"Coach": "HC"}
-        ).drop(columns="Team Abbr")
-
-        team_agg = team_agg.merge(oc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-            columns={"Coach": "OC"}
-        ).drop(columns="Team Abbr")
-
-        team_agg = team_agg.merge(ihc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-            columns={"Coach": "Interim HC"}
-        ).drop(columns="Team Abbr")
-
-        team_agg = team_agg.merge(ioc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-            columns={"Coach": "Interim OC"}
-        ).drop(columns="Team Abbr")
-
-        # ==============================================================
-        # Handle HC as OC (Play Calling Duties = Yes)
-        # ==============================================================
-        play_calling_hc = coaches_season[
-            (coaches_season["Coach Type"] == "Head Coach") &
-            (coaches_season["Playing Calling Duties"] == "Yes")
-        ][["Team Abbr", "Coach"]]
-
-        for team, coach in play_calling_hc.values:
-            team_agg.loc[
-                (team_agg["recent_team"] == team) & (team_agg["OC"].isna()),
-                "OC"
-            ] = coach
-
-        # ==============================================================
-        # Mark HC/OC with * if interim exists
-        # ==============================================================
-        team_agg["HC"] = team_agg.apply(
-            lambda x: f"{x['HC']}*" if pd.notna(x["Interim HC"]) and x["Interim HC"] != "-" else x["HC"],
-            axis=1
-        )
-        team_agg["OC"] = team_agg.apply(
-            lambda x: f"{x['OC']}*" if pd.notna(x["Interim OC"]) and x["Interim OC"] != "-" else x["OC"],
-            axis=1
-        )
-
-        # Fill missing interim and other coach roles with "-"
-        for col in ["HC", "OC", "Interim HC", "Interim OC"]:
-            team_agg[col] = team_agg[col].fillna("-")
+        coaches = staff.lookup(team_agg["recent_team"], selected_season, columns=ROLE_COLUMNS) \
+            .set_axis(team_agg.index)
+        hc = coaches["hc"].where(coaches["interim_hc"].isna(), coaches["hc"] + "*")
+        oc = coaches["oc"].where(coaches["interim_oc"].isna(), coaches["oc"] + "*")
 
+        team_agg["HC"] = hc.fillna("-")
         # If OC is missing but HC exists, set OC = HC (for dual-role coaches)
-        team_agg.loc[
-            (team_agg["OC"] == "-") & (team_agg["HC"] != "-"),
-            "OC"
-        ] = team_agg["HC"]
-
-
+        team_agg["OC"] = oc.fillna(hc).fillna("-")
+        team_agg["Interim HC"] = coaches["interim_hc"].fillna("-")
+        team_agg["Interim OC"] = coaches["interim_oc"].fillna("-")
 
         # ==============================================================
         # Rename columns for clean display
@@ -202,78 +126,22 @@ def show_overview_view():
             available_seasons = sorted(season_stats["season"].unique(), reverse=True)
             selected_season = st.selectbox("Select Season", available_seasons, index=0, key="coach_season_select")
 
-            # --- Filter data for selected season ---
-            season_coaches = coaching_df[coaching_df["Season"] == selected_season].copy()
-
-            # Merge season_stats with coaches (for all teams in season)
-            coach_stats = season_stats[season_stats["season"] == selected_season].copy()
-
             # ----------------------
-            # Get HC, OC, Interim HC, Interim OC per team
+            # Player stats per coaching stint (HC, OC and play-caller credited by week)
             # ----------------------
-            def get_coach_by_role(df, role):
-                return (
-                    df[df["Coach Type"] == role]
-                    .groupby("Team Abbr")["Coach"]
-                    .agg(lambda x: ", ".join(sorted(set(x.dropna()))))
-                    .reset_index()
-                )
-
-            hc_df = get_coach_by_role(season_coaches, "Head Coach")
-            oc_df = get_coach_by_role(season_coaches, "Offensive Coordinator")
-            ihc_df = get_coach_by_role(season_coaches, "Interim Head Coach")
-            ioc_df = get_coach_by_role(season_coaches, "Interim Offensive Coordinator")
+            coach_stats = stint_stats_df[stint_stats_df["season"] == selected_season]
 
-            # Merge coaches into stats
-            coach_stats = coach_stats.merge(hc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-                columns={"Coach": "HC"}
-            ).drop(columns="Team Abbr")
+            def coach_label(name_col, interim_col):
+                names = coach_stats[name_col].astype(str)
+                names = names.where(~coach_stats[interim_col].eq(True), names + " (Interim)")
+                return names.where(coach_stats[name_col].notna(), "-")
 
-            coach_stats = coach_stats.merge(oc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-                columns={"Coach": "OC"}
-            ).drop(columns="Team Abbr")
-
-            coach_stats = coach_stats.merge(ihc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-                columns={"Coach": "Interim HC"}
-            ).drop(columns="Team Abbr")
-
-            coach_stats = coach_stats.merge(ioc_df, how="left", left_on="recent_team", right_on="Team Abbr").rename(
-                columns={"Coach": "Interim OC"}
-            ).drop(columns="Team Abbr")
-
-            # ==============================================================
-            # Handle HC as OC (Play Calling Duties = Yes)
-            # ==============================================================
-            play_calling_hc = season_coaches[
-                (season_coaches["Coach Type"] == "Head Coach") &
-                (season_coaches["Playing Calling Duties"] == "Yes")
-            ][["Team Abbr", "Coach"]]
-
-            # Update OC column to match HC for these teams
-            for team, coach in play_calling_hc.values:
-                coach_stats.loc[coach_stats["recent_team"] == team, "OC"] = coach
-
-            # If OC is still "-" but HC exists, fallback to HC
-            coach_stats.loc[
-                (coach_stats["OC"].isna()) & (coach_stats["HC"].notna()),
-                "OC"
-            ] = coach_stats["HC"]
-
-            # ==============================================================
-            # Mark HC/OC with * if interim exists
-            # ==============================================================
-            coach_stats["HC"] = coach_stats.apply(
-                lambda x: f"{x['HC']}*" if pd.notna(x["Interim HC"]) and x["Interim HC"] != "-" else x["HC"],
-                axis=1
-            )
-            coach_stats["OC"] = coach_stats.apply(
-                lambda x: f"{x['OC']}*" if pd.notna(x["Interim OC"]) and x["Interim OC"] != "-" else x["OC"],
-                axis=1
-            )
-
-            # Fill missing coaches with "-"
-            for col in ["HC", "OC", "Interim HC", "Interim OC"]:
-                coach_stats[col] = coach_stats[col].fillna("-")
+            play_callers = coach_stats["play_caller"].astype(str).where(coach_stats["play_caller"].notna(), "-")
+            coach_stats = coach_stats.assign(**{
+                "HC": coach_label("hc", "hc_interim"),
+                "OC": coach_label("oc", "oc_interim"),
+                "Play Caller": play_callers
+            })
 
             # ----------------------
             # Filter fantasy-relevant positions (QB/RB/WR/TE) + trick plays
@@ -295,29 +163,27 @@ def show_overview_view():
             # Overall Offense Tab
             # ==============================================================
             with subtab_overall:
-                agg = coach_stats.groupby(["recent_team", "HC", "OC", "Interim HC", "Interim OC"], as_index=False).agg({
+                agg = coach_stats.groupby(["recent_team", "HC", "OC", "Play Caller"], as_index=False, observed=True).agg({
                     "passing_yards": "sum",
                     "passing_tds": "sum",
                     "attempts": "sum",
                     "completions": "sum",
                     "rushing_yards": "sum",
                     "rushing_tds": "sum",
-                    "carries": "sum",
-                    "team_total_plays": "sum",
-                    "team_pass_attempts": "sum"
+                    "carries": "sum"
                 })
 
                 # Derived metrics
                 agg["Total Yards"] = agg["passing_yards"] + agg["rushing_yards"]
                 agg["Total TDs"] = agg["passing_tds"] + agg["rushing_tds"]
-                agg["Total Plays"] = agg["team_total_plays"]
-                agg["Pass %"] = (agg["team_pass_attempts"] / agg["team_total_plays"] * 100).round(2)
+                agg["Total Plays"] = agg["attempts"] + agg["carries"]
+                agg["Pass %"] = (agg["attempts"] / agg["Total Plays"] * 100).round(2)
                 agg["Run %"] = 100 - agg["Pass %"]
 
                 agg.rename(columns={"recent_team": "Team"}, inplace=True)
 
                 display_cols_overall = [
-                    "Team", "HC", "OC", "Total Yards", "Total TDs", "Total Plays", "Pass %", "Run %", "Interim HC", "Interim OC"
+                    "Team", "HC", "OC", "Play Caller", "Total Yards", "Total TDs", "Total Plays", "Pass %", "Run %"
                 ]
                 st.dataframe(
                     agg[display_cols_overall]
@@ -332,8 +198,9 @@ def show_overview_view():
             # ==============================================================
             with subtab_passing:
                 passing = coach_stats.groupby(
-                    ["recent_team", "HC", "OC", "Interim HC", "Interim OC", "player_display_name", "position"],
-                    as_index=False
+                    ["recent_team", "HC", "OC", "Play Caller", "player_display_name", "position"],
+                    as_index=False,
+                    observed=True
                 ).agg({
                     "attempts": "sum",
                     "completions": "sum",
@@ -355,8 +222,8 @@ def show_overview_view():
                 }, inplace=True)
 
                 display_cols_passing = [
-                    "Team", "HC", "OC", "Player", "Position",
-                    "Pass Attempts", "Completions", "Completion %", "Pass TDs", "INTs", "Interim HC", "Interim OC"
+                    "Team", "HC", "OC", "Play Caller", "Player", "Position",
+                    "Pass Attempts", "Completions", "Completion %", "Pass TDs", "INTs"
                 ]
                 st.dataframe(
                     passing[display_cols_passing]
@@ -371,18 +238,18 @@ def show_overview_view():
             # ==============================================================
             with subtab_rushing:
                 rushing = coach_stats.groupby(
-                    ["recent_team", "HC", "OC", "Interim HC", "Interim OC", "player_display_name", "position"],
-                    as_index=False
+                    ["recent_team", "HC", "OC", "Play Caller", "player_display_name", "position"],
+                    as_index=False,
+                    observed=True
                 ).agg({
                     "carries": "sum",
                     "rushing_yards": "sum",
-                    "rushing_tds": "sum",
-                    "team_total_plays": "sum"
+                    "rushing_tds": "sum"
                 })
 
                 rushing = rushing[rushing["carries"] > 0]  # Filter out zero carries
                 rushing["Yards/Attempt"] = (rushing["rushing_yards"] / rushing["carries"]).round(1)
-                total_team_carries = rushing.groupby(["recent_team"])["carries"].transform("sum")
+                total_team_carries = rushing.groupby(["recent_team"], observed=True)["carries"].transform("sum")
                 rushing["Usage %"] = (rushing["carries"] / total_team_carries * 100).round(1)
 
                 rushing.rename(columns={
@@ -395,8 +262,8 @@ def show_overview_view():
                 }, inplace=True)
 
                 display_cols_rushing = [
-                    "Team", "HC", "OC", "Player", "Position",
-                    "Carries", "Rush Yards", "Yards/Attempt", "Usage %", "Rush TDs", "Interim HC", "Interim OC"
+                    "Team", "HC", "OC", "Play Caller", "Player", "Position",
+                    "Carries", "Rush Yards", "Yards/Attempt", "Usage %", "Rush TDs"
                 ]
                 st.dataframe(
                     rushing[display_cols_rushing]
@@ -411,8 +278,9 @@ def show_overview_view():
             # ==============================================================
             with subtab_receiving:
                 receiving = coach_stats.groupby(
-                    ["recent_team", "HC", "OC", "Interim HC", "Interim OC", "player_display_name", "position"],
-                    as_index=False
+                    ["recent_team", "HC", "OC", "Play Caller", "player_display_name", "position"],
+                    as_index=False,
+                    observed=True
                 ).agg({
                     "targets": "sum",
                     "receptions": "sum",
@@ -422,7 +290,7 @@ def show_overview_view():
 
                 receiving = receiving[receiving["receptions"] > 0]  # Filter out zero receptions
                 receiving["Catch %"] = (receiving["receptions"] / receiving["targets"] * 100).round(1)
-                total_team_targets = receiving.groupby(["recent_team"])["targets"].transform("sum")
+                total_team_targets = receiving.groupby(["recent_team"], observed=True)["targets"].transform("sum")
                 receiving["Target Share %"] = (receiving["targets"] / total_team_targets * 100).round(1)
 
                 receiving.rename(columns={
@@ -436,8 +304,8 @@ def show_overview_view():
                 }, inplace=True)
 
                 display_cols_receiving = [
-                    "Team", "HC", "OC", "Player", "Position",
-                    "Targets", "Receptions", "Catch %", "Target Share %", "Receiving Yards", "Receiving TDs", "Interim HC", "Interim OC"
+                    "Team", "HC", "OC", "Play Caller", "Player", "Position",
+                    "Targets", "Receptions", "Catch %", "Target Share %", "Receiving Yards", "Receiving TDs"
                 ]
                 st.dataframe(
                     receiving[display_cols_receiving]
@@ -451,37 +319,45 @@ def show_overview_view():
             # Fantasy Tab (League-Wide Overall Ranks)
             # ==============================================================
             with subtab_fantasy:
+                # --- Points columns: Standard, PPR and the league's custom rule set (if any) ---
+                season_rows = season_stats[season_stats["season"] == selected_season]
+                fantasy_stats = coach_stats
+                point_cols = ["fantasy_points", "fantasy_points_ppr"]
+                rank_labels = {"fantasy_points": "Std Rank", "fantasy_points_ppr": "PPR Rank"}
+                if league is not None:
+                    season_rows = league.rescore(season_rows)
+                    fantasy_stats = league.rescore_totals(coach_stats)
+                    point_cols.append(LEAGUE_POINTS)
+                    rank_labels[LEAGUE_POINTS] = f"{league.label} Rank"
+
                 # --- Compute league-wide totals for the selected season only ---
-                league_ranks = season_stats[season_stats["season"] == selected_season].groupby(
-                    ["player_display_name"], as_index=False
-                ).agg({
-                    "fantasy_points": "sum",
-                    "fantasy_points_ppr": "sum"
-                })
+                league_ranks = season_rows.groupby(
+                    ["player_display_name"], as_index=False, observed=True
+                ).agg({col: "sum" for col in point_cols})
 
                 # Overall ranks across ALL players (not positional) for selected season
-                league_ranks["Std Rank"] = league_ranks["fantasy_points"] \
-                    .rank(method="min", ascending=False).astype(int)
-                league_ranks["PPR Rank"] = league_ranks["fantasy_points_ppr"] \
-                    .rank(method="min", ascending=False).astype(int)
+                for col, rank_label in rank_labels.items():
+                    league_ranks[rank_label] = league_ranks[col] \
+                        .rank(method="min", ascending=False).astype(int)
 
                 # --- Coach-specific fantasy data (filtered to selected season already) ---
-                fantasy = coach_stats.groupby(
-                    ["recent_team", "HC", "OC", "Interim HC", "Interim OC", "player_display_name", "position"],
-                    as_index=False
+                fantasy = fantasy_stats.groupby(
+                    ["recent_team", "HC", "OC", "Play Caller", "player_display_name", "position"],
+                    as_index=False,
+                    observed=True
                 ).agg({
-                    "fantasy_points": "sum",
-                    "fantasy_points_pg": "mean",
-                    "fantasy_points_ppr": "sum",
-                    "fantasy_points_ppr_pg": "mean"
+                    **{col: "sum" for col in point_cols},
+                    "games_played": "sum"
                 })
+                fantasy["fantasy_points_pg"] = fantasy["fantasy_points"] / fantasy["games_played"]
+                fantasy["fantasy_points_ppr_pg"] = fantasy["fantasy_points_ppr"] / fantasy["games_played"]
 
                 # Filter out players with 0 points
                 fantasy = fantasy[(fantasy["fantasy_points"] > 0) | (fantasy["fantasy_points_ppr"] > 0)]
 
                 # Merge in league-wide ranks (already filtered to selected season)
                 fantasy = fantasy.merge(
-                    league_ranks[["player_display_name", "Std Rank", "PPR Rank"]],
+                    league_ranks[["player_display_name", *rank_labels.values()]],
                     on="player_display_name",
                     how="left"
                 ).drop_duplicates()
@@ -499,17 +375,24 @@ def show_overview_view():
 
                 # Ensure renamed columns exist before display
                 required_cols = [
-                    "Team", "HC", "OC", "Player", "Position",
+                    "Team", "HC", "OC", "Play Caller", "Player", "Position",
                     "Standard Total Points", "Standard PPG", "Std Rank",
-                    "PPR Total Points", "PPR PPG", "PPR Rank", "Interim HC", "Interim OC"
+                    "PPR Total Points", "PPR PPG", "PPR Rank"
                 ]
+                sort_col = "Standard Total Points"
+                if league is not None:
+                    # League scoring leads the table when a custom rule set is chosen
+                    fantasy[f"{league.label} PPG"] = fantasy[LEAGUE_POINTS] / fantasy["games_played"]
+                    fantasy = fantasy.rename(columns={LEAGUE_POINTS: f"{league.label} Total Points"})
+                    sort_col = f"{league.label} Total Points"
+                    required_cols += [sort_col, f"{league.label} PPG", f"{league.label} Rank"]
                 missing_cols = [c for c in required_cols if c not in fantasy.columns]
                 if missing_cols:
                     st.error(f"Missing columns in fantasy dataframe: {missing_cols}")
                 else:
                     st.dataframe(
                         fantasy[required_cols]
-                        .sort_values(by=["Standard Total Points"], ascending=False)
+                        .sort_values(by=[sort_col], ascending=False)
                         .reset_index(drop=True),
                         use_container_width=True,
                         hide_index=True
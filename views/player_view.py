@@ -2,37 +2,48 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 
-def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active_contracts_df):
+from utils.scoring import LEAGUE_POINTS, LEAGUE_POINTS_PG
+
+# Datasets this view reads ({name: columns or None for all}), loaded on first use.
+# Per-player rows (season, roster, contracts) come from the shared player index, weekly rows on demand.
+DATASETS = {
+    "team_season_totals": ["season", "recent_team", "targets", "total_yards"],
+}
+
+def show_player_view(team_totals_df, staff, players, search, league=None):
     st.title("Player View")
-    # Normalize Rams abbreviation: LA -> LAR (Team ID 18)
-    stats_df.loc[stats_df["recent_team"] == "LA", "recent_team"] = "LAR"
-    weekly_df.loc[weekly_df["recent_team"] == "LA", "recent_team"] = "LAR"
     # ----------------------
-    # Filter Active Rosters to Fantasy Positions
+    # Player Selection (active QB/RB/WR/TE rosters)
     # ----------------------
-    fantasy_positions = ["QB", "RB", "WR", "TE"]
-    rosters_filtered = active_rosters_df[active_rosters_df["position"].isin(fantasy_positions)].copy()
-
-    # Build dropdown label
-    rosters_filtered["Display"] = (
-        rosters_filtered["player_name"] + " – " +
-        rosters_filtered["team"] + " (" + rosters_filtered["position"] + ")"
+    query = st.text_input(
+        "Filter Players:",
+        key="player_search",
+        placeholder="Name, team or position, e.g. \"mahomes\" or \"kc wr\""
     )
 
-    # Dropdown
-    selected_display = st.selectbox(
+    options = search.options(kinds=["player"])
+    if query:
+        matches = [result["entry"] for result in search.search(query, kinds=["player"], limit=25)]
+        if matches:
+            options = matches
+        else:
+            st.info(f"No active QB/RB/WR/TE matches \"{query}\"; showing every player.")
+
+    # Chosen from the sidebar search, or earlier in this session
+    selected_entry = search.entry_id("player", st.session_state.get("player_selected"))
+    selected_entry = st.selectbox(
         "Select Player:",
-        sorted(rosters_filtered["Display"])
+        options,
+        index=options.index(selected_entry) if selected_entry in options else 0,
+        format_func=search.label
     )
-
-    # Extract player_id for selected player
-    selected_row = rosters_filtered[rosters_filtered["Display"] == selected_display].iloc[0]
-    player_id = selected_row["player_id"]  # Matches gsis_id in contracts_df
+    player_id = search.entries[selected_entry]["id"]  # Matches gsis_id in contracts_df
+    st.session_state.player_selected = player_id
 
     # ----------------------
     # Contract & Draft Details
     # ----------------------
-    contract_info = active_contracts_df[active_contracts_df["gsis_id"] == player_id]
+    contract_info = players.rows("active_contracts", player_id)
 
     if not contract_info.empty:
         contract_row = contract_info.iloc[0]
@@ -121,7 +132,7 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
     # ----------------------
     # Player Seasonal Stats Table
     # ----------------------
-    player_stats = stats_df[stats_df["player_id"] == player_id].copy()
+    player_stats = players.rows("season_stats", player_id).copy()
     if player_stats.empty:
         st.info("No historical stats available for this player.")
         return
@@ -138,59 +149,30 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
         player_stats["receiving_tds"].fillna(0)
     )
 
-    # Merge HC/OC from coaching_df
-    coach_merge = coaching_df[
-        coaching_df["Coach Type"].isin([
-            "Head Coach", "Offensive Coordinator",
-            "Interim Head Coach", "Interim Offensive Coordinator"
-        ])
-    ][["Season", "Team Abbr", "Coach", "Coach Type"]]
-
-    coach_pivot = coach_merge.pivot_table(
-        index=["Season", "Team Abbr"],
-        columns="Coach Type",
-        values="Coach",
-        aggfunc="first"
-    ).reset_index()
-
-    # Rename interim columns for clarity
-    coach_pivot.rename(columns={
-        "Head Coach": "HC",
-        "Offensive Coordinator": "OC",
-        "Interim Head Coach": "Interim HC",
-        "Interim Offensive Coordinator": "Interim OC"
-    }, inplace=True)
-
-    # Merge with player stats
-    player_stats = player_stats.merge(
-        coach_pivot,
-        left_on=["season", "recent_team"],
-        right_on=["Season", "Team Abbr"],
-        how="left"
-    )
-
-    # Build coach label
-    def build_coach_label(row):
-        hc_str = f"HC: {row['HC']}" if pd.notnull(row['HC']) else ""
-        if pd.notnull(row.get("Interim HC")):
-            hc_str += f" (Interim: {row['Interim HC']})"
-        oc_str = f"OC: {row['OC']}" if pd.notnull(row['OC']) else ""
-        if pd.notnull(row.get("Interim OC")):
-            oc_str += f" (Interim: {row['Interim OC']})"
-        return ", ".join(filter(None, [hc_str, oc_str]))
+    # HC/OC and tooltip label from the shared coaching staff index
+    coaches = staff.lookup(player_stats["recent_team"], player_stats["season"], columns=["hc", "oc", "label"])
+    player_stats["HC"] = coaches["hc"].to_numpy()
+    player_stats["OC"] = coaches["oc"].to_numpy()
+    player_stats["Coach Label"] = coaches["label"].fillna("").to_numpy()
 
-    player_stats["Coach Label"] = player_stats.apply(build_coach_label, axis=1)
+    # Season points under the league's custom rule set, if one is chosen
+    point_cols = ["fantasy_points", "fantasy_points_ppr"]
+    per_game_cols = ["fantasy_points_pg", "fantasy_points_ppr_pg"]
+    if league is not None:
+        player_stats = league.rescore(player_stats)
+        point_cols.append(LEAGUE_POINTS)
+        per_game_cols.append(LEAGUE_POINTS_PG)
 
     # ----------------------
     # Tables
     # ----------------------
     common_cols = ["season", "recent_team", "HC", "OC"]
 
-    tab1, tab2, tab3 = st.tabs([
+    tab1, tab2, tab3, *league_tab = st.tabs([
         "Total Yards & TDs",
         "Fantasy Points (Standard)",
         "Fantasy Points (PPR)"
-    ])
+    ] + ([f"Fantasy Points ({league.label})"] if league is not None else []))
 
     with tab1:
         st.dataframe(
@@ -234,6 +216,21 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
             hide_index=True
         )
 
+    if league_tab:
+        with league_tab[0]:
+            st.dataframe(
+                player_stats[common_cols + [LEAGUE_POINTS, LEAGUE_POINTS_PG]]
+                .rename(columns={
+                    "season": "Season",
+                    "recent_team": "Team",
+                    LEAGUE_POINTS: f"{league.label} Points",
+                    LEAGUE_POINTS_PG: f"{league.label} Points/Game"
+                })
+                .sort_values(by="Season", ascending=False),
+                use_container_width=True,
+                hide_index=True
+            )
+
     # ----------------------
     # Line Charts with Radio Toggle
     # ----------------------
@@ -249,7 +246,7 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
         total_df = pd.melt(
             player_stats,
             id_vars=["season", "Coach Label"],
-            value_vars=["fantasy_points", "fantasy_points_ppr"],
+            value_vars=point_cols,
             var_name="metric",
             value_name="value"
         )
@@ -273,7 +270,7 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
         pg_df = pd.melt(
             player_stats,
             id_vars=["season", "Coach Label"],
-            value_vars=["fantasy_points_pg", "fantasy_points_ppr_pg"],
+            value_vars=per_game_cols,
             var_name="metric",
             value_name="value"
         )
@@ -315,13 +312,8 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
     elif position == "RB":
         bar_data = player_stats.copy()
 
-        # Calculate team total yards
-        team_totals = stats_df.groupby(["season", "recent_team"])[
-            ["passing_yards", "rushing_yards", "receiving_yards"]
-        ].sum().reset_index()
-        team_totals["team_total_yards"] = (
-            team_totals["passing_yards"] + team_totals["rushing_yards"] + team_totals["receiving_yards"]
-        )
+        # Team total yards (passing + rushing + receiving), materialized at build time
+        team_totals = team_totals_df.rename(columns={"total_yards": "team_total_yards"})
 
         bar_data = bar_data.merge(
             team_totals[["season", "recent_team", "team_total_yards"]],
@@ -340,8 +332,8 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
     elif position == "WR":
         bar_data = player_stats.copy()
 
-        team_targets = stats_df.groupby(["season", "recent_team"])["targets"].sum().reset_index()
-        team_targets.rename(columns={"targets": "team_targets"}, inplace=True)
+        team_targets = team_totals_df[["season", "recent_team", "targets"]] \
+            .rename(columns={"targets": "team_targets"})
 
         bar_data = bar_data.merge(team_targets, on=["season", "recent_team"], how="left")
 
@@ -356,8 +348,8 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
     elif position == "TE":
         bar_data = player_stats.copy()
 
-        team_targets = stats_df.groupby(["season", "recent_team"])["targets"].sum().reset_index()
-        team_targets.rename(columns={"targets": "team_targets"}, inplace=True)
+        team_targets = team_totals_df[["season", "recent_team", "targets"]] \
+            .rename(columns={"targets": "team_targets"})
 
         bar_data = bar_data.merge(team_targets, on=["season", "recent_team"], how="left")
 
@@ -389,37 +381,59 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
 
 
     # -------------------------------------------------
-    # Weekly Fantasy Points Chart (2024 Season)
+    # Weekly Fantasy Points Chart (any season, week range)
     # -------------------------------------------------
-    st.markdown("### Weekly Fantasy Points (2024 Season)")
+    weekly_seasons = players.weekly_seasons(player_id)
+    if not weekly_seasons:
+        st.markdown("### Weekly Fantasy Points")
+        st.info("No weekly data available for this player.")
+        return
+
+    # Season x week grid for every season, cached per player by the index
+    weekly_grid = players.weekly_grid(player_id)
+
+    season_col, week_col = st.columns([1, 3])
+    with season_col:
+        weekly_season = st.selectbox("Weekly Season:", weekly_seasons)
 
-    weekly_stats = weekly_df[
-        (weekly_df["player_id"] == player_id) &
-        (weekly_df["season"] == 2024)
-    ].copy()
+    season_weeks = weekly_grid[weekly_grid["season"] == weekly_season]
+    last_week = int(season_weeks["week"].max())
+    with week_col:
+        if last_week > 1:
+            first_week, last_week = st.slider("Weeks:", 1, last_week, (1, last_week))
+        else:
+            first_week = 1
+
+    st.markdown(f"### Weekly Fantasy Points ({weekly_season} Season)")
+
+    # Weeks the player has a stat line for
+    weekly_stats = season_weeks[
+        season_weeks["week"].between(first_week, last_week) & season_weeks["recent_team"].notna()
+    ]
 
     if weekly_stats.empty:
-        st.info("No weekly data available for 2024 season.")
+        st.info(f"No weekly data available for weeks {first_week}–{last_week} of the {weekly_season} season.")
     else:
-        weekly_stats = weekly_stats.merge(
-            coach_pivot,
-            left_on=["season", "recent_team"],
-            right_on=["Season", "Team Abbr"],
-            how="left"
+        weekly_stats = weekly_stats.assign(
+            **{"Coach Label": staff.labels(weekly_stats["recent_team"], weekly_stats["season"]).to_numpy()}
         )
-        weekly_stats["Coach Label"] = weekly_stats.apply(build_coach_label, axis=1)
+        if league is not None:
+            weekly_stats = weekly_stats.assign(
+                **{LEAGUE_POINTS: league.weekly(player_id, weekly_stats["season"], weekly_stats["week"])}
+            )
 
         weekly_melted = pd.melt(
             weekly_stats,
             id_vars=["week", "Coach Label"],
-            value_vars=["fantasy_points", "fantasy_points_ppr"],
+            value_vars=point_cols,
             var_name="metric",
             value_name="value"
         )
 
         metric_map = {
             "fantasy_points": "Standard",
-            "fantasy_points_ppr": "PPR"
+            "fantasy_points_ppr": "PPR",
+            LEAGUE_POINTS: league.label if league is not None else "League"
         }
         weekly_melted["metric"] = weekly_melted["metric"].map(metric_map)
 
@@ -438,3 +452,36 @@ def show_player_view(coaching_df, stats_df, weekly_df, active_rosters_df, active
         )
 
         st.altair_chart(weekly_chart, use_container_width=True)
+
+    # -------------------------------------------------
+    # Weekly Heatmap (all seasons)
+    # -------------------------------------------------
+    st.markdown("### Weekly Fantasy Points by Season")
+
+    heatmap_columns = {"PPR": "fantasy_points_ppr", "Standard": "fantasy_points"}
+    if league is not None:
+        heatmap_columns[league.label] = LEAGUE_POINTS
+        weekly_grid = weekly_grid.assign(
+            **{LEAGUE_POINTS: league.weekly(player_id, weekly_grid["season"], weekly_grid["week"])}
+        )
+
+    heatmap_scoring = st.radio("Heatmap Scoring:", list(heatmap_columns), horizontal=True)
+    heatmap_col = heatmap_columns[heatmap_scoring]
+
+    # Weeks without a stat line are null and left blank
+    heatmap = alt.Chart(weekly_grid).mark_rect().encode(
+        x=alt.X("week:O", title="Week"),
+        y=alt.Y("season:O", title="Season", sort="descending"),
+        color=alt.Color(f"{heatmap_col}:Q", title="Fantasy Points", scale=alt.Scale(scheme="viridis")),
+        tooltip=[
+            alt.Tooltip("season", title="Season"),
+            alt.Tooltip("week", title="Week"),
+            alt.Tooltip("recent_team", title="Team"),
+            alt.Tooltip(heatmap_col, title="Fantasy Points")
+        ]
+    ).properties(
+        width="container",
+        height=max(120, 28 * len(weekly_seasons))
+    )
+
+    st.altair_chart(heatmap, use_container_width=True)
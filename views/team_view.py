@@ -2,54 +2,16 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 
-def show_team_view(coaching_df, stats_df):
+# Datasets this view reads ({name: columns or None for all}), loaded on first use
+DATASETS = {
+    "coaching": None,
+    "team_season_totals": None,
+    "team_position_totals": None,
+}
+
+def show_team_view(coaching_df, team_totals_df, team_position_df, staff):
     st.title("NFL Team Fantasy Overview (2015–2025)")
 
-    # ----------------------
-    # Team Abbreviation Fixes
-    # ----------------------
-    team_abbr_mapping = {
-        # Rams historical abbreviations
-        "LA": "LAR",
-        "STL": "LAR",
-        # Chargers historical abbreviations
-        "SD": "LAC",
-        # Raiders historical abbreviations
-        "OAK": "LV"
-    }
-
-    # Normalize team abbreviations in both datasets
-    stats_df["recent_team"] = stats_df["recent_team"].replace(team_abbr_mapping)
-    coaching_df["Team Abbr"] = coaching_df["Team Abbr"].replace(team_abbr_mapping)
-
-    # Ensure Rams have correct team_id (18)
-    stats_df.loc[stats_df["recent_team"] == "LAR", "team_id"] = 18
-    coaching_df.loc[coaching_df["Team Abbr"] == "LAR", "Team ID"] = 18
-
-    # Remove duplicates after mapping
-    stats_df = stats_df.drop_duplicates()
-    coaching_df = coaching_df.drop_duplicates()
-
-    # ----------------------
-    # Helper: Get HC/OC/Interim Coaches for Tooltip
-    # ----------------------
-    def get_coach_roles(team_abbr, season):
-        season_data = coaching_df[
-            (coaching_df["Team Abbr"] == team_abbr) &
-            (coaching_df["Season"] == season)
-        ]
-        hc = season_data[season_data["Coach Type"] == "Head Coach"]["Coach"].values
-        oc = season_data[season_data["Coach Type"] == "Offensive Coordinator"]["Coach"].values
-        interim_hc = season_data[season_data["Coach Type"] == "Interim Head Coach"]["Coach"].values
-        interim_oc = season_data[season_data["Coach Type"] == "Interim Offensive Coordinator"]["Coach"].values
-
-        return {
-            "HC": hc[0] if len(hc) > 0 else "N/A",
-            "OC": oc[0] if len(oc) > 0 else "N/A",
-            "Interim HC": interim_hc[0] if len(interim_hc) > 0 else "N/A",
-            "Interim OC": interim_oc[0] if len(interim_oc) > 0 else "N/A"
-        }
-
     # ----------------------
     # CSS for Overview Boxes
     # ----------------------
@@ -101,20 +63,12 @@ def show_team_view(coaching_df, stats_df):
     # ----------------------
     # Prepare 2024 Overview Data
     # ----------------------
-    stats_2024 = stats_df[stats_df["season"] == 2024]
-    team_totals_2024 = stats_2024.groupby("recent_team").agg(
-        pass_yards=("passing_yards", "sum"),
-        rush_yards=("rushing_yards", "sum")
-    ).reset_index()
-
-    team_totals_2024["total_yards"] = (
-        team_totals_2024["pass_yards"] + team_totals_2024["rush_yards"]
-    )
-
-    # Compute ranks
-    team_totals_2024["pass_rank"] = team_totals_2024["pass_yards"].rank(ascending=False, method="min").astype(int)
-    team_totals_2024["rush_rank"] = team_totals_2024["rush_yards"].rank(ascending=False, method="min").astype(int)
-    team_totals_2024["total_rank"] = team_totals_2024["total_yards"].rank(ascending=False, method="min").astype(int)
+    # Team totals and ranks are materialized at build time (team_season_totals)
+    team_totals_2024 = team_totals_df[team_totals_df["season"] == 2024].rename(columns={
+        "pass_yards_rank": "pass_rank",
+        "rush_yards_rank": "rush_rank",
+        "offense_yards_rank": "total_rank",
+    })
 
     # ----------------------
     # Dropdown (deduplicated)
@@ -124,7 +78,14 @@ def show_team_view(coaching_df, stats_df):
         .drop_duplicates(subset=["Team Abbr"])
         .sort_values("Team Abbr")
     )
-    team_abbr = st.selectbox("Select a Team", team_options["Team Abbr"])
+    # Preselect a team chosen from the sidebar search
+    team_list = list(team_options["Team Abbr"])
+    selected_team = st.session_state.get("selected_team")
+    team_abbr = st.selectbox(
+        "Select a Team",
+        team_list,
+        index=team_list.index(selected_team) if selected_team in team_list else 0
+    )
     team_name = team_options.loc[team_options["Team Abbr"] == team_abbr, "Team"].values[0]
 
     # ----------------------
@@ -217,21 +178,20 @@ def show_team_view(coaching_df, stats_df):
     # ----------------------
     # Pass vs Rush Yards Chart (with ranks + coach tooltips)
     # ----------------------
-    yards_by_season = stats_df.groupby(["season", "recent_team"]).agg(
-        pass_yards=("passing_yards", "sum"),
-        rush_yards=("rushing_yards", "sum")
-    ).reset_index()
-
-    # Add ranks across all teams for each season
-    yards_by_season["pass_rank"] = yards_by_season.groupby("season")["pass_yards"].rank(ascending=False, method="min").astype(int)
-    yards_by_season["rush_rank"] = yards_by_season.groupby("season")["rush_yards"].rank(ascending=False, method="min").astype(int)
+    # Ranks across all teams for each season
+    yards_by_season = team_totals_df.rename(columns={
+        "passing_yards": "pass_yards",
+        "rushing_yards": "rush_yards",
+        "pass_yards_rank": "pass_rank",
+        "rush_yards_rank": "rush_rank",
+    })[["season", "recent_team", "pass_yards", "rush_yards", "pass_rank", "rush_rank"]]
 
     # Filter for selected team
     yards_team = yards_by_season[yards_by_season["recent_team"] == team_abbr].copy()
 
     # Add coaching info
-    coach_roles_yards = yards_team["season"].apply(lambda s: get_coach_roles(team_abbr, s))
-    yards_team = pd.concat([yards_team.reset_index(drop=True), pd.DataFrame(list(coach_roles_yards))], axis=1)
+    coach_roles_yards = staff.roles(team_abbr, yards_team["season"])
+    yards_team = pd.concat([yards_team.reset_index(drop=True), coach_roles_yards], axis=1)
 
     # Melt for chart
     yards_melted = yards_team.melt(
@@ -273,21 +233,20 @@ def show_team_view(coaching_df, stats_df):
     # ----------------------
     # Pass vs Rush TDs Chart (with ranks + coach tooltips)
     # ----------------------
-    tds_by_season = stats_df.groupby(["season", "recent_team"]).agg(
-        pass_tds=("passing_tds", "sum"),
-        rush_tds=("rushing_tds", "sum")
-    ).reset_index()
-
-    # Add ranks
-    tds_by_season["pass_rank"] = tds_by_season.groupby("season")["pass_tds"].rank(ascending=False, method="min").astype(int)
-    tds_by_season["rush_rank"] = tds_by_season.groupby("season")["rush_tds"].rank(ascending=False, method="min").astype(int)
+    # Ranks across all teams for each season
+    tds_by_season = team_totals_df.rename(columns={
+        "passing_tds": "pass_tds",
+        "rushing_tds": "rush_tds",
+        "pass_tds_rank": "pass_rank",
+        "rush_tds_rank": "rush_rank",
+    })[["season", "recent_team", "pass_tds", "rush_tds", "pass_rank", "rush_rank"]]
 
     # Filter for selected team
     tds_team = tds_by_season[tds_by_season["recent_team"] == team_abbr].copy()
 
     # Add coaching info
-    coach_roles_tds = tds_team["season"].apply(lambda s: get_coach_roles(team_abbr, s))
-    tds_team = pd.concat([tds_team.reset_index(drop=True), pd.DataFrame(list(coach_roles_tds))], axis=1)
+    coach_roles_tds = staff.roles(team_abbr, tds_team["season"])
+    tds_team = pd.concat([tds_team.reset_index(drop=True), coach_roles_tds], axis=1)
 
     # Melt for chart
     tds_melted = tds_team.melt(
@@ -330,25 +289,17 @@ def show_team_view(coaching_df, stats_df):
     # Pass vs Run Percentage Stacked Bar Chart (with coach tooltips)
     # ----------------------
 
-    team_stats = stats_df[stats_df["recent_team"] == team_abbr].copy()
-
-    team_pct_data = team_stats.groupby("season").agg(
-        total_plays=("team_total_plays", "mean"),
-        pass_attempts=("team_pass_attempts", "mean")
-    ).reset_index()
-
-    team_pct_data = team_stats.groupby("season").agg(
-        total_plays=("team_total_plays", "mean"),
-        pass_attempts=("team_pass_attempts", "mean")
-    ).reset_index()
-
-    team_pct_data["pass_pct"] = (team_pct_data["pass_attempts"] / team_pct_data["total_plays"]) * 100
+    team_pct_data = team_totals_df[team_totals_df["recent_team"] == team_abbr][
+        ["season", "attempts", "carries"]
+    ].sort_values("season")
+    team_pct_data["pass_pct"] = (
+        team_pct_data["attempts"] / (team_pct_data["attempts"] + team_pct_data["carries"])
+    ) * 100
     team_pct_data["run_pct"] = 100 - team_pct_data["pass_pct"]
 
     # Add coaching info for tooltip
-    coach_roles_pct = team_pct_data["season"].apply(lambda s: get_coach_roles(team_abbr, s))
-    coach_roles_df_pct = pd.DataFrame(list(coach_roles_pct))
-    team_pct_data = pd.concat([team_pct_data, coach_roles_df_pct], axis=1)
+    coach_roles_pct = staff.roles(team_abbr, team_pct_data["season"])
+    team_pct_data = pd.concat([team_pct_data.reset_index(drop=True), coach_roles_pct], axis=1)
 
     # Melt for stacked bar
     pct_melted = team_pct_data.melt(
@@ -390,21 +341,20 @@ def show_team_view(coaching_df, stats_df):
     # Target Share by Position (Stacked Bar with Tooltips)
     # ----------------------
 
-    # 1. Aggregate targets by position/season (WR/RB/TE)
-    target_data = stats_df[
-        (stats_df["recent_team"] == team_abbr) &
-        (stats_df["position"].isin(["WR", "RB", "TE"]))
-    ].groupby(["season", "position"]).agg(
-        total_targets=("targets", "sum")
-    ).reset_index()
+    # 1. Targets by position/season (WR/RB/TE), from the materialized team-position totals
+    target_data = team_position_df[
+        (team_position_df["recent_team"] == team_abbr) &
+        (team_position_df["position"].isin(["WR", "RB", "TE"]))
+    ][["season", "position", "targets"]].rename(columns={"targets": "total_targets"})
+    target_data = target_data.sort_values(["season", "position"]).reset_index(drop=True)
 
     # 2. Calculate target share percentage
     season_totals = target_data.groupby("season")["total_targets"].transform("sum")
     target_data["target_share"] = (target_data["total_targets"] / season_totals) * 100
 
     # 3. Add coach info for tooltip
-    coach_roles_target = target_data["season"].apply(lambda s: get_coach_roles(team_abbr, s))
-    target_data = pd.concat([target_data.reset_index(drop=True), pd.DataFrame(list(coach_roles_target))], axis=1)
+    coach_roles_target = staff.roles(team_abbr, target_data["season"])
+    target_data = pd.concat([target_data.reset_index(drop=True), coach_roles_target], axis=1)
 
     # 4. Stacked bar chart
     target_share_chart = (
@@ -436,27 +386,20 @@ def show_team_view(coaching_df, stats_df):
     # Total Fantasy Points by Position (Vertical Stacked Bar with ranks + coaches)
     # ----------------------
 
-    # 1. Aggregate fantasy points for ALL teams
-    fantasy_all = stats_df[
-        stats_df["position"].isin(["WR", "RB", "TE", "QB"])
-    ].groupby(["season", "recent_team", "position"]).agg(
-        total_fp=("fantasy_points_ppr", "sum")
-    ).reset_index()
-
-    # 2. Rank within each season + position (across all teams)
-    fantasy_all["fp_rank"] = fantasy_all.groupby(["season", "position"])["total_fp"].rank(
-        ascending=False, method="min"
-    ).astype(int)
-
-    # 3. Filter for the selected team
-    fantasy_data = fantasy_all[fantasy_all["recent_team"] == team_abbr].copy()
+    # 1-3. The team's PPR points per position, ranked across all teams at build time
+    fantasy_data = team_position_df[
+        team_position_df["recent_team"] == team_abbr
+    ][["season", "position", "fantasy_points_ppr", "ppr_rank"]].rename(
+        columns={"fantasy_points_ppr": "total_fp", "ppr_rank": "fp_rank"}
+    )
+    fantasy_data = fantasy_data.sort_values(["season", "position"]).reset_index(drop=True)
 
     # 4. Add coach info
-    coach_roles_fp = fantasy_data["season"].apply(lambda s: get_coach_roles(team_abbr, s))
-    fantasy_data = pd.concat([fantasy_data.reset_index(drop=True), pd.DataFrame(list(coach_roles_fp))], axis=1)
+    coach_roles_fp = staff.roles(team_abbr, fantasy_data["season"])
+    fantasy_data = pd.concat([fantasy_data.reset_index(drop=True), coach_roles_fp], axis=1)
 
     # 5. Rename positions for clarity
-    fantasy_data["position"] = fantasy_data["position"].replace({
+    fantasy_data["position"] = fantasy_data["position"].astype(str).replace({
         "WR": "Wide Receiver",
         "RB": "Running Back",
         "TE": "Tight End",